@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+import os
+import sys
+import json
+import time
+import random
+import struct
+import getopt
+import shutil
+import platform
+import tempfile
+import subprocess
+
+import ddrbin_tool as ddrbin_lib
+
+# 20K is a ddr bin, 64M is a merged loader or a raw flash image
+bench_size_list = ['20K', '256K', '4M', '64M']
+# (chip, header version), rk3528 has the skew_info after the index table
+bench_version_list = [('px30', 0), ('rk3328', 1), ('rk3568', 2), ('rk3568', 3), ('rk3588', 4),
+    ('rk3588', 5), ('rk3528', 5)]
+bench_phase_list = ['tag search', 'decode', 'dump', 'modify', 'write back']
+
+bench_param = {
+    'uart id': 2,
+    'uart baudrate': 1500000,
+    'sr_idle': 93,
+    'pd_idle': 13,
+    'ddr3_freq': 933,
+    'lp4_freq': 1560,
+    'lp4x_freq': 2112,
+    'phy_lp4_dq_vref_when_odten': 300,
+    'ddr3_dq_vref_when_odten': 520,
+    'ddr3_ca0_skew': 0x40,
+}
+
+# ms, the cumulative 'import ddrbin_tool' of python -X importtime without the cached bytecode
+cold_start_budget = 60
+
+bench_verinfo = b'DDR 0123456789 bench 24/09/03-10:42:57,fwver: v1.23\n'
+
+
+def gen_sdram_head(version, skew_en, rand):
+    """return the sdram header of a synthetic bin, 'start tag' is at offset 0"""
+    if version < 2:
+        words = [ddrbin_lib.start_tag, version, rand.getrandbits(32)]
+        words += [rand.getrandbits(32) for info in ddrbin_lib.sdram_head_info_v0]
+        return struct.pack('<{}I'.format(len(words)), *words)
+
+    index_list = ddrbin_lib.get_head_index_list(version)
+    head_info = ddrbin_lib.get_head_info_struct(version)
+    # the index table is u8 offset and u8 size of every struct
+    word = 2 + (len(index_list) * 2 + 3) // 4
+    index_table = []
+    words = {}
+    for index_name in index_list:
+        if index_name == 'skew_index':
+            if not skew_en:
+                index_table.append((0, 0))
+                continue
+            size = 1 + len(ddrbin_lib.rk3528_skew_words)
+            words[word] = 0x1
+            for i in range(1, size):
+                words[word + i] = rand.getrandbits(32)
+        else:
+            head_info_name = index_name[:-6] + '_info'
+            if head_info_name not in head_info:
+                index_table.append((0, 0))
+                continue
+            size = len(head_info[head_info_name])
+            for i in range(size):
+                words[word + i] = rand.getrandbits(32)
+        index_table.append((word, size))
+        word += size
+
+    head = bytearray(word * 4)
+    struct.pack_into('<II', head, 0, ddrbin_lib.start_tag, version)
+    for i, (offset, size) in enumerate(index_table):
+        head[8 + i * 2] = offset
+        head[9 + i * 2] = size
+    for offset, value in words.items():
+        struct.pack_into('<I', head, offset * 4, value)
+
+    return bytes(head)
+
+
+def gen_bench_bin(version, skew_en, size, seed=0):
+    """
+    A synthetic ddr bin of size bytes, the header is at 3/4 of the file like the
+    real bins, and some false 'DDR ' are put before the version information.
+    """
+    rand = random.Random(seed * 100 + version)
+    head = gen_sdram_head(version, skew_en, rand)
+    content = bytearray(rand.getrandbits(8 * size).to_bytes(size, 'little'))
+    # no false 'start tag' in the random data
+    content = bytearray(content.replace(struct.pack('<I', ddrbin_lib.start_tag), b'\0' * 4))
+    for i in range(1, 64):
+        offset = size * i // 128
+        content[offset : offset + 4] = b'DDR '
+
+    head_offset = (size * 3 // 4) & ~3
+    content[head_offset : head_offset + len(head)] = head
+    verinfo_offset = head_offset + len(head) + 64
+    content[verinfo_offset : verinfo_offset + len(bench_verinfo)] = bench_verinfo
+
+    return bytes(content[:size])
+
+
+def bench_time(func, repeat, setup=None):
+    """return [seconds of every run], setup() is not timed, it returns the argument of func"""
+    time_list = []
+    for i in range(repeat):
+        args = () if setup is None else (setup(),)
+        start_time = time.perf_counter()
+        func(*args)
+        time_list.append(time.perf_counter() - start_time)
+    return time_list
+
+
+def bench_one(chip, version, size, repeat, temp_dir):
+    content = gen_bench_bin(version, chip == 'rk3528', size)
+    ddrbin = ddrbin_lib.DdrBin(chip)
+    ddrbin.load(content)
+    if ddrbin.parse() != 0:
+        return None
+    for key, value in bench_param.items():
+        ddrbin.set(key, value)
+    bin_path = os.path.join(temp_dir, 'bench_v{}_{}.bin'.format(version, size))
+
+    def decode():
+        codec = ddrbin_lib.get_head_codec(content, ddrbin.tag_offset, version, ddrbin.chip)
+        codec.decode(codec.read_words(content, ddrbin.tag_offset))
+
+    # a patched bin has the new values, patch() of it again changes nothing,
+    # so modify and write back run on a new bin of the pristine content every time
+    def new_bin():
+        bench_bin = ddrbin_lib.DdrBin(chip)
+        bench_bin.load(content)
+        bench_bin.parse()
+        bench_bin.update_info = ddrbin.update_info
+        bench_bin.patch_plan = ddrbin.patch_plan
+        return bench_bin
+
+    def new_file_bin():
+        with open(bin_path, 'wb') as file:
+            file.write(content)
+        filebin = ddrbin_lib.DdrBin(chip)
+        filebin.open(bin_path)
+        filebin.parse()
+        filebin.update_info = ddrbin.update_info
+        filebin.patch_plan = ddrbin.patch_plan
+        return filebin
+
+    phase_func = {
+        'tag search': (lambda: ddrbin_lib.scan_ddrbin_header(content), None),
+        'decode': (decode, None),
+        'dump': (lambda: ddrbin.gen_param_text('txt'), None),
+        'modify': (lambda bench_bin: bench_bin.patch('bench'), new_bin),
+        'write back': (lambda filebin: filebin.save('bench'), new_file_bin),
+    }
+
+    result_list = []
+    for phase in bench_phase_list:
+        # the big images are slow to scan, run them less
+        phase_repeat = max(3, repeat * (1 << 20) // max(size, 1 << 20)) if phase == 'tag search' else repeat
+        func, setup = phase_func[phase]
+        time_list = bench_time(func, phase_repeat, setup)
+        time_list.sort()
+        result_list.append({
+            'chip': chip,
+            'version': version,
+            'size': size,
+            'phase': phase,
+            'repeat': phase_repeat,
+            'min_us': round(time_list[0] * 1e6, 2),
+            'median_us': round(time_list[len(time_list) // 2] * 1e6, 2),
+        })
+
+    if os.path.exists(bin_path):
+        os.remove(bin_path)
+    return result_list
+
+
+def bench_cold_start(repeat, temp_dir):
+    """
+    The import time of ddrbin_tool like it is run as a script, the bytecode
+    of a script is not cached, so the module is copied to temp_dir and imported
+    with -B, then it is compiled from the source every time.
+    return {'import_us', 'self_us', 'import_list': [(module, cumulative us)]}
+    """
+    tool_path = os.path.join(os.path.dirname(os.path.abspath(ddrbin_lib.__file__)), 'ddrbin_tool.py')
+    shutil.copy(tool_path, temp_dir)
+    import_list = []
+    for i in range(repeat):
+        result = subprocess.run([sys.executable, '-B', '-X', 'importtime', '-c', 'import ddrbin_tool'],
+            cwd=temp_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+        # import time: self [us] | cumulative | imported package
+        # the modules imported by a package are printed before it with 2 more spaces
+        child_list = []
+        for line in result.stderr.split('\n'):
+            item = line.split('|')
+            if len(item) != 3 or not item[0].startswith('import time:') or 'self' in item[0]:
+                continue
+            name = item[2].rstrip()
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            if depth == 1:
+                child_list.append((name.strip(), int(item[1])))
+            elif depth == 0:
+                if name.strip() == 'ddrbin_tool':
+                    import_list.append((int(item[1]), int(item[0].split(':')[1]), child_list))
+                    break
+                child_list = []
+
+    if len(import_list) == 0:
+        return None
+    import_list.sort(key=lambda import_info: import_info[0])
+    import_us, self_us, child_list = import_list[len(import_list) // 2]
+    child_list.sort(key=lambda child: -child[1])
+    return {
+        'import_us': import_us,
+        'self_us': self_us,
+        'import_list': child_list[:10],
+    }
+
+
+def print_compare(result_info, old_path):
+    try:
+        with open(old_path, 'r', encoding='utf-8') as file:
+            old_info = json.load(file)
+    except Exception:
+        print("The file {} read failed".format(old_path))
+        return -1
+
+    old_result = {(r['chip'], r['version'], r['size'], r['phase']): r for r in old_info['results']}
+    print("\ncompare with {} ({})".format(old_path, old_info.get('tool', '')))
+    print("{:<8} {:>2} {:>10}  {:<12} {:>12} {:>12} {:>7}".format('chip', 'v', 'size', 'phase',
+        'old(us)', 'new(us)', 'ratio'))
+    for r in result_info['results']:
+        old = old_result.get((r['chip'], r['version'], r['size'], r['phase']))
+        if old is None or old['median_us'] == 0:
+            continue
+        print("{:<8} {:>2} {:>10}  {:<12} {:>12.1f} {:>12.1f} {:>6.2f}x".format(r['chip'], r['version'],
+            r['size'], r['phase'], old['median_us'], r['median_us'], r['median_us'] / old['median_us']))
+
+    return 0
+
+
+def print_bench_help():
+    print(
+        "Benchmark of ddrbin_tool with synthetic ddr bins of every ddrbin version.\n"\
+        "usage: ./ddrbin_bench.py [OPTION]\n"\
+        "	-o FILE			Save the result to FILE, default: ddrbin_bench.json\n"\
+        "	--sizes=LIST		The bin sizes, default: 20K,256K,4M,64M\n"\
+        "	--versions=LIST		The ddrbin versions, default: 0,1,2,3,4,5\n"\
+        "	--repeat=N		Run every phase N times, default: 20\n"\
+        "	--compare=FILE		Compare with the result of an old run\n"\
+        "	--cold_start		Only check the cold start of ddrbin_tool\n"\
+        "	--cold_start_budget=MS	--cold_start fails if 'import ddrbin_tool' takes more than MS, default: 60\n"\
+        "The phases: tag search, decode, dump (-g), modify (in memory), write back (to file).\n"\
+    )
+
+
+def ddrbin_bench(argc, argv):
+    result_path = 'ddrbin_bench.json'
+    size_list = bench_size_list
+    version_filter = None
+    repeat = 20
+    compare_path = ''
+    cold_start_only = False
+    budget = cold_start_budget
+
+    try:
+        opts, args = getopt.gnu_getopt(argv[1:], 'o:h', ['sizes=', 'versions=', 'repeat=', 'compare=',
+            'cold_start', 'cold_start_budget='])
+        for opt, arg in opts:
+            if opt == '-o':
+                result_path = arg
+            elif opt == '--sizes':
+                size_list = arg.split(',')
+            elif opt == '--versions':
+                version_filter = [int(version) for version in arg.split(',')]
+            elif opt == '--repeat':
+                repeat = max(1, int(arg))
+            elif opt == '--compare':
+                compare_path = arg
+            elif opt == '--cold_start':
+                cold_start_only = True
+            elif opt == '--cold_start_budget':
+                budget = float(arg)
+            elif opt == '-h':
+                print_bench_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        print_bench_help()
+        return -1
+
+    result_info = {
+        'tool': ddrbin_lib.tool_version,
+        'python': sys.version.split(' ', 1)[0],
+        'platform': '{} {}'.format(platform.system(), platform.machine()),
+        'cold_start': None,
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cold_start = bench_cold_start(min(repeat, 10), temp_dir)
+    if cold_start is None:
+        print("run python -X importtime fail")
+        return -1
+    result_info['cold_start'] = cold_start
+    print("cold start: import ddrbin_tool {:.1f} ms (self {:.1f} ms), budget {} ms".format(
+        cold_start['import_us'] / 1000, cold_start['self_us'] / 1000, budget))
+    for name, cumulative in cold_start['import_list'][:5]:
+        print("	{:<24} {:>8.1f} ms".format(name, cumulative / 1000))
+    # the import time is noisy, only --cold_start fails on it, the full run records it and goes on
+    cold_start['budget_ms'] = budget
+    cold_start['over_budget'] = cold_start['import_us'] > budget * 1000
+    if cold_start['over_budget']:
+        print("cold start is over the budget")
+    if cold_start_only:
+        return -1 if cold_start['over_budget'] else 0
+
+    print("{:<8} {:>2} {:>10}  {:<12} {:>12} {:>12}".format('chip', 'v', 'size', 'phase',
+        'median(us)', 'min(us)'))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size_str in size_list:
+            size = ddrbin_lib.parse_size(size_str)
+            for chip, version in bench_version_list:
+                if version_filter is not None and version not in version_filter:
+                    continue
+                result_list = bench_one(chip, version, size, repeat, temp_dir)
+                if result_list is None:
+                    print("bench {} version {} size {} fail".format(chip, version, size))
+                    return -1
+                for r in result_list:
+                    print("{:<8} {:>2} {:>10}  {:<12} {:>12.1f} {:>12.1f}".format(r['chip'], r['version'],
+                        r['size'], r['phase'], r['median_us'], r['min_us']))
+                result_info['results'] += result_list
+
+    try:
+        with open(result_path, 'w', encoding='utf-8') as file:
+            json.dump(result_info, file, indent=1)
+    except Exception:
+        print("The file {} write failed".format(result_path))
+        return -1
+    print("save the result to {}".format(result_path))
+
+    if compare_path != '':
+        return print_compare(result_info, compare_path)
+
+    return 0
+
+
+if __name__ == '__main__':
+    # the exit code is used by the cold start check
+    if ddrbin_bench(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)
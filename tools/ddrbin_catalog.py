@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The catalog and query commands of ddrbin_tool, imported by them only, so the
+# other commands do not load it.
+import io
+import os
+import re
+import time
+import getopt
+import struct
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+
+catalog_db_default = 'ddrbin_catalog.db'
+# name op value of a query condition, like 'lp4x_freq>=2112' or 'uart id=2'
+catalog_cond_pattern = r'^\s*(.+?)\s*(>=|<=|!=|=|>|<)\s*(.+?)\s*$'
+
+
+def open_catalog(db_path):
+    """
+    Open the catalog, one row in bins for every file, the files which are not
+    ddr bins have version -1, and one row in fields for every (bin, field).
+    The catalog is emptied when the tool version is changed.
+    """
+    import sqlite3
+
+    db = sqlite3.connect(db_path)
+    db.executescript("""
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS bins (id INTEGER PRIMARY KEY, path TEXT UNIQUE, chip TEXT,
+            size INTEGER, mtime_ns INTEGER, sha256 TEXT, version INTEGER, tag_offset INTEGER,
+            verinfo TEXT);
+        CREATE TABLE IF NOT EXISTS fields (bin_id INTEGER, name TEXT, value INTEGER,
+            PRIMARY KEY (bin_id, name)) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS fields_name_value ON fields (name, value, bin_id);
+    """)
+    row = db.execute("SELECT value FROM meta WHERE key = 'tool'").fetchone()
+    if row is None or row[0] != ddrbin_lib.tool_version:
+        db.execute("DELETE FROM fields")
+        db.execute("DELETE FROM bins")
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('tool', ?)", (ddrbin_lib.tool_version,))
+        db.commit()
+    return db
+
+
+def catalog_bin(path):
+    """
+    return (sha256, chip, version, tag_offset, verinfo, [(field, value), ...]) of
+    the file, version is -1 if it is not a ddr bin.
+    """
+    import hashlib
+
+    chip = ddrbin_lib.guess_chip(path)
+    with ddrbin_lib.DdrBin(chip) as ddrbin, contextlib.redirect_stdout(io.StringIO()):
+        if os.path.getsize(path) == 0 or ddrbin.open(path, use_mmap=True) != 0:
+            return None
+        content = ddrbin.content
+        sha256 = hashlib.sha256(content).hexdigest()
+        # most files have no 'start tag', they are not scanned
+        if content.find(struct.pack('<I', ddrbin.start_tag)) < 0 or ddrbin.parse() != 0:
+            return sha256, chip, -1, -1, '', []
+
+        field_layout = ddrbin.codec.get_field_layout(ddrbin.read_out)
+        field_list = [(key, ddrbin.get(key)) for key in ddrbin_lib.field_key_list
+            if key in field_layout and 'reserved' not in key]
+        return sha256, chip, ddrbin.version, ddrbin.tag_offset, ddrbin.verinfo_full, field_list
+
+
+def ddrbin_catalog(argc, argv):
+    """./ddrbin_tool catalog [--db=FILE] PATH..."""
+    db_path = catalog_db_default
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'h', ['db='])
+    except getopt.GetoptError:
+        ddrbin_lib.print_help()
+        return -1
+    for opt, arg in opts:
+        if opt == '--db':
+            db_path = arg
+        elif opt == '-h':
+            ddrbin_lib.print_help()
+            return -1
+
+    if len(args) == 0:
+        print("The number of parameters error")
+        ddrbin_lib.print_help()
+        return -1
+    for path in args:
+        if os.path.exists(path) != True:
+            print("The file {} not exist".format(path))
+            return -1
+
+    start_time = time.perf_counter()
+    db = open_catalog(db_path)
+    file_list = ddrbin_lib.gen_catalog_file_list(args, os.path.abspath(db_path))
+    bin_info = {row[0]: row[1:] for row in db.execute("SELECT path, id, size, mtime_ns, sha256 FROM bins")}
+    update_num = 0
+    for path in file_list:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        old_info = bin_info.get(path)
+        # the file is not changed
+        if old_info is not None and old_info[1:3] == (stat.st_size, stat.st_mtime_ns):
+            continue
+
+        result = catalog_bin(path)
+        if result is None:
+            continue
+        sha256, chip, version, tag_offset, verinfo, field_list = result
+        if old_info is not None and old_info[3] == sha256:
+            # touched but the same data
+            db.execute("UPDATE bins SET size = ?, mtime_ns = ? WHERE id = ?", (stat.st_size, stat.st_mtime_ns,
+                old_info[0]))
+            continue
+
+        if old_info is not None:
+            db.execute("DELETE FROM fields WHERE bin_id = ?", (old_info[0],))
+            db.execute("DELETE FROM bins WHERE id = ?", (old_info[0],))
+        bin_id = db.execute("INSERT INTO bins (path, chip, size, mtime_ns, sha256, version, tag_offset, verinfo) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (path, chip, stat.st_size, stat.st_mtime_ns, sha256, version,
+            tag_offset, verinfo)).lastrowid
+        db.executemany("INSERT INTO fields VALUES (?, ?, ?)", [(bin_id, key, value) for key, value in field_list])
+        update_num += 1
+
+    # the files which are removed from the scanned paths
+    file_set = set(file_list)
+    root_list = [os.path.abspath(path) for path in args]
+    remove_list = [(bin_id,) for path, (bin_id, size, mtime_ns, sha256) in bin_info.items()
+        if path not in file_set and any(os.path.abspath(path) == root or
+        os.path.abspath(path).startswith(root.rstrip(os.sep) + os.sep) for root in root_list)]
+    db.executemany("DELETE FROM fields WHERE bin_id = ?", remove_list)
+    db.executemany("DELETE FROM bins WHERE id = ?", remove_list)
+    db.commit()
+
+    bin_num = db.execute("SELECT COUNT(*) FROM bins WHERE version >= 0").fetchone()[0]
+    db.close()
+    print("{} files, {} updated, {} removed, {} ddr bins in {}, {:.2f}s".format(len(file_list), update_num,
+        len(remove_list), bin_num, db_path, time.perf_counter() - start_time))
+    return 0
+
+
+def ddrbin_query(argc, argv):
+    """./ddrbin_tool query [--db=FILE] [CONDITION]..."""
+    db_path = catalog_db_default
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'h', ['db='])
+    except getopt.GetoptError:
+        ddrbin_lib.print_help()
+        return -1
+    for opt, arg in opts:
+        if opt == '--db':
+            db_path = arg
+        elif opt == '-h':
+            ddrbin_lib.print_help()
+            return -1
+
+    if os.path.exists(db_path) != True:
+        print("The catalog {} not exist, run: ./ddrbin_tool catalog PATH".format(db_path))
+        return -1
+
+    # chip, version and path are the columns of bins, path = is a glob pattern
+    sql = "SELECT id, path, chip, version FROM bins WHERE version >= 0"
+    sql_args = []
+    field_name_list = []
+    for cond in args:
+        match = re.match(catalog_cond_pattern, cond)
+        if match is None:
+            print("The condition {} is invalid".format(cond))
+            return -1
+        name, op, value = match.groups()
+        if name not in ('chip', 'path'):
+            try:
+                value = int(value, 0)
+            except ValueError:
+                print("The condition {} is invalid".format(cond))
+                return -1
+        if name == 'path':
+            if op not in ('=', '!='):
+                print("The condition {} is invalid".format(cond))
+                return -1
+            sql += " AND path {} ?".format('GLOB' if op == '=' else 'NOT GLOB')
+        elif name in ('chip', 'version'):
+            sql += " AND {} {} ?".format(name, op)
+        else:
+            if name not in ddrbin_lib.get_base_info_full():
+                print("The item {} is not exist".format(name))
+                return -1
+            sql += " AND id IN (SELECT bin_id FROM fields WHERE name = ? AND value {} ?)".format(op)
+            sql_args.append(name)
+            field_name_list.append(name)
+        sql_args.append(value)
+    sql += " ORDER BY path"
+
+    start_time = time.perf_counter()
+    db = open_catalog(db_path)
+    row_list = db.execute(sql, sql_args).fetchall()
+    for bin_id, path, chip, version in row_list:
+        field_str = ''
+        for name in dict.fromkeys(field_name_list):
+            value = db.execute("SELECT value FROM fields WHERE bin_id = ? AND name = ?", (bin_id, name)).fetchone()[0]
+            if ddrbin_lib.get_base_info_full()[name].num_base == 'hex':
+                value = hex(value)
+            field_str += ' {}={}'.format(name, value)
+        print("{} chip={} version={}{}".format(path, chip, version, field_str))
+    db.close()
+    print("{} bins, {:.1f} ms".format(len(row_list), (time.perf_counter() - start_time) * 1000))
+    return 0
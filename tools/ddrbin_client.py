@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The client of 'ddrbin_tool serve', it does not import ddrbin_tool, so it starts fast.
+import os
+import sys
+import json
+import time
+import shlex
+import base64
+import getopt
+import socket
+import threading
+
+# the environment of the client which is used by the commands
+client_env_list = ['SOURCE_DATE_EPOCH', 'DDRBIN_CACHE_DIR', 'DDRBIN_CACHE_MAX_SIZE']
+
+
+def get_socket_path(socket_path=''):
+    """the socket of 'ddrbin_tool serve', default: $DDRBIN_SOCKET or /tmp/ddrbin_tool-<uid>.sock"""
+    if socket_path != '':
+        return socket_path
+    return os.environ.get('DDRBIN_SOCKET') or '/tmp/ddrbin_tool-{}.sock'.format(os.getuid())
+
+
+def get_stdin_option(args):
+    """the bin file is '-', args are the arguments of ddrbin_tool without the name of the tool"""
+    if len(args) > 1 and args[0] not in ('batch', 'cache', 'compile', 'catalog', 'query', 'export',
+            'diff', 'scan', 'serve'):
+        bin_index = 3 if args[1] == '-g' else 2
+        return len(args) > bin_index and args[bin_index] == '-'
+    return False
+
+
+class DdrBinClient:
+    """one connection to the service, the requests are sent one by one on it"""
+
+    def __init__(self, socket_path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # the connect fails at once when the queue of the service is full
+        self.sock.setblocking(False)
+        try:
+            self.sock.connect(socket_path)
+        except BlockingIOError:
+            self.sock.close()
+            raise OSError("The service is busy")
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.setblocking(True)
+        self.reader = self.sock.makefile('rb')
+        self.request_id = 0
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(self, request):
+        """send a request and return the response, raise OSError if the service is stopped"""
+        self.request_id += 1
+        request['id'] = self.request_id
+        self.sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        line = self.reader.readline()
+        if line == b'':
+            raise OSError("The service closed the connection")
+        return json.loads(line)
+
+    def run(self, args, stdin=b''):
+        """run ddrbin_tool with args in the current directory of the client"""
+        request = {
+            'op': 'run',
+            'args': args,
+            'cwd': os.getcwd(),
+            'env': {key: os.environ[key] for key in client_env_list if key in os.environ},
+        }
+        if len(stdin) != 0:
+            request['stdin'] = base64.b64encode(stdin).decode('ascii')
+        return self.request(request)
+
+
+def print_response(response):
+    """print the messages and write the data to stdout like ddrbin_tool"""
+    message_out = sys.stderr if response.get('stdout') else sys.stdout
+    message_out.write(response.get('output', ''))
+    message_out.flush()
+    if 'data' in response:
+        sys.stdout.buffer.write(base64.b64decode(response['data']))
+        sys.stdout.buffer.flush()
+
+
+def read_manifest(manifest_path):
+    """the arguments of ddrbin_tool in every line, '#' starts a comment"""
+    try:
+        if manifest_path == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                lines = file.read().splitlines()
+        job_list = [shlex.split(line, comments=True) for line in lines]
+        return [args for args in job_list if len(args) != 0]
+    except (OSError, ValueError):
+        print("The file {} read failed".format(manifest_path))
+        return None
+
+
+def run_manifest(socket_path, job_list, jobs):
+    """run the jobs on jobs connections, return [(ret, last output line, ms), ...]"""
+    result_list = [None] * len(job_list)
+
+    def run_connection(index_list):
+        try:
+            with DdrBinClient(socket_path) as client:
+                for index in index_list:
+                    start_time = time.perf_counter()
+                    response = client.run(job_list[index])
+                    lines = [line for line in response.get('output', '').split('\n') if line.strip() != '']
+                    result_list[index] = (response['ret'], lines[-1] if lines else '',
+                        (time.perf_counter() - start_time) * 1000)
+        except (OSError, ValueError) as e:
+            for index in index_list:
+                if result_list[index] is None:
+                    result_list[index] = (-1, str(e), 0.0)
+
+    thread_list = [threading.Thread(target=run_connection, args=(list(range(i, len(job_list), jobs)),))
+        for i in range(min(jobs, len(job_list)))]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    return result_list
+
+
+def print_client_help():
+    print(
+        "Run ddrbin_tool by the service of './ddrbin_tool serve', the field tables are warm in the service.\n"\
+        "usage: ./ddrbin_client.py [--socket=PATH] ARG...\n"\
+        "	ARG... are the arguments of ddrbin_tool, the files are relative to the current directory.\n"\
+        "	like: ./ddrbin_client.py px30 -g - px30_ddr_333MHz_v1.15.bin\n"\
+        "       ./ddrbin_client.py [--socket=PATH] --batch FILE [-j CONNECTIONS]\n"\
+        "	Every line of FILE is the ARG... of one command, '-' reads them from stdin.\n"\
+        "       ./ddrbin_client.py [--socket=PATH] --metrics|--ping\n"\
+        "	--socket=PATH		The socket of the service, default: $DDRBIN_SOCKET or /tmp/ddrbin_tool-<uid>.sock\n"\
+    )
+
+
+def ddrbin_client(argc, argv):
+    socket_path = ''
+    manifest_path = ''
+    op = 'run'
+    jobs = 1
+
+    # the options of the client are before ARG..., the options after it are for ddrbin_tool
+    try:
+        opts, args = getopt.getopt(argv[1:], 'j:h', ['socket=', 'batch=', 'metrics', 'ping'])
+        for opt, arg in opts:
+            if opt == '--socket':
+                socket_path = arg
+            elif opt == '--batch':
+                manifest_path = arg
+                op = 'batch'
+            elif opt in ('--metrics', '--ping'):
+                op = opt[2:]
+            elif opt == '-j':
+                jobs = max(1, int(arg))
+            elif opt == '-h':
+                print_client_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        print_client_help()
+        return -1
+
+    socket_path = get_socket_path(socket_path)
+    if op == 'batch':
+        job_list = read_manifest(manifest_path)
+        if job_list is None:
+            return -1
+        start_time = time.perf_counter()
+        result_list = run_manifest(socket_path, job_list, jobs)
+        elapsed = time.perf_counter() - start_time
+
+        fail_num = 0
+        print("{:>4}  {:<4}  {:>8}  {}".format('job', 'ret', 'time(ms)', 'args / message'))
+        for i, (args, (ret, message, job_ms)) in enumerate(zip(job_list, result_list)):
+            if ret != 0:
+                fail_num += 1
+            print("{:>4}  {:<4}  {:>8.3f}  {}".format(i, 'ok' if ret == 0 else 'fail', job_ms, ' '.join(args)))
+            if ret != 0:
+                print("{:>4}  {:<4}  {:>8}  {}".format('', '', '', message))
+        print("{} jobs, {} fail, {} connections, {:.3f} ms per job, {:.2f}s".format(len(job_list), fail_num,
+            min(jobs, max(1, len(job_list))), elapsed * 1000 / max(1, len(job_list)), elapsed))
+        return 0 if fail_num == 0 else -1
+
+    if op == 'run' and len(args) == 0:
+        print_client_help()
+        return -1
+
+    try:
+        with DdrBinClient(socket_path) as client:
+            if op == 'run':
+                stdin = sys.stdin.buffer.read() if get_stdin_option(args) else b''
+                response = client.run(args, stdin)
+            else:
+                response = client.request({'op': op})
+    except (OSError, ValueError) as e:
+        print("The service on {} is not available: {}".format(socket_path, e), file=sys.stderr)
+        return -1
+
+    if op == 'metrics':
+        print(json.dumps(response['metrics'], indent=1))
+    elif op == 'ping':
+        print("version {}, pid {}".format(response['version'], response['pid']))
+    else:
+        print_response(response)
+    return 0 if response['ret'] == 0 else -1
+
+
+if __name__ == '__main__':
+    if ddrbin_client(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The diff command of ddrbin_tool, imported by it only, so the other commands do not load it.
+import glob
+import json
+import getopt
+
+import ddrbin_tool as ddrbin_lib
+
+
+def diff_ddrbin(base, ddrbin, base_layout):
+    """
+    return [(key, old, new), ...] of the fields which are different in the two
+    parsed bins, old or new is None if the field is not in that header.
+    The bins with the same header layout are compared by the words first, only
+    the fields in the different words are compared.
+    """
+    if base.codec is ddrbin.codec and base.codec.skew_valid(base.read_out) == ddrbin.codec.skew_valid(ddrbin.read_out):
+        if base.read_out == ddrbin.read_out:
+            return []
+        word_set = {word for word, (old, new) in enumerate(zip(base.read_out, ddrbin.read_out)) if old != new}
+        key_set = {key for key, (word, shift, mask) in base_layout.items() if word in word_set}
+        diff_list = [(key, base.get(key), ddrbin.get(key)) for key in ddrbin_lib.field_key_list if key in key_set]
+        return [(key, old, new) for key, old, new in diff_list if old != new]
+
+    diff_list = []
+    layout = ddrbin.codec.get_field_layout(ddrbin.read_out)
+    for index, key in enumerate(ddrbin_lib.field_key_list):
+        old = base.field_values[index] if key in base_layout else None
+        new = ddrbin.field_values[index] if key in layout else None
+        if old != new:
+            diff_list.append((key, old, new))
+    return diff_list
+
+
+def ddrbin_diff(argc, argv, data_out):
+    """./ddrbin_tool diff [--chip=CHIP] [--format=txt|json] BASELINE BIN..."""
+    chip = ''
+    diff_format = 'txt'
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'h', ['chip=', 'format='])
+    except getopt.GetoptError:
+        ddrbin_lib.print_help()
+        return -1
+    for opt, arg in opts:
+        if opt == '--chip':
+            chip = arg
+        elif opt == '--format':
+            if arg not in ('txt', 'json'):
+                print("The format {} is not support".format(arg))
+                return -1
+            diff_format = arg
+        elif opt == '-h':
+            ddrbin_lib.print_help()
+            return -1
+
+    path_list = []
+    for path in args:
+        path_list += sorted(glob.glob(path)) if glob.has_magic(path) else [path]
+    if len(path_list) < 2:
+        print("The number of parameters error")
+        ddrbin_lib.print_help()
+        return -1
+
+    def open_bin(path):
+        ddrbin = ddrbin_lib.DdrBin(chip or ddrbin_lib.guess_chip(path))
+        if ddrbin.open(path) != 0:
+            return None
+        if ddrbin.parse() != 0:
+            print("The file {} is not a ddr bin".format(path))
+            return None
+        return ddrbin
+
+    base = open_bin(path_list[0])
+    if base is None:
+        return -1
+    base_layout = base.codec.get_field_layout(base.read_out)
+    base_info = ddrbin_lib.get_base_info_full()
+
+    def value_str(key, value):
+        if value is None:
+            return '-'
+        return hex(value) if base_info[key].num_base == 'hex' else str(value)
+
+    result_list = []
+    diff_num = 0
+    for path in path_list[1:]:
+        ddrbin = open_bin(path)
+        if ddrbin is None:
+            return -1
+        diff_list = diff_ddrbin(base, ddrbin, base_layout)
+        result_list.append({
+            'file': path,
+            'version': [base.version, ddrbin.version],
+            'verinfo': [base.verinfo_full, ddrbin.verinfo_full],
+            'fields': [{'name': key, 'old': old, 'new': new} for key, old, new in diff_list
+                if 'reserved' not in key],
+        })
+        if len(result_list[-1]['fields']) != 0:
+            diff_num += 1
+
+    if diff_format == 'json':
+        diff_info = {'baseline': path_list[0], 'bins': result_list}
+        return ddrbin_lib.write_output('-', (json.dumps(diff_info, indent=1) + '\n').encode('utf-8'), data_out)
+
+    for result in result_list:
+        print("--- {}\n+++ {}".format(path_list[0], result['file']))
+        if result['version'][0] != result['version'][1]:
+            print("version: {} -> {}".format(*result['version']))
+        if result['verinfo'][0] != result['verinfo'][1]:
+            print("verinfo: {} -> {}".format(*result['verinfo']))
+        for field in result['fields']:
+            print("{}: {} -> {}".format(field['name'], value_str(field['name'], field['old']),
+                value_str(field['name'], field['new'])))
+    print("{} bins, {} different from {}".format(len(result_list), diff_num, path_list[0]))
+    return 0
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The export command of ddrbin_tool, imported by it only, so the other commands do not load it.
+import io
+import os
+import glob
+import time
+import getopt
+import struct
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+
+
+def read_export_bin(path):
+    """return (path, chip, version, tag_offset, codec, words) of a ddr bin, None if it is not"""
+    chip = ddrbin_lib.guess_chip(path)
+    with ddrbin_lib.DdrBin(chip) as ddrbin, contextlib.redirect_stdout(io.StringIO()):
+        if os.path.getsize(path) == 0 or ddrbin.open(path, use_mmap=True) != 0:
+            return None
+        if ddrbin.content.find(struct.pack('<I', ddrbin.start_tag)) < 0 or ddrbin.parse() != 0:
+            return None
+        return path, ddrbin.chip, ddrbin.version, ddrbin.tag_offset, ddrbin.codec, ddrbin.read_out
+
+
+def decode_export_table(bin_list, np):
+    """
+    Decode the bins to a numpy structured array, one row per bin and one u32
+    column per field of base_info_full, the fields not in a header are 0.
+    The bins with the same codec are decoded together, every field is one
+    shift and mask on a column of the header words of all these bins.
+    """
+    ddrbin_lib.get_base_info_full()
+    path_length = max([len(item[0]) for item in bin_list] + [1])
+    dtype = [('path', 'U{}'.format(path_length)), ('chip', 'U16'), ('version', 'i1'), ('tag_offset', 'i8')]
+    dtype += [(key, 'u4') for key in ddrbin_lib.field_key_list]
+    table = np.zeros(len(bin_list), dtype=dtype)
+    table['path'] = [item[0] for item in bin_list]
+    table['chip'] = [item[1] for item in bin_list]
+    table['version'] = [item[2] for item in bin_list]
+    table['tag_offset'] = [item[3] for item in bin_list]
+    table['start tag'] = ddrbin_lib.start_tag
+
+    codec_rows = {}
+    for row, item in enumerate(bin_list):
+        codec_rows.setdefault(item[4], []).append(row)
+    for codec, row_list in codec_rows.items():
+        rows = np.array(row_list)
+        words = np.array([bin_list[row][5] for row in row_list], dtype=np.uint32)
+        for index, word, shift, mask in codec.decode_list:
+            table[ddrbin_lib.field_key_list[index]][rows] = (words[:, word] >> shift) & mask
+        if codec.skew_word != 0 and codec.skew_decode_list:
+            # the rk3528 skew_info is only decoded when skew_sub_version is 0x1
+            skew_valid = (words[:, codec.skew_word] & 0xff) == 0x1
+            for index, word, shift, mask in codec.skew_decode_list:
+                table[ddrbin_lib.field_key_list[index]][rows[skew_valid]] = (words[skew_valid, word] >> shift) & mask
+
+    return table
+
+
+def write_export_csv(output_path, bin_list):
+    """the same columns as decode_export_table(), it does not need numpy"""
+    import csv
+
+    ddrbin_lib.get_base_info_full()
+    with open(output_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['path', 'chip', 'version', 'tag_offset'] + ddrbin_lib.field_key_list)
+        for path, chip, version, tag_offset, codec, words in bin_list:
+            writer.writerow([path, chip, version, tag_offset] + codec.decode(words).tolist())
+
+
+def ddrbin_export(argc, argv):
+    """./ddrbin_tool export [--format=npz|npy|csv] OUTPUT PATH..."""
+    export_format = ''
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'h', ['format='])
+    except getopt.GetoptError:
+        ddrbin_lib.print_help()
+        return -1
+    for opt, arg in opts:
+        if opt == '--format':
+            export_format = arg
+        elif opt == '-h':
+            ddrbin_lib.print_help()
+            return -1
+
+    if len(args) < 2:
+        print("The number of parameters error")
+        ddrbin_lib.print_help()
+        return -1
+    output_path = args[0]
+    if export_format == '':
+        export_format = os.path.splitext(output_path)[1][1:].lower() or 'npz'
+    if export_format not in ('npy', 'npz', 'csv'):
+        print("The format {} is not support".format(export_format))
+        return -1
+
+    np = None
+    if export_format != 'csv':
+        try:
+            import numpy as np
+        except ImportError:
+            print("The format {} needs numpy, please install it by: pip3 install numpy, or use --format=csv"
+                .format(export_format))
+            return -1
+
+    path_list = []
+    for path in args[1:]:
+        if glob.has_magic(path):
+            path_list += sorted(glob.glob(path))
+        elif os.path.exists(path):
+            path_list.append(path)
+        else:
+            print("The file {} not exist".format(path))
+            return -1
+
+    start_time = time.perf_counter()
+    bin_list = []
+    file_list = ddrbin_lib.gen_catalog_file_list(path_list, os.path.abspath(output_path))
+    for path in file_list:
+        item = read_export_bin(path)
+        if item is not None:
+            bin_list.append(item)
+    read_time = time.perf_counter() - start_time
+
+    try:
+        if export_format == 'csv':
+            write_export_csv(output_path, bin_list)
+        else:
+            table = decode_export_table(bin_list, np)
+            with open(output_path, 'wb') as file:
+                if export_format == 'npy':
+                    np.save(file, table)
+                else:
+                    # one array per column
+                    np.savez_compressed(file, **{name: table[name] for name in table.dtype.names})
+    except Exception:
+        print("The file {} write failed".format(output_path))
+        return -1
+
+    print("{} files, {} ddr bins, {} columns to {}, read {:.2f}s, decode {:.2f}s".format(len(file_list),
+        len(bin_list), 4 + len(ddrbin_lib.field_key_list), output_path, read_time,
+        time.perf_counter() - start_time - read_time))
+    return 0
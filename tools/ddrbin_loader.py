@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The loader image merged by boot_merger from RKBOOT/*.ini, like rk3588_spl_loader_v1.18.113.bin.
+# It is imported only when the bin is a loader, so function 1 and function 2 of a ddr bin do not load it.
+import struct
+from collections import namedtuple
+
+import ddrbin_tool as ddrbin_lib
+
+# struct rk_boot_header: tag, size, version, merger version, release time, chip type,
+# 471 num/offset/size, 472 num/offset/size, loader num/offset/size, sign flag, rc4 flag
+loader_head_format = '<4sHII7sIBIBBIBBIBBB'
+# struct rk_boot_entry: size, type, name (20 utf-16), data offset, data size, data delay
+loader_entry_format = '<BI40sIII'
+loader_entry_type = {1: '471', 2: '472', 4: 'loader'}
+LoaderEntry = namedtuple('LoaderEntry', ['type', 'name', 'entry_offset', 'offset', 'size'])
+
+# the 471 entries are scrambled as one rc4 stream, the loader entries by every 512 bytes
+rc4_key = bytes([124, 78, 3, 4, 85, 5, 9, 7, 45, 44, 123, 56, 23, 13, 23, 17])
+rc4_block_size = 512
+rc4_key_stream = bytearray()
+rc4_state = []
+
+# the crc32 at the end of the loader, msb first, no reflection, init 0, no final xor
+rkcrc32_poly = 0x04c10db7
+rkcrc32_table = []
+# rkcrc32_shift_table[n]: the gf(2) matrix which appends 2^n zero bytes to a crc
+rkcrc32_shift_table = []
+
+# the idblock head of the new loaders, it has the hash of the images behind it
+idb_head_magic = b'RKNS'
+idb_head_hash_size = 1536
+idb_image_offset = 120
+idb_image_size = 88
+idb_image_hash_offset = 24
+idb_hash_name = {1: 'sha256', 2: 'sha512'}
+
+
+def get_rc4_key_stream(length):
+    """return the first length bytes of the rc4 key stream of rc4_key, it is extended on demand"""
+    global rc4_key_stream
+
+    if len(rc4_state) == 0:
+        s_box = list(range(256))
+        j = 0
+        for i in range(256):
+            j = (j + s_box[i] + rc4_key[i % len(rc4_key)]) & 0xff
+            s_box[i], s_box[j] = s_box[j], s_box[i]
+        rc4_state.extend([s_box, 0, 0])
+
+    if len(rc4_key_stream) < length:
+        s_box, i, j = rc4_state
+        extend_length = max(length, len(rc4_key_stream) * 2) - len(rc4_key_stream)
+        key_stream = bytearray(extend_length)
+        for x in range(extend_length):
+            i = (i + 1) & 0xff
+            a = s_box[i]
+            j = (j + a) & 0xff
+            b = s_box[j]
+            s_box[i] = b
+            s_box[j] = a
+            key_stream[x] = s_box[(a + b) & 0xff]
+        rc4_state[1:] = [i, j]
+        rc4_key_stream += key_stream
+
+    return rc4_key_stream[:length]
+
+
+def rc4_xor(data, offset, mode):
+    """
+    Scramble or descramble data at offset of a loader entry.
+    mode: 'plain', 'stream' (one rc4 stream) or 'block' (rc4 restarts every 512 bytes).
+    """
+    length = len(data)
+    if mode == 'plain' or length == 0:
+        return bytes(data)
+    if mode == 'stream':
+        key = get_rc4_key_stream(offset + length)[offset:]
+    else:
+        start = offset % rc4_block_size
+        key = (get_rc4_key_stream(rc4_block_size) * ((start + length) // rc4_block_size + 1))[start : start + length]
+    value = int.from_bytes(data, byteorder='little') ^ int.from_bytes(key, byteorder='little')
+    return value.to_bytes(length, byteorder='little')
+
+
+def rkcrc32(data, crc=0):
+    if len(rkcrc32_table) == 0:
+        for i in range(256):
+            value = i << 24
+            for bit in range(8):
+                value = ((value << 1) ^ rkcrc32_poly if value & 0x80000000 else value << 1) & 0xffffffff
+            rkcrc32_table.append(value)
+
+    table = rkcrc32_table
+    for byte in data:
+        crc = ((crc << 8) & 0xffffffff) ^ table[(crc >> 24) ^ byte]
+    return crc
+
+
+def gf2_matrix_times(matrix, vector):
+    value = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            value ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return value
+
+
+def rkcrc32_shift(crc, length):
+    """return the crc after length zero bytes are appended to the data of crc"""
+    if len(rkcrc32_shift_table) == 0:
+        # one zero bit, then square it to one zero byte
+        matrix = [1 << (bit + 1) for bit in range(31)] + [rkcrc32_poly]
+        for i in range(3):
+            matrix = [gf2_matrix_times(matrix, row) for row in matrix]
+        rkcrc32_shift_table.append(matrix)
+
+    n = 0
+    while length:
+        if n == len(rkcrc32_shift_table):
+            matrix = rkcrc32_shift_table[-1]
+            rkcrc32_shift_table.append([gf2_matrix_times(matrix, row) for row in matrix])
+        if length & 1:
+            crc = gf2_matrix_times(rkcrc32_shift_table[n], crc)
+        length >>= 1
+        n += 1
+    return crc
+
+
+class LoaderImage:
+    """
+    The loader image merged by boot_merger, the ddr bin is in a 471 entry and in the
+    FlashData loader entry, they may be scrambled by rc4. The ddr entries are patched
+    in place, the crc32 at the end is fixed up by the changed bytes only, and the hash
+    of the images in the idblock heads are updated for the new loaders.
+    like:
+        loader = LoaderImage(content)
+        loader.parse()
+        for entry, mode, data in loader.find_ddr_entry_list():
+            ...
+            loader.write_entry(entry, mode, patch_list)
+        loader.fix_checksum()
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.head = None
+        self.entry_list = []
+        self.crc_offset = -1
+        # [(offset, old bytes, new bytes), ...] which are changed in the content
+        self.change_list = []
+        # {entry name: (old data, new data)} of the patched entries, descrambled
+        self.entry_data = {}
+
+    def parse(self):
+        content = self.content
+        try:
+            self.head = struct.unpack_from(loader_head_format, content, 0)
+            if self.head[0] not in ddrbin_lib.loader_tag_list:
+                return -1
+            for num, offset, size in (self.head[6:9], self.head[9:12], self.head[12:15]):
+                for i in range(num):
+                    entry_offset = offset + i * size
+                    entry_size, entry_type, name, data_offset, data_size, data_delay = struct.unpack_from(
+                        loader_entry_format, content, entry_offset)
+                    name = name.decode('utf-16-le', errors='replace').split('\0', 1)[0]
+                    if data_offset + data_size > len(content):
+                        raise struct.error(name)
+                    self.entry_list.append(LoaderEntry(entry_type, name, entry_offset, data_offset, data_size))
+        except struct.error:
+            print("read loader file fail")
+            return -1
+
+        # the crc32 follows the last entry
+        crc_offset = max([entry.offset + entry.size for entry in self.entry_list] + [struct.calcsize(loader_head_format)])
+        if crc_offset + 4 == len(content):
+            self.crc_offset = crc_offset
+        return 0
+
+    def is_signed(self):
+        return self.head[15] != 0
+
+    def read_entry(self, entry, mode='plain'):
+        return rc4_xor(self.content[entry.offset : entry.offset + entry.size], 0, mode)
+
+    def find_ddr_entry_list(self, tag=ddrbin_lib.start_tag):
+        """
+        return [(entry, mode, data), ...] of the 471 and loader entries which have the
+        'start tag' of a valid version, data is descrambled by mode.
+        """
+        tag_bytes = struct.pack('<I', tag)
+        ddr_entry_list = []
+        for entry in self.entry_list:
+            if entry.type == 1:
+                mode_list = ['plain', 'stream']
+            elif entry.type == 4:
+                mode_list = ['plain', 'block']
+            else:
+                continue
+            for mode in mode_list:
+                data = self.read_entry(entry, mode)
+                # only the 'start tag' is needed to find the ddr entry
+                position = data.find(tag_bytes)
+                while position >= 0 and int.from_bytes(data[position + 4 : position + 8],
+                        byteorder='little') > ddrbin_lib.version_max:
+                    position = data.find(tag_bytes, position + 1)
+                if position >= 0:
+                    ddr_entry_list.append((entry, mode, data))
+                    break
+
+        return ddr_entry_list
+
+    def write(self, offset, data):
+        old_data = bytes(self.content[offset : offset + len(data)])
+        if old_data != data:
+            self.content[offset : offset + len(data)] = data
+            self.change_list.append((offset, old_data, data))
+
+    def write_entry(self, entry, mode, patch_list, old_data=b'', new_data=b''):
+        """
+        write [(offset, bytes), ...] of the descrambled entry to the content.
+        old_data and new_data are the descrambled entry before and after the patch,
+        they are used to update the hash in the idblock heads.
+        """
+        for offset, data in patch_list:
+            self.write(entry.offset + offset, rc4_xor(data, offset, mode))
+        if len(patch_list) != 0 and old_data != new_data:
+            self.entry_data[entry.name] = (old_data, new_data)
+
+    def fix_idb_head(self):
+        """update the hash of the patched images and the hash of the idblock heads"""
+        import hashlib
+
+        if len(self.entry_data) == 0:
+            return 0
+        for entry in self.entry_list:
+            if entry.type not in (1, 4) or entry.size < idb_head_hash_size + 64:
+                continue
+            for mode in ('plain', 'block'):
+                head = bytearray(self.read_entry(entry, mode))
+                if head[:4] == idb_head_magic:
+                    break
+            else:
+                continue
+
+            hash_name = idb_hash_name.get(struct.unpack_from('<I', head, 12)[0] & 0xf)
+            if hash_name is None:
+                continue
+            hash_size = hashlib.new(hash_name).digest_size
+            head_hash_valid = (hashlib.new(hash_name, head[:idb_head_hash_size]).digest() ==
+                head[idb_head_hash_size : idb_head_hash_size + hash_size])
+            image_num = struct.unpack_from('<I', head, 8)[0] >> 16
+            digest_list = [(hashlib.new(hash_name, old_data).digest(), hashlib.new(hash_name, new_data).digest())
+                for old_data, new_data in self.entry_data.values()]
+            for i in range(min(image_num, 4)):
+                offset = idb_image_offset + i * idb_image_size + idb_image_hash_offset
+                for old_digest, new_digest in digest_list:
+                    if head[offset : offset + hash_size] == old_digest:
+                        head[offset : offset + hash_size] = new_digest
+                        break
+            if head_hash_valid:
+                head[idb_head_hash_size : idb_head_hash_size + hash_size] = hashlib.new(hash_name,
+                    head[:idb_head_hash_size]).digest()
+            self.write(entry.offset, rc4_xor(head, 0, mode))
+
+        return 0
+
+    def fix_checksum(self):
+        """
+        Update the hash of the idblock heads and the crc32 at the end of the loader.
+        The crc32 is linear, so it is fixed up by the crc32 of the changed bytes
+        shifted to the end instead of the crc32 of the whole loader.
+        """
+        if self.fix_idb_head() != 0:
+            return -1
+        if self.crc_offset < 0:
+            print("The crc32 of the loader is not found, it is not updated")
+            return 0
+
+        crc = int.from_bytes(self.content[self.crc_offset : self.crc_offset + 4], byteorder='little')
+        for offset, old_data, data in self.change_list:
+            if offset >= self.crc_offset:
+                continue
+            delta = (int.from_bytes(old_data, byteorder='big') ^ int.from_bytes(data, byteorder='big')).to_bytes(
+                len(data), byteorder='big')
+            crc ^= rkcrc32_shift(rkcrc32(delta), self.crc_offset - offset - len(data))
+        self.write(self.crc_offset, crc.to_bytes(4, byteorder='little'))
+        return 0
+
+
+def ddrbin_loader_run(ddrbin, filebin_path, tool_option, cache, cache_key):
+    """
+    function 1 and function 2 of a loader image. Every ddr entry of the loader is
+    patched with the same parameters, -g gets the config of the first one.
+    """
+    loader = LoaderImage(ddrbin.content)
+    with ddrbin_lib.tool_profiler.phase('loader'):
+        if loader.parse() != 0:
+            return -1
+        ddr_entry_list = loader.find_ddr_entry_list(ddrbin.start_tag)
+    if len(ddr_entry_list) == 0:
+        print("Find the 'start tag' in the loader entries failed")
+        return -1
+
+    # decided once for the loader, so all the copies of the ddr bin are patched the same,
+    # the file name like a plain bin, or the chip as a renamed loader has no chip in its name
+    version_old_hit = ddrbin.version_old_hit
+    if ddrbin.chip in ddrbin_lib.version_old_list:
+        version_old_hit = 1
+
+    entry_bin_list = []
+    for entry, mode, data in ddr_entry_list:
+        entry_bin = ddrbin_lib.DdrBin(ddrbin.chip)
+        entry_bin.load(data, ddrbin.path)
+        entry_bin.version_old_hit = version_old_hit
+        entry_bin.start_tag = ddrbin.start_tag
+        entry_bin.update_info = ddrbin.update_info
+        entry_bin.patch_plan = ddrbin.patch_plan
+        entry_bin.verinfo_stamp = ddrbin.verinfo_stamp
+        if entry_bin.parse() != 0:
+            return -1
+
+        print("{} entry {}, {}, version {}".format(loader_entry_type[entry.type], entry.name, mode,
+            entry_bin.version))
+        if entry_bin.verinfo_editable_offset != 0:
+            print("{}".format(entry_bin.verinfo_full))
+        entry_bin_list.append((entry, mode, data, entry_bin))
+
+    first_bin = entry_bin_list[0][3]
+    cache_info = {'version': first_bin.version, 'verinfo': first_bin.verinfo_full, 'new_verinfo': ''}
+    if tool_option['gen'] == 1:
+        with ddrbin_lib.tool_profiler.phase('dump'):
+            data = first_bin.gen_param_text(tool_option['format']).encode('utf-8')
+        with ddrbin_lib.tool_profiler.phase('write back'):
+            ret = ddrbin_lib.write_output(tool_option['filegen_path'], data, tool_option['data_out'])
+        if ret != 0:
+            print("generate info fail.")
+            return -1
+        print("generate info from bin file ok.")
+        if cache is not None:
+            cache.put(cache_key, cache_info, data)
+        return 0
+
+    ddrbin_lib.print_new_bin_config(ddrbin)
+
+    for entry, mode, data, entry_bin in entry_bin_list:
+        patch_list = entry_bin.patch(tool_option['verinfo_editable'])
+        loader.write_entry(entry, mode, patch_list, data, entry_bin.content)
+    with ddrbin_lib.tool_profiler.phase('checksum'):
+        loader.fix_checksum()
+    if loader.is_signed() and len(loader.change_list) != 0:
+        print("Warning: the loader is signed, the signature is invalid after modify")
+
+    try:
+        with ddrbin_lib.tool_profiler.phase('write back'):
+            if tool_option['output'] != '':
+                with memoryview(ddrbin.content) as data:
+                    ret = ddrbin_lib.write_output(tool_option['output'], data, tool_option['data_out'])
+            elif len(loader.change_list) == 0:
+                print("The bin is not changed, skip the write back")
+            elif ddrbin.file is not None:
+                ddrbin.content.flush()
+            else:
+                ddrbin_lib.write_file_atomic(ddrbin.path, ddrbin.content)
+    except Exception:
+        print("write bin file fail")
+        return -1
+    if tool_option['output'] != '' and ret != 0:
+        return -1
+    print("modify end\n")
+
+    for entry, mode, data, entry_bin in entry_bin_list:
+        if entry_bin.verinfo_editable_offset != 0:
+            cache_info['new_verinfo'] = cache_info['new_verinfo'] or entry_bin.get_verinfo()
+            print("new ddrbin version information of {}: {}".format(entry.name, entry_bin.get_verinfo()))
+
+    if cache is not None:
+        cache.put(cache_key, cache_info, ddrbin.content)
+
+    return 0
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# The scan command and --scan of ddrbin_tool for the large images, imported by them only,
+# so the other commands do not load it.
+import io
+import os
+import mmap
+import time
+import getopt
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+
+# the chunk of the image scanned by one job of --scan, a multiple of mmap.ALLOCATIONGRANULARITY
+scan_chunk_size = 64 << 20
+# the bytes after the chunk are scanned too, so a match across the boundary is not lost
+scan_overlap_size = 4096
+# the verinfo of a header is before its 'start tag' within this distance
+scan_verinfo_distance = 64 << 10
+# the sdram header is within this size after the 'start tag'
+scan_head_size = 4096
+
+
+def scan_image_chunk(job_args):
+    """
+    Scan one chunk of the image in the worker process, only the chunk and the overlap
+    are mapped. return (tag_list, verinfo_list) like scan_ddrbin_header() with the
+    offset in the image, the matches which start in the overlap are left to the next chunk.
+    """
+    path, start, size, tag = job_args
+    with open(path, 'rb') as file:
+        length = min(size + scan_overlap_size, os.fstat(file.fileno()).st_size - start)
+        with mmap.mmap(file.fileno(), length, access=mmap.ACCESS_READ, offset=start) as content:
+            tag_list, verinfo_list = ddrbin_lib.scan_ddrbin_header(content, tag)
+
+    tag_list = [(start + position, version) for position, version in tag_list if position < size]
+    verinfo_list = [(start + position, start + position_1) for position, position_1 in verinfo_list
+        if position < size]
+    return tag_list, verinfo_list
+
+
+def scan_image(path, tag=ddrbin_lib.start_tag, jobs=0, chunk_size=scan_chunk_size):
+    """
+    Find every 'start tag' and verinfo in a large image. The image is split to chunks
+    which are mapped and scanned on a process pool, so the memory is bounded by the
+    chunks in flight and not by the image size.
+    jobs: the number of processes, 0 is the number of CPUs.
+    return (tag_list, verinfo_list) like scan_ddrbin_header() for the whole image.
+    """
+    chunk_size = max(mmap.ALLOCATIONGRANULARITY, chunk_size // mmap.ALLOCATIONGRANULARITY *
+        mmap.ALLOCATIONGRANULARITY)
+    job_list = [(path, start, chunk_size, tag) for start in range(0, os.path.getsize(path), chunk_size)]
+    jobs = min(jobs or os.cpu_count() or 1, len(job_list))
+    if jobs <= 1:
+        result_list = [scan_image_chunk(job_args) for job_args in job_list]
+    else:
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            result_list = list(executor.map(scan_image_chunk, job_list))
+
+    tag_list = []
+    verinfo_list = []
+    for chunk_tag_list, chunk_verinfo_list in result_list:
+        tag_list += chunk_tag_list
+        verinfo_list += chunk_verinfo_list
+    return tag_list, verinfo_list
+
+
+def scan_image_header(ddrbin, tag_list, verinfo_list):
+    """
+    return [DdrBin, ...] of every valid header of the image in ddrbin.content.
+    The content of each DdrBin is a copy from the verinfo before the header, or
+    from the 'start tag' if there is none, to the end of the header. content_offset
+    is its offset in the image, so the patch list is moved by it to patch the image.
+    """
+    import bisect
+
+    content = ddrbin.content
+    verinfo_position_list = [position for position, position_1 in verinfo_list]
+    header_list = []
+    prev_end = 0
+    for tag_offset, version in tag_list:
+        if version > ddrbin_lib.version_max:
+            continue
+        # the nearest verinfo before the 'start tag' and after the previous header
+        start = tag_offset
+        index = bisect.bisect_left(verinfo_position_list, tag_offset) - 1
+        if index >= 0:
+            position = verinfo_position_list[index]
+            if position >= prev_end and tag_offset - position <= scan_verinfo_distance:
+                start = position
+        prev_end = tag_offset + 8
+
+        head_bin = ddrbin_lib.DdrBin(ddrbin.chip)
+        head_bin.load(content[start : tag_offset + scan_head_size], ddrbin.path)
+        head_bin.content_offset = start
+        head_bin.start_tag = ddrbin.start_tag
+        head_bin.update_info = ddrbin.update_info
+        head_bin.patch_plan = ddrbin.patch_plan
+        if head_bin.parse() != 0:
+            continue
+        header_list.append(head_bin)
+
+    return header_list
+
+
+def ddrbin_scan(argc, argv):
+    """./ddrbin_tool scan [-j JOBS] [--chunk_size=SIZE] [--chip=CHIP] IMAGE..."""
+    chip = ''
+    jobs = 0
+    chunk_size = scan_chunk_size
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'j:h', ['jobs=', 'chunk_size=', 'chip='])
+        for opt, arg in opts:
+            if opt in ('-j', '--jobs'):
+                jobs = max(1, int(arg))
+            elif opt == '--chunk_size':
+                chunk_size = ddrbin_lib.parse_size(arg)
+            elif opt == '--chip':
+                chip = arg
+            elif opt == '-h':
+                ddrbin_lib.print_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        ddrbin_lib.print_help()
+        return -1
+
+    if len(args) == 0:
+        print("The number of parameters error")
+        ddrbin_lib.print_help()
+        return -1
+
+    fail_num = 0
+    for path in args:
+        start_time = time.perf_counter()
+        with ddrbin_lib.DdrBin(chip or ddrbin_lib.guess_chip(path)) as ddrbin:
+            if os.path.isfile(path) != True or ddrbin.open(path, True) != 0:
+                print("The file {} read failed".format(path))
+                fail_num += 1
+                continue
+            tag_list, verinfo_list = scan_image(path, ddrbin.start_tag, jobs, chunk_size)
+            with contextlib.redirect_stdout(io.StringIO()):
+                header_list = scan_image_header(ddrbin, tag_list, verinfo_list)
+
+        print("{}:".format(path))
+        print("{:>12}  {:>7}  {}".format('offset', 'version', 'verinfo'))
+        for head_bin in header_list:
+            print("{:>12}  {:>7}  {}".format(hex(head_bin.content_offset + head_bin.tag_offset),
+                head_bin.version, head_bin.verinfo_full))
+        print("{} headers, {} 'start tag', {:.2f}s".format(len(header_list), len(tag_list),
+            time.perf_counter() - start_time))
+        if len(header_list) == 0:
+            fail_num += 1
+
+    return 0 if fail_num == 0 else -1
+
+
+def ddrbin_scan_run(ddrbin, filebin_path, tool_option):
+    """
+    function 1 and function 2 with --scan. The image is scanned by scan_image(), every
+    valid header, or the headers at --offset, is patched in place on the mapping,
+    -g gets the config of the first one.
+    """
+    if filebin_path == '-' or tool_option['output'] == '-':
+        print("The stdin and stdout are not supported by --scan")
+        return -1
+    if tool_option['gen'] != 1 and tool_option['output'] != '':
+        import shutil
+
+        # patch a copy of the image, it is not read to the memory
+        try:
+            shutil.copyfile(filebin_path, tool_option['output'])
+        except Exception:
+            print("The file {} write failed".format(tool_option['output']))
+            return -1
+        filebin_path = tool_option['output']
+
+    with ddrbin_lib.tool_profiler.phase('read bin'):
+        ret = ddrbin.open(filebin_path, True, tool_option['gen'] != 1)
+    if ret != 0:
+        return -1
+
+    with ddrbin_lib.tool_profiler.phase('tag search'):
+        tag_list, verinfo_list = scan_image(filebin_path, ddrbin.start_tag, tool_option['jobs'],
+            tool_option['chunk_size'] or scan_chunk_size)
+    if len(tool_option['offset']) != 0:
+        tag_list = [tag for tag in tag_list if tag[0] in tool_option['offset']]
+    header_list = scan_image_header(ddrbin, tag_list, verinfo_list)
+    if len(header_list) == 0:
+        print("Find the 'start tag' in the image failed")
+        return -1
+
+    for head_bin in header_list:
+        print("header 0x{:x}, version {}".format(head_bin.content_offset + head_bin.tag_offset,
+            head_bin.version))
+        if head_bin.verinfo_editable_offset != 0:
+            print("{}".format(head_bin.verinfo_full))
+
+    if tool_option['gen'] == 1:
+        with ddrbin_lib.tool_profiler.phase('dump'):
+            data = header_list[0].gen_param_text(tool_option['format']).encode('utf-8')
+        with ddrbin_lib.tool_profiler.phase('write back'):
+            ret = ddrbin_lib.write_output(tool_option['filegen_path'], data, tool_option['data_out'])
+        if ret != 0:
+            print("generate info fail.")
+            return -1
+        print("generate info from bin file ok.")
+        return 0
+
+    ddrbin_lib.print_new_bin_config(ddrbin)
+
+    patch_num = 0
+    for head_bin in header_list:
+        if tool_option['verinfo_editable'] == '':
+            if head_bin.set_verinfo_stamp(tool_option['verinfo_stamp']) != 0:
+                return -1
+        for offset, data in head_bin.patch(tool_option['verinfo_editable']):
+            offset += head_bin.content_offset
+            ddrbin.content[offset : offset + len(data)] = data
+            patch_num += 1
+
+    if patch_num == 0:
+        print("The bin is not changed, skip the write back")
+    else:
+        try:
+            with ddrbin_lib.tool_profiler.phase('write back'):
+                ddrbin.content.flush()
+        except Exception:
+            print("write bin file fail")
+            return -1
+    print("modify end\n")
+
+    for head_bin in header_list:
+        if head_bin.verinfo_editable_offset != 0:
+            print("new ddrbin version information of 0x{:x}: {}".format(head_bin.content_offset +
+                head_bin.tag_offset, head_bin.get_verinfo()))
+
+    return 0
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# function 10 of ddrbin_tool, the service of ddrbin_client.py on a unix socket,
+# imported only by the serve command, so the other commands do not load it.
+import io
+import os
+import sys
+import json
+import time
+import getopt
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+
+serve_latency_bucket = [0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+# the environment of the client which is used by the commands
+serve_env_list = ['SOURCE_DATE_EPOCH', 'DDRBIN_CACHE_DIR', 'DDRBIN_CACHE_MAX_SIZE']
+serve_rc4_warm_size = 256 << 10
+serve_param_cache_max = 256
+serve_path_lock_num = 64
+
+
+def get_serve_socket_path(socket_path=''):
+    """the socket of function 10, default: $DDRBIN_SOCKET or /tmp/ddrbin_tool-<uid>.sock"""
+    if socket_path != '':
+        return socket_path
+    return os.environ.get('DDRBIN_SOCKET') or '/tmp/ddrbin_tool-{}.sock'.format(os.getuid())
+
+
+def serve_warm_up():
+    """build the field tables, the rc4 key stream and the crc32 tables before the workers are forked"""
+    ddrbin_lib.get_field_text_spec()
+    for version in range(ddrbin_lib.version_max + 1):
+        for skew_en in (False, True):
+            ddrbin_lib.compile_field_spec(version, skew_en)
+    import ddrbin_loader as loader_lib
+
+    loader_lib.get_rc4_key_stream(serve_rc4_warm_size)
+    loader_lib.rkcrc32(b'\0')
+    loader_lib.rkcrc32_shift(0, 1)
+
+
+def get_serve_op(argv):
+    """the name of a request in the metrics: dump, patch or the subcommand"""
+    if len(argv) < 2:
+        return 'other'
+    if argv[1] in ddrbin_lib.subcmd_list:
+        return argv[1]
+    try:
+        opts, args = getopt.gnu_getopt(argv, ddrbin_lib.tool_short_option, ddrbin_lib.tool_long_option)
+    except getopt.GetoptError:
+        return 'other'
+    return 'dump' if '-g' in dict(opts) else 'patch'
+
+
+def has_watch_option(args):
+    """--watch runs forever, getopt takes its prefixes like --wat too, so the args are parsed like the tool"""
+    if len(args) == 0 or args[0] in ddrbin_lib.subcmd_list:
+        return False
+    try:
+        opts, args = getopt.gnu_getopt(args, ddrbin_lib.tool_short_option, ddrbin_lib.tool_long_option)
+    except getopt.GetoptError:
+        return False
+    return '--watch' in dict(opts)
+
+
+def run_serve_job(request):
+    """run one request of function 10 in the worker process, return (ret, messages, data, seconds)"""
+    argv = ['ddrbin_tool'] + request['args']
+    output = io.StringIO()
+    data_buffer = io.BytesIO()
+    data_out = io.TextIOWrapper(data_buffer, encoding='utf-8', write_through=True)
+    stdin = sys.stdin
+    if len(ddrbin_lib.param_file_cache) > serve_param_cache_max:
+        ddrbin_lib.param_file_cache.clear()
+
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            os.chdir(request['cwd'])
+            for key in serve_env_list:
+                if key in request['env']:
+                    os.environ[key] = request['env'][key]
+                else:
+                    os.environ.pop(key, None)
+            sys.stdin = io.TextIOWrapper(io.BytesIO(request['stdin']), encoding='utf-8')
+            ret = ddrbin_lib.ddrbin_tool_profile(len(argv), argv, data_out)
+        except Exception as e:
+            print("{}: {}".format(type(e).__name__, e))
+            ret = -1
+        finally:
+            sys.stdin = stdin
+    elapsed = time.perf_counter() - start_time
+
+    data_out.flush()
+    return ret, output.getvalue(), data_buffer.getvalue(), elapsed
+
+
+class DdrBinServer:
+    """
+    function 10: serve the requests of ddrbin_client.py on a unix socket.
+    The workers are forked after the tables are warm, every worker accepts a connection
+    from the socket and runs its requests in the worker, one by one. A request is one line of json:
+        {"id": ID, "op": "run", "args": [ARG...], "cwd": DIR, "env": {}, "stdin": BASE64}
+        {"id": ID, "op": "metrics"} or {"id": ID, "op": "ping"}
+    and the response is one line of json:
+        {"id": ID, "ret": 0, "output": MESSAGES, "stdout": false, "data": BASE64, "time_ms": MS}
+    The connections which wait for a worker are limited by the backlog of the socket, max_queue.
+    The metrics are in the shared memory of the workers, the patches of the same bin are run
+    one by one by the path locks.
+    """
+
+    def __init__(self, socket_path, jobs, max_queue):
+        import multiprocessing
+
+        self.socket_path = socket_path
+        self.jobs = jobs
+        self.max_queue = max_queue
+        self.start_time = time.time()
+        self.sock = None
+        self.worker_list = []
+        self.mp_context = multiprocessing.get_context('fork')
+        self.op_list = ['dump', 'patch'] + ddrbin_lib.subcmd_list + ['other', 'ping', 'metrics', 'error']
+        # count, fail, time_ms, max_ms and the histogram of every op
+        self.metric_size = 4 + len(serve_latency_bucket) + 1
+        self.metric_array = self.mp_context.Array('d', len(self.op_list) * self.metric_size)
+        # the connections and the requests which are served now
+        self.state_array = self.mp_context.Array('q', 2)
+        self.path_lock_list = [self.mp_context.Lock() for i in range(serve_path_lock_num)]
+
+    def add_state(self, index, value):
+        with self.state_array.get_lock():
+            self.state_array[index] += value
+
+    def add_metrics(self, op, ret, elapsed):
+        ms = elapsed * 1000
+        bucket_index = len(serve_latency_bucket)
+        for i, bucket in enumerate(serve_latency_bucket):
+            if ms <= bucket:
+                bucket_index = i
+                break
+        base = self.op_list.index(op) * self.metric_size
+        with self.metric_array.get_lock():
+            metric = self.metric_array
+            metric[base] += 1
+            metric[base + 1] += 1 if ret != 0 else 0
+            metric[base + 2] += ms
+            metric[base + 3] = max(metric[base + 3], ms)
+            metric[base + 4 + bucket_index] += 1
+
+    def get_metrics(self):
+        """the request counts and the latency histograms, the buckets are the upper bounds in ms"""
+        with self.metric_array.get_lock():
+            metric_list = list(self.metric_array)
+        op_metrics = {}
+        for i, op in enumerate(self.op_list):
+            metric = metric_list[i * self.metric_size : (i + 1) * self.metric_size]
+            if metric[0] == 0:
+                continue
+            op_metrics[op] = {
+                'count': int(metric[0]),
+                'fail': int(metric[1]),
+                'avg_ms': round(metric[2] / metric[0], 3),
+                'max_ms': round(metric[3], 3),
+                'histogram': {str(bucket): int(count) for bucket, count in
+                    zip(serve_latency_bucket + ['+inf'], metric[4:])},
+            }
+        return {
+            'version': ddrbin_lib.tool_version,
+            'uptime': round(time.time() - self.start_time, 3),
+            'workers': self.jobs,
+            'max_queue': self.max_queue,
+            'connections': self.state_array[0],
+            'in_flight': self.state_array[1],
+            'ops': op_metrics,
+        }
+
+    def get_path_lock(self, op, argv, cwd):
+        """the lock of the bin of a patch, the bins are hashed to serve_path_lock_num locks"""
+        if op != 'patch' or len(argv) < 4 or argv[3] == '-':
+            return contextlib.nullcontext()
+        path = os.path.realpath(os.path.join(cwd, argv[3]))
+        return self.path_lock_list[hash(path) % serve_path_lock_num]
+
+    def run_request(self, request):
+        """run a request of op 'run' in this worker, return (the op in the metrics, the response)"""
+        import base64
+
+        args = request.get('args')
+        cwd = request.get('cwd', '/')
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            return 'error', {'ret': -1, 'output': "The args of the request error\n"}
+        if len(args) != 0 and args[0] == 'serve':
+            return 'error', {'ret': -1, 'output': "The serve is not supported in the request\n"}
+        if has_watch_option(args):
+            return 'error', {'ret': -1, 'output': "The --watch is not supported in the request\n"}
+        argv = ['ddrbin_tool'] + args
+        op = get_serve_op(argv)
+        env = request.get('env', {})
+        job = {
+            'args': args,
+            'cwd': cwd,
+            'env': {key: str(env[key]) for key in serve_env_list if key in env},
+            'stdin': base64.b64decode(request.get('stdin', '')),
+        }
+
+        self.add_state(1, 1)
+        try:
+            with self.get_path_lock(op, argv, cwd):
+                ret, output, data, job_time = run_serve_job(job)
+        finally:
+            self.add_state(1, -1)
+
+        response = {'ret': ret, 'output': output, 'stdout': ddrbin_lib.get_stdout_option(argv),
+            'time_ms': round(job_time * 1000, 3)}
+        if len(data) != 0:
+            response['data'] = base64.b64encode(data).decode('ascii')
+        return op, response
+
+    def handle_request(self, line):
+        start_time = time.perf_counter()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError
+        except ValueError:
+            self.add_metrics('error', -1, time.perf_counter() - start_time)
+            return {'ret': -1, 'output': "The request is not a json object\n"}
+
+        op = request.get('op', 'run')
+        if op == 'ping':
+            response = {'ret': 0, 'version': ddrbin_lib.tool_version, 'pid': os.getpid()}
+        elif op == 'metrics':
+            response = {'ret': 0, 'metrics': self.get_metrics()}
+        elif op == 'run':
+            op, response = self.run_request(request)
+        else:
+            response = {'ret': -1, 'output': "The op {} is not supported\n".format(op)}
+            op = 'error'
+        if 'id' in request:
+            response['id'] = request['id']
+        self.add_metrics(op, response['ret'], time.perf_counter() - start_time)
+        return response
+
+    def handle_connection(self, conn):
+        self.add_state(0, 1)
+        try:
+            with conn, conn.makefile('rb') as reader:
+                for line in reader:
+                    if line.strip() == b'':
+                        continue
+                    response = self.handle_request(line)
+                    conn.sendall(json.dumps(response).encode('utf-8') + b'\n')
+        except OSError:
+            pass
+        finally:
+            self.add_state(0, -1)
+
+    def serve_worker(self):
+        """accept the connections in the worker until the server is stopped"""
+        import signal
+        import socket
+
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        server_pid = os.getppid()
+        self.sock.settimeout(1)
+        while os.getppid() == server_pid:
+            try:
+                conn, address = self.sock.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            self.handle_connection(conn)
+
+    def start_worker(self):
+        worker = self.mp_context.Process(target=self.serve_worker, daemon=True)
+        worker.start()
+        return worker
+
+    def serve_forever(self):
+        import socket
+        import multiprocessing.connection
+
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                print("The service is already running on {}".format(self.socket_path))
+                return -1
+            except OSError:
+                # the socket of a service which is not stopped normally
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            self.sock.bind(self.socket_path)
+        except OSError:
+            print("The socket {} bind failed".format(self.socket_path))
+            self.sock.close()
+            return -1
+        finally:
+            os.umask(umask)
+        self.sock.listen(self.max_queue)
+
+        try:
+            self.worker_list = [self.start_worker() for i in range(self.jobs)]
+            while True:
+                multiprocessing.connection.wait([worker.sentinel for worker in self.worker_list])
+                for i, worker in enumerate(self.worker_list):
+                    if not worker.is_alive():
+                        # the requests of the worker are failed, start a new one
+                        print("The worker {} exited with {}, start it again".format(worker.pid, worker.exitcode))
+                        sys.stdout.flush()
+                        time.sleep(0.1)
+                        self.worker_list[i] = self.start_worker()
+        except (KeyboardInterrupt, SystemExit):
+            print("stop the service on {}".format(self.socket_path))
+        finally:
+            for worker in self.worker_list:
+                worker.terminate()
+            for worker in self.worker_list:
+                worker.join()
+            self.sock.close()
+            os.unlink(self.socket_path)
+
+        return 0
+
+
+def ddrbin_serve(argc, argv):
+    """./ddrbin_tool serve [--socket=PATH] [-j JOBS] [--max_queue=N]"""
+    import signal
+
+    socket_path = ''
+    jobs = os.cpu_count() or 1
+    max_queue = 64
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'j:h', ['jobs=', 'socket=', 'max_queue='])
+        for opt, arg in opts:
+            if opt in ('-j', '--jobs'):
+                jobs = max(1, int(arg))
+            elif opt == '--socket':
+                socket_path = arg
+            elif opt == '--max_queue':
+                max_queue = max(1, int(arg))
+            elif opt == '-h':
+                ddrbin_lib.print_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        ddrbin_lib.print_help()
+        return -1
+
+    if len(args) != 0:
+        print("The number of parameters error")
+        ddrbin_lib.print_help()
+        return -1
+
+    start_time = time.perf_counter()
+    serve_warm_up()
+    server = DdrBinServer(get_serve_socket_path(socket_path), jobs, max_queue)
+    print("serve on {}, {} workers, max queue {}, warm up {:.1f} ms".format(server.socket_path, jobs,
+        max_queue, (time.perf_counter() - start_time) * 1000))
+    sys.stdout.flush()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    return server.serve_forever()
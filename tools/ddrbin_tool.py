@@ -5,18 +5,28 @@
 #
 
 import os
-import re
+import io
 import sys
-import copy
+import json
+import time
+import shlex
 import getopt
+import mmap
+import contextlib
 import platform
+import stat
 import struct
-from datetime import datetime
+from array import array
+from collections import namedtuple
+from datetime import datetime, timezone
 
+# the time of the module load, the field tables are built at import
+tool_load_time = time.perf_counter()
+
+tool_version = 'v1.21 20241211'
 version_max = 5
-update_key_list = []
+verinfo_editable_length = 17
 
-chip_info = 'null'
 chip_list = ['px30', 'px30s', 'px3se', 'px5', 'rk1808', 'rk2118', 'rk312x', 'rk3126', 'rk3128',
     'rk3128h', 'rk322x', 'rk3228a', 'rk3228b', 'rk3228h', 'rk322xh', 'rk3229', 'rk3308', 'rk3288',
     'rk3326', 'rk3326s', 'rk3328', 'rk3368', 'rk3399', 'rk3506', 'rk3528', 'rk356x', 'rk3562',
@@ -213,882 +223,1967 @@ sdram_head_info_v5 = {
 sdram_head_info_v0 = [[0xc, 0], [0x10, 0], [0x14, 0], [0x18, 0], [0x1c, 0], [0x20, 0], [0x24, 0]]
 
 # struct base_info_full
-base_info_full = {
-    'start tag': {'value': 0, 'num_base': 'hex', 'index': 'null', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 0, 'v0_info': [0x0, 0, 0xffffffff]},
-
-    'ddr2_freq': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0xc, 16, 0xffff]},
-    'lp2_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0xc, 0, 0xffff]},
-    'ddr3_freq': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0x10, 16, 0xffff]},
-    'lp3_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0x10, 0, 0xffff]},
-    'ddr4_freq': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0x14, 16, 0xffff]},
-    'lp4_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 0, 'v0_info': [0x14, 0, 0xffff]},
-    'lp4x_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp5_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq0_1', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'uart id': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'uart_info', 'shift': 28, 'mask': 0xf, 'version': 0, 'v0_info': [0x18, 28, 0xf]},
-    'uart iomux': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'uart_info', 'shift': 24, 'mask': 0xf, 'version': 0, 'v0_info': [0x18, 24, 0xf]},
-    'uart baudrate': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'uart_info', 'shift': 0, 'mask': 0xffffff, 'version': 0, 'v0_info': [0x18, 0, 0xffffff]},
-    'sr_idle': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'sr_pd_info', 'shift': 16, 'mask': 0xffff, 'version': 0, 'v0_info': [0x1c, 16, 0xffff]},
-    'pd_idle': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'sr_pd_info', 'shift': 0, 'mask': 0xffff, 'version': 0, 'v0_info': [0x1c, 0, 0xffff]},
-    'first scan channel': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'ch_info', 'shift': 28, 'mask': 0xf, 'version': 0, 'v0_info': [0x20, 28, 0xf]},
-    'channel mask': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'ch_info', 'shift': 24, 'mask': 0xf, 'version': 0, 'v0_info': [0x20, 24, 0xf]},
-    'stride type': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'ch_info', 'shift': 16, 'mask': 0xff, 'version': 0, 'v0_info': [0x20, 16, 0xff]},
-    'standby_idle': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'ch_info', 'shift': 0, 'mask': 0xffff, 'version': 0, 'v0_info': [0x20, 0, 0xffff]},
-    'ext_temp_ref': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 29, 'mask': 0x3, 'version': 0, 'v0_info': [0x24, 29, 0x3]},
-    'link_ecc_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 28, 'mask': 0x1, 'version': 2},
-    'per_bank_ref_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 27, 'mask': 0x1, 'version': 2},
-    'derate_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 26, 'mask': 0x1, 'version': 0, 'v0_info': [0x24, 26, 0x1]},
-    'auto_precharge_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 25, 'mask': 0x1, 'version': 2},
-    'res_space_remap_all': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 24, 'mask': 0x1, 'version': 2},
-    'res_space_remap_portion': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 20, 'mask': 0x1, 'version': 2},
-    'rd_vref_scan_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 21, 'mask': 0x1, 'version': 2},
-    'wr_vref_scan_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 22, 'mask': 0x1, 'version': 2},
-    'eye_2d_scan_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 23, 'mask': 0x1, 'version': 2},
-    'dis_train_print': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'ssmod_downspread': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 17, 'mask': 0x3, 'version': 0, 'v0_info': [0x24, 17, 0x3]},
-    'ssmod_div': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 9, 'mask': 0xff, 'version': 0, 'v0_info': [0x24, 9, 0xff]},
-    'ssmod_spread': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 1, 'mask': 0xff, 'version': 0, 'v0_info': [0x24, 1, 0xff]},
-    'ddr_2t': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 0, 'mask': 0x1, 'version': 0, 'v0_info': [0x24, 0, 0x1]},
-    'reserved_global_info_2t_bit31': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'info_2t', 'shift': 31, 'mask': 0x1, 'version': 2},
-    'pstore_base_addr': {'value': 0, 'num_base': 'hex', 'index': 'global_index', 'position': 'reserved_0', 'shift': 16, 'mask': 0xffff, 'version': 2},
-    'pstore_buf_size': {'value': 0, 'num_base': 'hex', 'index': 'global_index', 'position': 'reserved_0', 'shift': 12, 'mask': 0xf, 'version': 2},
-    'uboot_log_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 4, 'mask': 0x1, 'version': 2},
-    'atf_log_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 3, 'mask': 0x1, 'version': 2},
-    'optee_log_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 2, 'mask': 0x1, 'version': 2},
-    'spl_log_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 1, 'mask': 0x1, 'version': 2},
-    'tpl_log_en': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 0, 'mask': 0x1, 'version': 2},
-    'reserved_global_reserved_0_bit5_11': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_0', 'shift': 5, 'mask': 0x7f, 'version': 2},
-    'first_init_dram_type': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_1', 'shift': 5, 'mask': 0xf, 'version': 2},
-    'dfs_disable': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_1', 'shift': 4, 'mask': 0x1, 'version': 2},
-    'pageclose': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_1', 'shift': 3, 'mask': 0x1, 'version': 2},
-    'boot_fsp': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_1', 'shift': 0, 'mask': 0x7, 'version': 2},
-    'reserved_global_reserved_1_bit9_31': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_1', 'shift': 9, 'mask': 0x7fffff, 'version': 2},
-    'reserved_global_reserved_2_bit0_31': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_2', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'reserved_global_reserved_3_bit0_31': {'value': 0, 'num_base': 'dec', 'index': 'global_index', 'position': 'reserved_3', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-
-    'ddr2_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr2_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr2_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr2_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr2_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr2_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr2_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr2_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr2_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr2_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'ddr2_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_odt_pull_up_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'phy_ddr2_odt_pull_dn_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odt_info', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'reserved_ddr2_odt_info_bit20_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odt_info', 'shift': 20, 'mask': 0xfff, 'version': 2},
-    'phy_ddr2_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'ddr2_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr2_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr2_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr2_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr2_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr2_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr2_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr2_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 5},
-    'phy_ddr2_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr2_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr2_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr2_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr2_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 5},
-
-    'ddr3_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr3_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr3_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr3_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr3_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr3_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr3_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr3_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr3_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr3_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'ddr3_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_odt_pull_up_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'phy_ddr3_odt_pull_dn_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odt_info', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'reserved_ddr3_odt_info_bit20_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odt_info', 'shift': 20, 'mask': 0xfff, 'version': 2},
-    'phy_ddr3_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'ddr3_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr3_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr3_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr3_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr3_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr3_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr3_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr3_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 5},
-    'phy_ddr3_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr3_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr3_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr3_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr3_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 5},
-
-    'ddr4_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr4_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr4_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr4_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr4_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr4_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'ddr4_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr4_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr4_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr4_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'ddr4_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_odt_pull_up_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'phy_ddr4_odt_pull_dn_en': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odt_info', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'reserved_ddr4_odt_info_bit20_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odt_info', 'shift': 20, 'mask': 0xfff, 'version': 2},
-    'phy_ddr4_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'ddr4_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_ddr4_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr4_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_ddr4_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_ddr4_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr4_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr4_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr4_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 5},
-    'phy_ddr4_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'ddr4_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'ddr4_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_ddr4_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'ddr4_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 5},
-
-    'lp2_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp2_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp2_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp2_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp2_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp2_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp2_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp2_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp2_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp2_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp2_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp2_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp2_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp2_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'lp2_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp2_odt_pull_up_en': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'phy_lp2_odt_pull_dn_en': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odt_info', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'reserved_lp2_odt_info_bit20_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odt_info', 'shift': 20, 'mask': 0xfff, 'version': 2},
-    'phy_lp2_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp2_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp2_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp2_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp2_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp2_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp2_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp2_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp2_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp2_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'lp2_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'lp2_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_lp2_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 5},
-    'phy_lp2_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'lp2_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'lp2_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_lp2_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp2_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 5},
-
-    'lp3_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp3_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp3_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp3_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp3_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp3_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp3_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp3_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp3_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp3_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp3_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp3_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp3_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp3_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'lp3_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp3_odt_pull_up_en': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'phy_lp3_odt_pull_dn_en': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odt_info', 'shift': 19, 'mask': 0x1, 'version': 2},
-    'reserved_lp3_odt_info_bit20_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odt_info', 'shift': 20, 'mask': 0xfff, 'version': 2},
-    'phy_lp3_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp3_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp3_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp3_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp3_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp3_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp3_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp3_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp3_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp3_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'lp3_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'lp3_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_lp3_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 5},
-    'phy_lp3_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 5},
-    'lp3_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 5},
-    'lp3_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 5},
-    'reserved_lp3_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp3_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 5},
-
-    'lp4_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp4_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp4_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp4_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp4_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'lp4_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'lp4_ca_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 18, 'mask': 0xff, 'version': 2},
-    'lp4_drv_pu_cal_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 26, 'mask': 0x1, 'version': 2},
-    'lp4_drv_pu_cal_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 27, 'mask': 0x1, 'version': 2},
-    'phy_lp4_drv_pull_dn_en_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 28, 'mask': 0x1, 'version': 2},
-    'phy_lp4_drv_pull_dn_en_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 29, 'mask': 0x1, 'version': 2},
-    'reserved_lp4_odt_info_bit31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'odt_info', 'shift': 31, 'mask': 0x1, 'version': 2},
-    'phy_lp4_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'dq_odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp4_dq_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'dq_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4_dq_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'dq_odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp4_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp4_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4_ca_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ca_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4_ca_odten_freq_bit12_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'ca_odten_freq', 'shift': 12, 'mask': 0xfffff, 'version': 2},
-    'phy_lp4_cs_drv_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4_cs_drv_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'lp4_odte_ck': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 16, 'mask': 0x1, 'version': 2},
-    'lp4_odte_cs_en': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 17, 'mask': 0x1, 'version': 2},
-    'lp4_odtd_ca_en': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'reserved_lp4cs_drv_ca_odt_info_bit19_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'cs_drv_ca_odt_info', 'shift': 19, 'mask': 0x1fff, 'version': 2},
-    'phy_lp4_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp4_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp4_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp4_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 2},
-    'phy_lp4_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp4_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp4_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp4_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 2},
-
-    'ddr2_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_0', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'ddr3_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_0', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'ddr4_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_0', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'reservedbyte_map_0_bit8_15': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_0', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'lp2_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_1', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'lp3_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_1', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp4_bytes_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'reserved_byte_map_1_bit0_7': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'byte_map_1', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'lp3_dq0_7_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'lp3_dq0_7_map', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'lp2_dq0_7_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'lp2_dq0_7_map', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'ddr4_cs0_dq0_dq15_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'ddr4_dq_map_0', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'ddr4_cs0_dq16_dq31_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'ddr4_dq_map_1', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'ddr4_cs1_dq0_dq15_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'ddr4_dq_map_2', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-    'ddr4_cs1_dq16_dq31_map': {'value': 0, 'num_base': 'hex', 'index': 'dq_map_index', 'position': 'ddr4_dq_map_3', 'shift': 0, 'mask': 0xffffffff, 'version': 2},
-
-    'lp4x_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4x_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4x_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp4x_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4x_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4x_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp4x_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4x_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp4x_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp4x_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'lp4x_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'lp4x_ca_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 18, 'mask': 0xff, 'version': 2},
-    'lp4x_drv_pu_cal_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 26, 'mask': 0x1, 'version': 2},
-    'lp4x_drv_pu_cal_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 27, 'mask': 0x1, 'version': 2},
-    'phy_lp4x_drv_pull_dn_en_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 28, 'mask': 0x1, 'version': 2},
-    'phy_lp4x_drv_pull_dn_en_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 29, 'mask': 0x1, 'version': 2},
-    'reserved_lp4x_odt_info_bit31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'odt_info', 'shift': 31, 'mask': 0x1, 'version': 2},
-    'phy_lp4x_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'dq_odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp4x_dq_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'dq_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4x_dq_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'dq_odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp4x_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp4x_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp4x_ca_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ca_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp4x_ca_odten_freq_bit12_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'ca_odten_freq', 'shift': 12, 'mask': 0xfffff, 'version': 2},
-    'phy_lp4x_cs_drv_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp4x_cs_drv_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'lp4x_odte_ck': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 16, 'mask': 0x1, 'version': 2},
-    'lp4x_odte_cs_en': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 17, 'mask': 0x1, 'version': 2},
-    'lp4x_odtd_ca_en': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'reserved_lp4xcs_drv_ca_odt_info_bit19_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'cs_drv_ca_odt_info', 'shift': 19, 'mask': 0x1fff, 'version': 2},
-    'phy_lp4x_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp4x_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp4x_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp4x_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 2},
-    'phy_lp4x_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp4x_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp4x_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp4x_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp4x_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 2},
-
-    'lp5_f1_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq0_1', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp5_ddr_freq0_1_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq0_1', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp5_f2_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq2_3', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp5_f3_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq2_3', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp5_ddr_freq2_3_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq2_3', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp5_f4_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq4_5', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp5_f5_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq4_5', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'reserved_lp5_ddr_freq4_5_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ddr_freq4_5', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp5_ca_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp5_clk_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp5_dq_drv_when_odten_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp5_ca_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp5_clk_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'lp5_dq_drv_when_odtoff_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'drv_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 8, 'mask': 0x3ff, 'version': 2},
-    'lp5_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'lp5_ca_odt_ohm': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 18, 'mask': 0xff, 'version': 2},
-    'lp5_drv_pu_cal_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 26, 'mask': 0x1, 'version': 2},
-    'lp5_drv_pu_cal_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 27, 'mask': 0x1, 'version': 2},
-    'phy_lp5_drv_pull_dn_en_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 28, 'mask': 0x1, 'version': 2},
-    'phy_lp5_drv_pull_dn_en_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 29, 'mask': 0x1, 'version': 2},
-    'reserved_lp5_odt_info_bit31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'odt_info', 'shift': 31, 'mask': 0x1, 'version': 2},
-    'phy_lp5_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'dq_odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp5_dq_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'dq_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'reserved_lp5_dq_odten_freq_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'dq_odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_dq_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odten', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp5_ca_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odten', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp5_clk_sr_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odten', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp5_sr_when_odten_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odten', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_dq_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odtoff', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp5_ca_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odtoff', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'phy_lp5_clk_sr_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odtoff', 'shift': 16, 'mask': 0xff, 'version': 2},
-    'reserved_lp5_sr_when_odtoff_bit24_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'sr_when_odtoff', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'lp5_ca_odten_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ca_odten_freq', 'shift': 0, 'mask': 0xfff, 'version': 2},
-    'lp5_wck_odt_en_freq': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ca_odten_freq', 'shift': 12, 'mask': 0xfff, 'version': 2},
-    'lp5_wck_odt': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'ca_odten_freq', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'phy_lp5_cs_drv_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 0, 'mask': 0xff, 'version': 2},
-    'phy_lp5_cs_drv_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 8, 'mask': 0xff, 'version': 2},
-    'lp5_odte_ck': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 16, 'mask': 0x1, 'version': 2},
-    'lp5_odte_cs_en': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 17, 'mask': 0x1, 'version': 2},
-    'lp5_odtd_ca_en': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 18, 'mask': 0x1, 'version': 2},
-    'lp5_nt_odt': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 24, 'mask': 0xff, 'version': 2},
-    'reserved_lp5_cs_drv_ca_odt_info_bit19_23': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'cs_drv_ca_odt_info', 'shift': 19, 'mask': 0x1f, 'version': 2},
-    'phy_lp5_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odten', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp5_dq_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odten', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp5_ca_vref_when_odten': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odten', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp5_vref_when_odten_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odten', 'shift': 30, 'mask': 0x3, 'version': 2},
-    'phy_lp5_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odtoff', 'shift': 0, 'mask': 0x3ff, 'version': 2},
-    'lp5_dq_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odtoff', 'shift': 10, 'mask': 0x3ff, 'version': 2},
-    'lp5_ca_vref_when_odtoff': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odtoff', 'shift': 20, 'mask': 0x3ff, 'version': 2},
-    'reserved_lp5_vref_when_odtoff_bit30_31': {'value': 0, 'num_base': 'dec', 'index': 'lp5_index', 'position': 'vref_when_odtoff', 'shift': 30, 'mask': 0x3, 'version': 2},
-
-    'lp4_4x_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-    'lp4_4x_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp4_4x_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 3},
-
-    'lp5_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp5_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp5_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'ddr4_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr4_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr4_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'lp3_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp3_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp3_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'ddr3_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr3_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr3_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'lp2_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'lp2_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'lp2_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'ddr2_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr2_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr2_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'ddr5_ch_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'ch_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_ch_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'ch_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_bank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'bank_mask_0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_bank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'bank_mask_1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_bank_mask2': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'bank_mask_2', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_bank_mask3': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'bank_mask_3', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_rank_mask0': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'rank_mask0', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-    'ddr5_rank_mask1': {'value': 0, 'num_base': 'hex', 'index': 'ddr5_hash_index', 'position': 'rank_mask1', 'shift': 0, 'mask': 0xffffffff, 'version': 4},
-
-    'reserved_skew_ddr3_skew_freq_bit12_31': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_skew_freq', 'shift': 12, 'mask': 0xfffff, 'version': 4},
-    'ddr3_skew_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'skew_index', 'position': 'ddr3_skew_freq', 'shift': 0, 'mask': 0xfff, 'version': 4},
-    'ddr3_ca0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_2', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_ca1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_0', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ca2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_1', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ca3_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_1', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_ca4_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_1', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_ca5_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_2', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ca6_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_1', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ca7_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_2', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ca8_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_3', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_ca9_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_0', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ca10_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_3', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ca11_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_2', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_ca12_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_4', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ca13_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_0', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_ca14_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_0', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_ca15_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_5', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_ras_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_5', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_cas_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_7', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ba0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_5', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ba1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_3', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ba2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_4', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_we_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_6', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_cke0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_4', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_cke1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_5', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_ckn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_6', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr3_ckp_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_6', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_odt0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_3', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr3_odt1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_6', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_cs0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_7', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr3_cs1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_7', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr3_resetn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr3_ca_skew_7', 'shift': 8, 'mask': 0xff, 'version': 4},
-
-    'reserved_skew_ddr4_skew_freq_bit12_31': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_skew_freq', 'shift': 12, 'mask': 0xfffff, 'version': 4},
-    'ddr4_skew_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'skew_index', 'position': 'ddr4_skew_freq', 'shift': 0, 'mask': 0xfff, 'version': 4},
-    'ddr4_ca0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_0', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ca1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_0', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_ca2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_0', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_ca3_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_0', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_ca4_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_1', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ca5_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_1', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_ca6_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_1', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_ca7_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_1', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_ca8_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_2', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ca9_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_2', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_ca10_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_2', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_ca11_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_2', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_ca12_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_3', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ca13_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_3', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_ca14_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_3', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_ca15_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_3', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_ca16_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_4', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ca17_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_4', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_ba0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_4', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_ba1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_4', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_bg0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_5', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_bg1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_5', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_cke0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_5', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_cke1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_5', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_ckn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_6', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_ckp_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_6', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_odt0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_6', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_odt1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_6', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'ddr4_cs0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_7', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'ddr4_cs1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_7', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'ddr4_resetn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_7', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'ddr4_actn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'ddr4_ca_skew_7', 'shift': 0, 'mask': 0xff, 'version': 4},
-
-    'reserved_skew_lp3_skew_freq_bit12_31': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_skew_freq', 'shift': 12, 'mask': 0xfffff, 'version': 4},
-    'lp3_skew_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'skew_index', 'position': 'lp3_skew_freq', 'shift': 0, 'mask': 0xfff, 'version': 4},
-    'lp3_ca0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_3', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_ca1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_4', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_ca2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_2', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'lp3_ca3_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_3', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'lp3_ca4_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_3', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_ca5_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_1', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_ca6_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_2', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_ca7_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_2', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_ca8_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_5', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_ca9_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_7', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_cke0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_4', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'lp3_cke1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_5', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_ckn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_6', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_ckp_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_6', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'lp3_odt0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_6', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'lp3_odt1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_6', 'shift': 0, 'mask': 0xff, 'version': 4},
-    'lp3_odt2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_0', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_odt3_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_0', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'lp3_cs0_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_7', 'shift': 16, 'mask': 0xff, 'version': 4},
-    'lp3_cs1_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_7', 'shift': 24, 'mask': 0xff, 'version': 4},
-    'lp3_cs2_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_1', 'shift': 8, 'mask': 0xff, 'version': 4},
-    'lp3_cs3_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'lp3_ca_skew_3', 'shift': 8, 'mask': 0xff, 'version': 4},
-
-    'reserved_skew_lp4_skew_freq_bit12_31': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_skew_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca2_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca3_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca4_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca5_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_odt0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_odt1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cke0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cke1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ckn_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ckp_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cs0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cs1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca2_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca3_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca4_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ca5_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_odt0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_odt1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cke0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cke1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ckn_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_ckp_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cs0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_cs1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp4_resetn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-
-    'reserved_skew_lp5_skew_freq_bit12_31': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_skew_freq_mhz': {'value': 0, 'num_base': 'dec', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca2_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca3_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca4_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca5_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca6_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ckn_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ckp_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_cs0_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_cs1_a_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca2_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca3_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca4_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca5_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ca6_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ckn_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_ckp_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_cs0_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_cs1_b_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-    'lp5_resetn_skew': {'value': 0, 'num_base': 'hex', 'index': 'skew_index', 'position': 'null', 'shift': 0, 'mask': 0, 'version': 4},
-}
+# The fields are built to base_info_full by get_base_info_full() on the first use,
+# the table is a string so it is not compiled to ~630 dict literals on every run.
+# v0_info is 'offset shift mask' of the field in ddrbin version 0/1, it is empty if
+# the field is not supported by version 0/1.
+# key, num_base, index, position, shift, mask, version, v0_info
+base_info_table = '''
+start tag,                                hex, null,              null,               0,  0,          0, 0x0 0 0xffffffff
+
+ddr2_freq,                                dec, ddr2_index,        ddr_freq0_1,        0,  0xfff,      0, 0xc 16 0xffff
+lp2_freq,                                 dec, lp2_index,         ddr_freq0_1,        0,  0xfff,      0, 0xc 0 0xffff
+ddr3_freq,                                dec, ddr3_index,        ddr_freq0_1,        0,  0xfff,      0, 0x10 16 0xffff
+lp3_freq,                                 dec, lp3_index,         ddr_freq0_1,        0,  0xfff,      0, 0x10 0 0xffff
+ddr4_freq,                                dec, ddr4_index,        ddr_freq0_1,        0,  0xfff,      0, 0x14 16 0xffff
+lp4_freq,                                 dec, lp4_index,         ddr_freq0_1,        0,  0xfff,      0, 0x14 0 0xffff
+lp4x_freq,                                dec, lp4x_index,        ddr_freq0_1,        0,  0xfff,      2
+lp5_freq,                                 dec, lp5_index,         ddr_freq0_1,        0,  0xfff,      2
+uart id,                                  dec, global_index,      uart_info,          28, 0xf,        0, 0x18 28 0xf
+uart iomux,                               dec, global_index,      uart_info,          24, 0xf,        0, 0x18 24 0xf
+uart baudrate,                            dec, global_index,      uart_info,          0,  0xffffff,   0, 0x18 0 0xffffff
+sr_idle,                                  dec, global_index,      sr_pd_info,         16, 0xffff,     0, 0x1c 16 0xffff
+pd_idle,                                  dec, global_index,      sr_pd_info,         0,  0xffff,     0, 0x1c 0 0xffff
+first scan channel,                       dec, global_index,      ch_info,            28, 0xf,        0, 0x20 28 0xf
+channel mask,                             dec, global_index,      ch_info,            24, 0xf,        0, 0x20 24 0xf
+stride type,                              dec, global_index,      ch_info,            16, 0xff,       0, 0x20 16 0xff
+standby_idle,                             dec, global_index,      ch_info,            0,  0xffff,     0, 0x20 0 0xffff
+ext_temp_ref,                             dec, global_index,      info_2t,            29, 0x3,        0, 0x24 29 0x3
+link_ecc_en,                              dec, global_index,      info_2t,            28, 0x1,        2
+per_bank_ref_en,                          dec, global_index,      info_2t,            27, 0x1,        2
+derate_en,                                dec, global_index,      info_2t,            26, 0x1,        0, 0x24 26 0x1
+auto_precharge_en,                        dec, global_index,      info_2t,            25, 0x1,        2
+res_space_remap_all,                      dec, global_index,      info_2t,            24, 0x1,        2
+res_space_remap_portion,                  dec, global_index,      info_2t,            20, 0x1,        2
+rd_vref_scan_en,                          dec, global_index,      info_2t,            21, 0x1,        2
+wr_vref_scan_en,                          dec, global_index,      info_2t,            22, 0x1,        2
+eye_2d_scan_en,                           dec, global_index,      info_2t,            23, 0x1,        2
+dis_train_print,                          dec, global_index,      info_2t,            19, 0x1,        2
+ssmod_downspread,                         dec, global_index,      info_2t,            17, 0x3,        0, 0x24 17 0x3
+ssmod_div,                                dec, global_index,      info_2t,            9,  0xff,       0, 0x24 9 0xff
+ssmod_spread,                             dec, global_index,      info_2t,            1,  0xff,       0, 0x24 1 0xff
+ddr_2t,                                   dec, global_index,      info_2t,            0,  0x1,        0, 0x24 0 0x1
+reserved_global_info_2t_bit31,            dec, global_index,      info_2t,            31, 0x1,        2
+pstore_base_addr,                         hex, global_index,      reserved_0,         16, 0xffff,     2
+pstore_buf_size,                          hex, global_index,      reserved_0,         12, 0xf,        2
+uboot_log_en,                             dec, global_index,      reserved_0,         4,  0x1,        2
+atf_log_en,                               dec, global_index,      reserved_0,         3,  0x1,        2
+optee_log_en,                             dec, global_index,      reserved_0,         2,  0x1,        2
+spl_log_en,                               dec, global_index,      reserved_0,         1,  0x1,        2
+tpl_log_en,                               dec, global_index,      reserved_0,         0,  0x1,        2
+reserved_global_reserved_0_bit5_11,       dec, global_index,      reserved_0,         5,  0x7f,       2
+first_init_dram_type,                     dec, global_index,      reserved_1,         5,  0xf,        2
+dfs_disable,                              dec, global_index,      reserved_1,         4,  0x1,        2
+pageclose,                                dec, global_index,      reserved_1,         3,  0x1,        2
+boot_fsp,                                 dec, global_index,      reserved_1,         0,  0x7,        2
+reserved_global_reserved_1_bit9_31,       dec, global_index,      reserved_1,         9,  0x7fffff,   2
+reserved_global_reserved_2_bit0_31,       dec, global_index,      reserved_2,         0,  0xffffffff, 2
+reserved_global_reserved_3_bit0_31,       dec, global_index,      reserved_3,         0,  0xffffffff, 2
+
+ddr2_f1_freq_mhz,                         dec, ddr2_index,        ddr_freq0_1,        12, 0xfff,      2
+reserved_ddr2_ddr_freq0_1_bit24_31,       dec, ddr2_index,        ddr_freq0_1,        24, 0xff,       2
+ddr2_f2_freq_mhz,                         dec, ddr2_index,        ddr_freq2_3,        0,  0xfff,      2
+ddr2_f3_freq_mhz,                         dec, ddr2_index,        ddr_freq2_3,        12, 0xfff,      2
+reserved_ddr2_ddr_freq2_3_bit24_31,       dec, ddr2_index,        ddr_freq2_3,        24, 0xff,       2
+ddr2_f4_freq_mhz,                         dec, ddr2_index,        ddr_freq4_5,        0,  0xfff,      2
+ddr2_f5_freq_mhz,                         dec, ddr2_index,        ddr_freq4_5,        12, 0xfff,      2
+reserved_ddr2_ddr_freq4_5_bit24_31,       dec, ddr2_index,        ddr_freq4_5,        24, 0xff,       2
+phy_ddr2_dq_drv_when_odten_ohm,           dec, ddr2_index,        drv_when_odten,     0,  0xff,       2
+phy_ddr2_ca_drv_when_odten_ohm,           dec, ddr2_index,        drv_when_odten,     8,  0xff,       2
+phy_ddr2_clk_drv_when_odten_ohm,          dec, ddr2_index,        drv_when_odten,     16, 0xff,       2
+ddr2_dq_drv_when_odten_ohm,               dec, ddr2_index,        drv_when_odten,     24, 0xff,       2
+phy_ddr2_dq_drv_when_odtoff_ohm,          dec, ddr2_index,        drv_when_odtoff,    0,  0xff,       2
+phy_ddr2_ca_drv_when_odtoff_ohm,          dec, ddr2_index,        drv_when_odtoff,    8,  0xff,       2
+phy_ddr2_clk_drv_when_odtoff_ohm,         dec, ddr2_index,        drv_when_odtoff,    16, 0xff,       2
+ddr2_dq_drv_when_odtoff_ohm,              dec, ddr2_index,        drv_when_odtoff,    24, 0xff,       2
+phy_ddr2_odt_ohm,                         dec, ddr2_index,        odt_info,           8,  0x3ff,      2
+ddr2_odt_ohm,                             dec, ddr2_index,        odt_info,           0,  0xff,       2
+phy_ddr2_odt_pull_up_en,                  dec, ddr2_index,        odt_info,           18, 0x1,        2
+phy_ddr2_odt_pull_dn_en,                  dec, ddr2_index,        odt_info,           19, 0x1,        2
+reserved_ddr2_odt_info_bit20_31,          dec, ddr2_index,        odt_info,           20, 0xfff,      2
+phy_ddr2_odten_freq_mhz,                  dec, ddr2_index,        odten_freq,         12, 0xfff,      2
+ddr2_odten_freq_mhz,                      dec, ddr2_index,        odten_freq,         0,  0xfff,      2
+reserved_ddr2_odten_freq_bit24_31,        dec, ddr2_index,        odten_freq,         24, 0xff,       2
+phy_ddr2_dq_sr_when_odten,                dec, ddr2_index,        sr_when_odten,      0,  0xff,       2
+phy_ddr2_ca_sr_when_odten,                dec, ddr2_index,        sr_when_odten,      8,  0xff,       2
+phy_ddr2_clk_sr_when_odten,               dec, ddr2_index,        sr_when_odten,      16, 0xff,       2
+reserved_ddr2_sr_when_odten_bit24_31,     dec, ddr2_index,        sr_when_odten,      24, 0xff,       2
+phy_ddr2_dq_sr_when_odtoff,               dec, ddr2_index,        sr_when_odtoff,     0,  0xff,       2
+phy_ddr2_ca_sr_when_odtoff,               dec, ddr2_index,        sr_when_odtoff,     8,  0xff,       2
+phy_ddr2_clk_sr_when_odtoff,              dec, ddr2_index,        sr_when_odtoff,     16, 0xff,       2
+reserved_ddr2_sr_when_odtoff_bit24_31,    dec, ddr2_index,        sr_when_odtoff,     24, 0xff,       2
+phy_ddr2_dq_vref_when_odten,              dec, ddr2_index,        vref_when_odten,    0,  0x3ff,      5
+ddr2_dq_vref_when_odten,                  dec, ddr2_index,        vref_when_odten,    10, 0x3ff,      5
+ddr2_ca_vref_when_odten,                  dec, ddr2_index,        vref_when_odten,    20, 0x3ff,      5
+reserved_ddr2_vref_when_odten_bit30_31,   dec, ddr2_index,        vref_when_odten,    30, 0x3,        5
+phy_ddr2_dq_vref_when_odtoff,             dec, ddr2_index,        vref_when_odtoff,   0,  0x3ff,      5
+ddr2_dq_vref_when_odtoff,                 dec, ddr2_index,        vref_when_odtoff,   10, 0x3ff,      5
+ddr2_ca_vref_when_odtoff,                 dec, ddr2_index,        vref_when_odtoff,   20, 0x3ff,      5
+reserved_ddr2_vref_when_odtoff_bit30_31,  dec, ddr2_index,        vref_when_odtoff,   30, 0x3,        5
+
+ddr3_f1_freq_mhz,                         dec, ddr3_index,        ddr_freq0_1,        12, 0xfff,      2
+reserved_ddr3_ddr_freq0_1_bit24_31,       dec, ddr3_index,        ddr_freq0_1,        24, 0xff,       2
+ddr3_f2_freq_mhz,                         dec, ddr3_index,        ddr_freq2_3,        0,  0xfff,      2
+ddr3_f3_freq_mhz,                         dec, ddr3_index,        ddr_freq2_3,        12, 0xfff,      2
+reserved_ddr3_ddr_freq2_3_bit24_31,       dec, ddr3_index,        ddr_freq2_3,        24, 0xff,       2
+ddr3_f4_freq_mhz,                         dec, ddr3_index,        ddr_freq4_5,        0,  0xfff,      2
+ddr3_f5_freq_mhz,                         dec, ddr3_index,        ddr_freq4_5,        12, 0xfff,      2
+reserved_ddr3_ddr_freq4_5_bit24_31,       dec, ddr3_index,        ddr_freq4_5,        24, 0xff,       2
+phy_ddr3_dq_drv_when_odten_ohm,           dec, ddr3_index,        drv_when_odten,     0,  0xff,       2
+phy_ddr3_ca_drv_when_odten_ohm,           dec, ddr3_index,        drv_when_odten,     8,  0xff,       2
+phy_ddr3_clk_drv_when_odten_ohm,          dec, ddr3_index,        drv_when_odten,     16, 0xff,       2
+ddr3_dq_drv_when_odten_ohm,               dec, ddr3_index,        drv_when_odten,     24, 0xff,       2
+phy_ddr3_dq_drv_when_odtoff_ohm,          dec, ddr3_index,        drv_when_odtoff,    0,  0xff,       2
+phy_ddr3_ca_drv_when_odtoff_ohm,          dec, ddr3_index,        drv_when_odtoff,    8,  0xff,       2
+phy_ddr3_clk_drv_when_odtoff_ohm,         dec, ddr3_index,        drv_when_odtoff,    16, 0xff,       2
+ddr3_dq_drv_when_odtoff_ohm,              dec, ddr3_index,        drv_when_odtoff,    24, 0xff,       2
+phy_ddr3_odt_ohm,                         dec, ddr3_index,        odt_info,           8,  0x3ff,      2
+ddr3_odt_ohm,                             dec, ddr3_index,        odt_info,           0,  0xff,       2
+phy_ddr3_odt_pull_up_en,                  dec, ddr3_index,        odt_info,           18, 0x1,        2
+phy_ddr3_odt_pull_dn_en,                  dec, ddr3_index,        odt_info,           19, 0x1,        2
+reserved_ddr3_odt_info_bit20_31,          dec, ddr3_index,        odt_info,           20, 0xfff,      2
+phy_ddr3_odten_freq_mhz,                  dec, ddr3_index,        odten_freq,         12, 0xfff,      2
+ddr3_odten_freq_mhz,                      dec, ddr3_index,        odten_freq,         0,  0xfff,      2
+reserved_ddr3_odten_freq_bit24_31,        dec, ddr3_index,        odten_freq,         24, 0xff,       2
+phy_ddr3_dq_sr_when_odten,                dec, ddr3_index,        sr_when_odten,      0,  0xff,       2
+phy_ddr3_ca_sr_when_odten,                dec, ddr3_index,        sr_when_odten,      8,  0xff,       2
+phy_ddr3_clk_sr_when_odten,               dec, ddr3_index,        sr_when_odten,      16, 0xff,       2
+reserved_ddr3_sr_when_odten_bit24_31,     dec, ddr3_index,        sr_when_odten,      24, 0xff,       2
+phy_ddr3_dq_sr_when_odtoff,               dec, ddr3_index,        sr_when_odtoff,     0,  0xff,       2
+phy_ddr3_ca_sr_when_odtoff,               dec, ddr3_index,        sr_when_odtoff,     8,  0xff,       2
+phy_ddr3_clk_sr_when_odtoff,              dec, ddr3_index,        sr_when_odtoff,     16, 0xff,       2
+reserved_ddr3_sr_when_odtoff_bit24_31,    dec, ddr3_index,        sr_when_odtoff,     24, 0xff,       2
+phy_ddr3_dq_vref_when_odten,              dec, ddr3_index,        vref_when_odten,    0,  0x3ff,      5
+ddr3_dq_vref_when_odten,                  dec, ddr3_index,        vref_when_odten,    10, 0x3ff,      5
+ddr3_ca_vref_when_odten,                  dec, ddr3_index,        vref_when_odten,    20, 0x3ff,      5
+reserved_ddr3_vref_when_odten_bit30_31,   dec, ddr3_index,        vref_when_odten,    30, 0x3,        5
+phy_ddr3_dq_vref_when_odtoff,             dec, ddr3_index,        vref_when_odtoff,   0,  0x3ff,      5
+ddr3_dq_vref_when_odtoff,                 dec, ddr3_index,        vref_when_odtoff,   10, 0x3ff,      5
+ddr3_ca_vref_when_odtoff,                 dec, ddr3_index,        vref_when_odtoff,   20, 0x3ff,      5
+reserved_ddr3_vref_when_odtoff_bit30_31,  dec, ddr3_index,        vref_when_odtoff,   30, 0x3,        5
+
+ddr4_f1_freq_mhz,                         dec, ddr4_index,        ddr_freq0_1,        12, 0xfff,      2
+reserved_ddr4_ddr_freq0_1_bit24_31,       dec, ddr4_index,        ddr_freq0_1,        24, 0xff,       2
+ddr4_f2_freq_mhz,                         dec, ddr4_index,        ddr_freq2_3,        0,  0xfff,      2
+ddr4_f3_freq_mhz,                         dec, ddr4_index,        ddr_freq2_3,        12, 0xfff,      2
+reserved_ddr4_ddr_freq2_3_bit24_31,       dec, ddr4_index,        ddr_freq2_3,        24, 0xff,       2
+ddr4_f4_freq_mhz,                         dec, ddr4_index,        ddr_freq4_5,        0,  0xfff,      2
+ddr4_f5_freq_mhz,                         dec, ddr4_index,        ddr_freq4_5,        12, 0xfff,      2
+reserved_ddr4_ddr_freq4_5_bit24_31,       dec, ddr4_index,        ddr_freq4_5,        24, 0xff,       2
+phy_ddr4_dq_drv_when_odten_ohm,           dec, ddr4_index,        drv_when_odten,     0,  0xff,       2
+phy_ddr4_ca_drv_when_odten_ohm,           dec, ddr4_index,        drv_when_odten,     8,  0xff,       2
+phy_ddr4_clk_drv_when_odten_ohm,          dec, ddr4_index,        drv_when_odten,     16, 0xff,       2
+ddr4_dq_drv_when_odten_ohm,               dec, ddr4_index,        drv_when_odten,     24, 0xff,       2
+phy_ddr4_dq_drv_when_odtoff_ohm,          dec, ddr4_index,        drv_when_odtoff,    0,  0xff,       2
+phy_ddr4_ca_drv_when_odtoff_ohm,          dec, ddr4_index,        drv_when_odtoff,    8,  0xff,       2
+phy_ddr4_clk_drv_when_odtoff_ohm,         dec, ddr4_index,        drv_when_odtoff,    16, 0xff,       2
+ddr4_dq_drv_when_odtoff_ohm,              dec, ddr4_index,        drv_when_odtoff,    24, 0xff,       2
+phy_ddr4_odt_ohm,                         dec, ddr4_index,        odt_info,           8,  0x3ff,      2
+ddr4_odt_ohm,                             dec, ddr4_index,        odt_info,           0,  0xff,       2
+phy_ddr4_odt_pull_up_en,                  dec, ddr4_index,        odt_info,           18, 0x1,        2
+phy_ddr4_odt_pull_dn_en,                  dec, ddr4_index,        odt_info,           19, 0x1,        2
+reserved_ddr4_odt_info_bit20_31,          dec, ddr4_index,        odt_info,           20, 0xfff,      2
+phy_ddr4_odten_freq_mhz,                  dec, ddr4_index,        odten_freq,         12, 0xfff,      2
+ddr4_odten_freq_mhz,                      dec, ddr4_index,        odten_freq,         0,  0xfff,      2
+reserved_ddr4_odten_freq_bit24_31,        dec, ddr4_index,        odten_freq,         24, 0xff,       2
+phy_ddr4_dq_sr_when_odten,                dec, ddr4_index,        sr_when_odten,      0,  0xff,       2
+phy_ddr4_ca_sr_when_odten,                dec, ddr4_index,        sr_when_odten,      8,  0xff,       2
+phy_ddr4_clk_sr_when_odten,               dec, ddr4_index,        sr_when_odten,      16, 0xff,       2
+reserved_ddr4_sr_when_odten_bit24_31,     dec, ddr4_index,        sr_when_odten,      24, 0xff,       2
+phy_ddr4_dq_sr_when_odtoff,               dec, ddr4_index,        sr_when_odtoff,     0,  0xff,       2
+phy_ddr4_ca_sr_when_odtoff,               dec, ddr4_index,        sr_when_odtoff,     8,  0xff,       2
+phy_ddr4_clk_sr_when_odtoff,              dec, ddr4_index,        sr_when_odtoff,     16, 0xff,       2
+reserved_ddr4_sr_when_odtoff_bit24_31,    dec, ddr4_index,        sr_when_odtoff,     24, 0xff,       2
+phy_ddr4_dq_vref_when_odten,              dec, ddr4_index,        vref_when_odten,    0,  0x3ff,      5
+ddr4_dq_vref_when_odten,                  dec, ddr4_index,        vref_when_odten,    10, 0x3ff,      5
+ddr4_ca_vref_when_odten,                  dec, ddr4_index,        vref_when_odten,    20, 0x3ff,      5
+reserved_ddr4_vref_when_odten_bit30_31,   dec, ddr4_index,        vref_when_odten,    30, 0x3,        5
+phy_ddr4_dq_vref_when_odtoff,             dec, ddr4_index,        vref_when_odtoff,   0,  0x3ff,      5
+ddr4_dq_vref_when_odtoff,                 dec, ddr4_index,        vref_when_odtoff,   10, 0x3ff,      5
+ddr4_ca_vref_when_odtoff,                 dec, ddr4_index,        vref_when_odtoff,   20, 0x3ff,      5
+reserved_ddr4_vref_when_odtoff_bit30_31,  dec, ddr4_index,        vref_when_odtoff,   30, 0x3,        5
+
+lp2_f1_freq_mhz,                          dec, lp2_index,         ddr_freq0_1,        12, 0xfff,      2
+reserved_lp2_ddr_freq0_1_bit24_31,        dec, lp2_index,         ddr_freq0_1,        24, 0xff,       2
+lp2_f2_freq_mhz,                          dec, lp2_index,         ddr_freq2_3,        0,  0xfff,      2
+lp2_f3_freq_mhz,                          dec, lp2_index,         ddr_freq2_3,        12, 0xfff,      2
+reserved_lp2_ddr_freq2_3_bit24_31,        dec, lp2_index,         ddr_freq2_3,        24, 0xff,       2
+lp2_f4_freq_mhz,                          dec, lp2_index,         ddr_freq4_5,        0,  0xfff,      2
+lp2_f5_freq_mhz,                          dec, lp2_index,         ddr_freq4_5,        12, 0xfff,      2
+reserved_lp2_ddr_freq4_5_bit24_31,        dec, lp2_index,         ddr_freq4_5,        24, 0xff,       2
+phy_lp2_dq_drv_when_odten_ohm,            dec, lp2_index,         drv_when_odten,     0,  0xff,       2
+phy_lp2_ca_drv_when_odten_ohm,            dec, lp2_index,         drv_when_odten,     8,  0xff,       2
+phy_lp2_clk_drv_when_odten_ohm,           dec, lp2_index,         drv_when_odten,     16, 0xff,       2
+lp2_dq_drv_when_odten_ohm,                dec, lp2_index,         drv_when_odten,     24, 0xff,       2
+phy_lp2_dq_drv_when_odtoff_ohm,           dec, lp2_index,         drv_when_odtoff,    0,  0xff,       2
+phy_lp2_ca_drv_when_odtoff_ohm,           dec, lp2_index,         drv_when_odtoff,    8,  0xff,       2
+phy_lp2_clk_drv_when_odtoff_ohm,          dec, lp2_index,         drv_when_odtoff,    16, 0xff,       2
+lp2_dq_drv_when_odtoff_ohm,               dec, lp2_index,         drv_when_odtoff,    24, 0xff,       2
+phy_lp2_odt_ohm,                          dec, lp2_index,         odt_info,           8,  0x3ff,      2
+lp2_odt_ohm,                              dec, lp2_index,         odt_info,           0,  0xff,       2
+phy_lp2_odt_pull_up_en,                   dec, lp2_index,         odt_info,           18, 0x1,        2
+phy_lp2_odt_pull_dn_en,                   dec, lp2_index,         odt_info,           19, 0x1,        2
+reserved_lp2_odt_info_bit20_31,           dec, lp2_index,         odt_info,           20, 0xfff,      2
+phy_lp2_odten_freq_mhz,                   dec, lp2_index,         odten_freq,         12, 0xfff,      2
+lp2_odten_freq_mhz,                       dec, lp2_index,         odten_freq,         0,  0xfff,      2
+reserved_lp2_odten_freq_bit24_31,         dec, lp2_index,         odten_freq,         24, 0xff,       2
+phy_lp2_dq_sr_when_odten,                 dec, lp2_index,         sr_when_odten,      0,  0xff,       2
+phy_lp2_ca_sr_when_odten,                 dec, lp2_index,         sr_when_odten,      8,  0xff,       2
+phy_lp2_clk_sr_when_odten,                dec, lp2_index,         sr_when_odten,      16, 0xff,       2
+reserved_lp2_sr_when_odten_bit24_31,      dec, lp2_index,         sr_when_odten,      24, 0xff,       2
+phy_lp2_dq_sr_when_odtoff,                dec, lp2_index,         sr_when_odtoff,     0,  0xff,       2
+phy_lp2_ca_sr_when_odtoff,                dec, lp2_index,         sr_when_odtoff,     8,  0xff,       2
+phy_lp2_clk_sr_when_odtoff,               dec, lp2_index,         sr_when_odtoff,     16, 0xff,       2
+reserved_lp2_sr_when_odtoff_bit24_31,     dec, lp2_index,         sr_when_odtoff,     24, 0xff,       2
+phy_lp2_dq_vref_when_odten,               dec, lp2_index,         vref_when_odten,    0,  0x3ff,      5
+lp2_dq_vref_when_odten,                   dec, lp2_index,         vref_when_odten,    10, 0x3ff,      5
+lp2_ca_vref_when_odten,                   dec, lp2_index,         vref_when_odten,    20, 0x3ff,      5
+reserved_lp2_vref_when_odten_bit30_31,    dec, lp2_index,         vref_when_odten,    30, 0x3,        5
+phy_lp2_dq_vref_when_odtoff,              dec, lp2_index,         vref_when_odtoff,   0,  0x3ff,      5
+lp2_dq_vref_when_odtoff,                  dec, lp2_index,         vref_when_odtoff,   10, 0x3ff,      5
+lp2_ca_vref_when_odtoff,                  dec, lp2_index,         vref_when_odtoff,   20, 0x3ff,      5
+reserved_lp2_vref_when_odtoff_bit30_31,   dec, lp2_index,         vref_when_odtoff,   30, 0x3,        5
+
+lp3_f1_freq_mhz,                          dec, lp3_index,         ddr_freq0_1,        12, 0xfff,      2
+reserved_lp3_ddr_freq0_1_bit24_31,        dec, lp3_index,         ddr_freq0_1,        24, 0xff,       2
+lp3_f2_freq_mhz,                          dec, lp3_index,         ddr_freq2_3,        0,  0xfff,      2
+lp3_f3_freq_mhz,                          dec, lp3_index,         ddr_freq2_3,        12, 0xfff,      2
+reserved_lp3_ddr_freq2_3_bit24_31,        dec, lp3_index,         ddr_freq2_3,        24, 0xff,       2
+lp3_f4_freq_mhz,                          dec, lp3_index,         ddr_freq4_5,        0,  0xfff,      2
+lp3_f5_freq_mhz,                          dec, lp3_index,         ddr_freq4_5,        12, 0xfff,      2
+reserved_lp3_ddr_freq4_5_bit24_31,        dec, lp3_index,         ddr_freq4_5,        24, 0xff,       2
+phy_lp3_dq_drv_when_odten_ohm,            dec, lp3_index,         drv_when_odten,     0,  0xff,       2
+phy_lp3_ca_drv_when_odten_ohm,            dec, lp3_index,         drv_when_odten,     8,  0xff,       2
+phy_lp3_clk_drv_when_odten_ohm,           dec, lp3_index,         drv_when_odten,     16, 0xff,       2
+lp3_dq_drv_when_odten_ohm,                dec, lp3_index,         drv_when_odten,     24, 0xff,       2
+phy_lp3_dq_drv_when_odtoff_ohm,           dec, lp3_index,         drv_when_odtoff,    0,  0xff,       2
+phy_lp3_ca_drv_when_odtoff_ohm,           dec, lp3_index,         drv_when_odtoff,    8,  0xff,       2
+phy_lp3_clk_drv_when_odtoff_ohm,          dec, lp3_index,         drv_when_odtoff,    16, 0xff,       2
+lp3_dq_drv_when_odtoff_ohm,               dec, lp3_index,         drv_when_odtoff,    24, 0xff,       2
+phy_lp3_odt_ohm,                          dec, lp3_index,         odt_info,           8,  0x3ff,      2
+lp3_odt_ohm,                              dec, lp3_index,         odt_info,           0,  0xff,       2
+phy_lp3_odt_pull_up_en,                   dec, lp3_index,         odt_info,           18, 0x1,        2
+phy_lp3_odt_pull_dn_en,                   dec, lp3_index,         odt_info,           19, 0x1,        2
+reserved_lp3_odt_info_bit20_31,           dec, lp3_index,         odt_info,           20, 0xfff,      2
+phy_lp3_odten_freq_mhz,                   dec, lp3_index,         odten_freq,         12, 0xfff,      2
+lp3_odten_freq_mhz,                       dec, lp3_index,         odten_freq,         0,  0xfff,      2
+reserved_lp3_odten_freq_bit24_31,         dec, lp3_index,         odten_freq,         24, 0xff,       2
+phy_lp3_dq_sr_when_odten,                 dec, lp3_index,         sr_when_odten,      0,  0xff,       2
+phy_lp3_ca_sr_when_odten,                 dec, lp3_index,         sr_when_odten,      8,  0xff,       2
+phy_lp3_clk_sr_when_odten,                dec, lp3_index,         sr_when_odten,      16, 0xff,       2
+reserved_lp3_sr_when_odten_bit24_31,      dec, lp3_index,         sr_when_odten,      24, 0xff,       2
+phy_lp3_dq_sr_when_odtoff,                dec, lp3_index,         sr_when_odtoff,     0,  0xff,       2
+phy_lp3_ca_sr_when_odtoff,                dec, lp3_index,         sr_when_odtoff,     8,  0xff,       2
+phy_lp3_clk_sr_when_odtoff,               dec, lp3_index,         sr_when_odtoff,     16, 0xff,       2
+reserved_lp3_sr_when_odtoff_bit24_31,     dec, lp3_index,         sr_when_odtoff,     24, 0xff,       2
+phy_lp3_dq_vref_when_odten,               dec, lp3_index,         vref_when_odten,    0,  0x3ff,      5
+lp3_dq_vref_when_odten,                   dec, lp3_index,         vref_when_odten,    10, 0x3ff,      5
+lp3_ca_vref_when_odten,                   dec, lp3_index,         vref_when_odten,    20, 0x3ff,      5
+reserved_lp3_vref_when_odten_bit30_31,    dec, lp3_index,         vref_when_odten,    30, 0x3,        5
+phy_lp3_dq_vref_when_odtoff,              dec, lp3_index,         vref_when_odtoff,   0,  0x3ff,      5
+lp3_dq_vref_when_odtoff,                  dec, lp3_index,         vref_when_odtoff,   10, 0x3ff,      5
+lp3_ca_vref_when_odtoff,                  dec, lp3_index,         vref_when_odtoff,   20, 0x3ff,      5
+reserved_lp3_vref_when_odtoff_bit30_31,   dec, lp3_index,         vref_when_odtoff,   30, 0x3,        5
+
+lp4_f1_freq_mhz,                          dec, lp4_index,         ddr_freq0_1,        12, 0xfff,      2
+reserved_lp4_ddr_freq0_1_bit24_31,        dec, lp4_index,         ddr_freq0_1,        24, 0xff,       2
+lp4_f2_freq_mhz,                          dec, lp4_index,         ddr_freq2_3,        0,  0xfff,      2
+lp4_f3_freq_mhz,                          dec, lp4_index,         ddr_freq2_3,        12, 0xfff,      2
+reserved_lp4_ddr_freq2_3_bit24_31,        dec, lp4_index,         ddr_freq2_3,        24, 0xff,       2
+lp4_f4_freq_mhz,                          dec, lp4_index,         ddr_freq4_5,        0,  0xfff,      2
+lp4_f5_freq_mhz,                          dec, lp4_index,         ddr_freq4_5,        12, 0xfff,      2
+reserved_lp4_ddr_freq4_5_bit24_31,        dec, lp4_index,         ddr_freq4_5,        24, 0xff,       2
+phy_lp4_dq_drv_when_odten_ohm,            dec, lp4_index,         drv_when_odten,     0,  0xff,       2
+phy_lp4_ca_drv_when_odten_ohm,            dec, lp4_index,         drv_when_odten,     8,  0xff,       2
+phy_lp4_clk_drv_when_odten_ohm,           dec, lp4_index,         drv_when_odten,     16, 0xff,       2
+lp4_dq_drv_when_odten_ohm,                dec, lp4_index,         drv_when_odten,     24, 0xff,       2
+phy_lp4_dq_drv_when_odtoff_ohm,           dec, lp4_index,         drv_when_odtoff,    0,  0xff,       2
+phy_lp4_ca_drv_when_odtoff_ohm,           dec, lp4_index,         drv_when_odtoff,    8,  0xff,       2
+phy_lp4_clk_drv_when_odtoff_ohm,          dec, lp4_index,         drv_when_odtoff,    16, 0xff,       2
+lp4_dq_drv_when_odtoff_ohm,               dec, lp4_index,         drv_when_odtoff,    24, 0xff,       2
+phy_lp4_odt_ohm,                          dec, lp4_index,         odt_info,           8,  0x3ff,      2
+lp4_odt_ohm,                              dec, lp4_index,         odt_info,           0,  0xff,       2
+lp4_ca_odt_ohm,                           dec, lp4_index,         odt_info,           18, 0xff,       2
+lp4_drv_pu_cal_odten,                     dec, lp4_index,         odt_info,           26, 0x1,        2
+lp4_drv_pu_cal_odtoff,                    dec, lp4_index,         odt_info,           27, 0x1,        2
+phy_lp4_drv_pull_dn_en_odten,             dec, lp4_index,         odt_info,           28, 0x1,        2
+phy_lp4_drv_pull_dn_en_odtoff,            dec, lp4_index,         odt_info,           29, 0x1,        2
+reserved_lp4_odt_info_bit31,              dec, lp4_index,         odt_info,           31, 0x1,        2
+phy_lp4_odten_freq_mhz,                   dec, lp4_index,         dq_odten_freq,      12, 0xfff,      2
+lp4_dq_odten_freq_mhz,                    dec, lp4_index,         dq_odten_freq,      0,  0xfff,      2
+reserved_lp4_dq_odten_freq_bit24_31,      dec, lp4_index,         dq_odten_freq,      24, 0xff,       2
+phy_lp4_dq_sr_when_odten,                 dec, lp4_index,         sr_when_odten,      0,  0xff,       2
+phy_lp4_ca_sr_when_odten,                 dec, lp4_index,         sr_when_odten,      8,  0xff,       2
+phy_lp4_clk_sr_when_odten,                dec, lp4_index,         sr_when_odten,      16, 0xff,       2
+reserved_lp4_sr_when_odten_bit24_31,      dec, lp4_index,         sr_when_odten,      24, 0xff,       2
+phy_lp4_dq_sr_when_odtoff,                dec, lp4_index,         sr_when_odtoff,     0,  0xff,       2
+phy_lp4_ca_sr_when_odtoff,                dec, lp4_index,         sr_when_odtoff,     8,  0xff,       2
+phy_lp4_clk_sr_when_odtoff,               dec, lp4_index,         sr_when_odtoff,     16, 0xff,       2
+reserved_lp4_sr_when_odtoff_bit24_31,     dec, lp4_index,         sr_when_odtoff,     24, 0xff,       2
+lp4_ca_odten_freq_mhz,                    dec, lp4_index,         ca_odten_freq,      0,  0xfff,      2
+reserved_lp4_ca_odten_freq_bit12_31,      dec, lp4_index,         ca_odten_freq,      12, 0xfffff,    2
+phy_lp4_cs_drv_odten,                     dec, lp4_index,         cs_drv_ca_odt_info, 0,  0xff,       2
+phy_lp4_cs_drv_odtoff,                    dec, lp4_index,         cs_drv_ca_odt_info, 8,  0xff,       2
+lp4_odte_ck,                              dec, lp4_index,         cs_drv_ca_odt_info, 16, 0x1,        2
+lp4_odte_cs_en,                           dec, lp4_index,         cs_drv_ca_odt_info, 17, 0x1,        2
+lp4_odtd_ca_en,                           dec, lp4_index,         cs_drv_ca_odt_info, 18, 0x1,        2
+reserved_lp4cs_drv_ca_odt_info_bit19_31,  dec, lp4_index,         cs_drv_ca_odt_info, 19, 0x1fff,     2
+phy_lp4_dq_vref_when_odten,               dec, lp4_index,         vref_when_odten,    0,  0x3ff,      2
+lp4_dq_vref_when_odten,                   dec, lp4_index,         vref_when_odten,    10, 0x3ff,      2
+lp4_ca_vref_when_odten,                   dec, lp4_index,         vref_when_odten,    20, 0x3ff,      2
+reserved_lp4_vref_when_odten_bit30_31,    dec, lp4_index,         vref_when_odten,    30, 0x3,        2
+phy_lp4_dq_vref_when_odtoff,              dec, lp4_index,         vref_when_odtoff,   0,  0x3ff,      2
+lp4_dq_vref_when_odtoff,                  dec, lp4_index,         vref_when_odtoff,   10, 0x3ff,      2
+lp4_ca_vref_when_odtoff,                  dec, lp4_index,         vref_when_odtoff,   20, 0x3ff,      2
+reserved_lp4_vref_when_odtoff_bit30_31,   dec, lp4_index,         vref_when_odtoff,   30, 0x3,        2
+
+ddr2_bytes_map,                           hex, dq_map_index,      byte_map_0,         16, 0xff,       2
+ddr3_bytes_map,                           hex, dq_map_index,      byte_map_0,         24, 0xff,       2
+ddr4_bytes_map,                           hex, dq_map_index,      byte_map_0,         0,  0xff,       2
+reservedbyte_map_0_bit8_15,               hex, dq_map_index,      byte_map_0,         8,  0xff,       2
+lp2_bytes_map,                            hex, dq_map_index,      byte_map_1,         8,  0xff,       2
+lp3_bytes_map,                            hex, dq_map_index,      byte_map_1,         16, 0xff,       2
+lp4_bytes_map,                            hex, dq_map_index,      byte_map_1,         24, 0xff,       2
+reserved_byte_map_1_bit0_7,               hex, dq_map_index,      byte_map_1,         0,  0xff,       2
+lp3_dq0_7_map,                            hex, dq_map_index,      lp3_dq0_7_map,      0,  0xffffffff, 2
+lp2_dq0_7_map,                            hex, dq_map_index,      lp2_dq0_7_map,      0,  0xffffffff, 2
+ddr4_cs0_dq0_dq15_map,                    hex, dq_map_index,      ddr4_dq_map_0,      0,  0xffffffff, 2
+ddr4_cs0_dq16_dq31_map,                   hex, dq_map_index,      ddr4_dq_map_1,      0,  0xffffffff, 2
+ddr4_cs1_dq0_dq15_map,                    hex, dq_map_index,      ddr4_dq_map_2,      0,  0xffffffff, 2
+ddr4_cs1_dq16_dq31_map,                   hex, dq_map_index,      ddr4_dq_map_3,      0,  0xffffffff, 2
+
+lp4x_f1_freq_mhz,                         dec, lp4x_index,        ddr_freq0_1,        12, 0xfff,      2
+reserved_lp4x_ddr_freq0_1_bit24_31,       dec, lp4x_index,        ddr_freq0_1,        24, 0xff,       2
+lp4x_f2_freq_mhz,                         dec, lp4x_index,        ddr_freq2_3,        0,  0xfff,      2
+lp4x_f3_freq_mhz,                         dec, lp4x_index,        ddr_freq2_3,        12, 0xfff,      2
+reserved_lp4x_ddr_freq2_3_bit24_31,       dec, lp4x_index,        ddr_freq2_3,        24, 0xff,       2
+lp4x_f4_freq_mhz,                         dec, lp4x_index,        ddr_freq4_5,        0,  0xfff,      2
+lp4x_f5_freq_mhz,                         dec, lp4x_index,        ddr_freq4_5,        12, 0xfff,      2
+reserved_lp4x_ddr_freq4_5_bit24_31,       dec, lp4x_index,        ddr_freq4_5,        24, 0xff,       2
+phy_lp4x_dq_drv_when_odten_ohm,           dec, lp4x_index,        drv_when_odten,     0,  0xff,       2
+phy_lp4x_ca_drv_when_odten_ohm,           dec, lp4x_index,        drv_when_odten,     8,  0xff,       2
+phy_lp4x_clk_drv_when_odten_ohm,          dec, lp4x_index,        drv_when_odten,     16, 0xff,       2
+lp4x_dq_drv_when_odten_ohm,               dec, lp4x_index,        drv_when_odten,     24, 0xff,       2
+phy_lp4x_dq_drv_when_odtoff_ohm,          dec, lp4x_index,        drv_when_odtoff,    0,  0xff,       2
+phy_lp4x_ca_drv_when_odtoff_ohm,          dec, lp4x_index,        drv_when_odtoff,    8,  0xff,       2
+phy_lp4x_clk_drv_when_odtoff_ohm,         dec, lp4x_index,        drv_when_odtoff,    16, 0xff,       2
+lp4x_dq_drv_when_odtoff_ohm,              dec, lp4x_index,        drv_when_odtoff,    24, 0xff,       2
+phy_lp4x_odt_ohm,                         dec, lp4x_index,        odt_info,           8,  0x3ff,      2
+lp4x_odt_ohm,                             dec, lp4x_index,        odt_info,           0,  0xff,       2
+lp4x_ca_odt_ohm,                          dec, lp4x_index,        odt_info,           18, 0xff,       2
+lp4x_drv_pu_cal_odten,                    dec, lp4x_index,        odt_info,           26, 0x1,        2
+lp4x_drv_pu_cal_odtoff,                   dec, lp4x_index,        odt_info,           27, 0x1,        2
+phy_lp4x_drv_pull_dn_en_odten,            dec, lp4x_index,        odt_info,           28, 0x1,        2
+phy_lp4x_drv_pull_dn_en_odtoff,           dec, lp4x_index,        odt_info,           29, 0x1,        2
+reserved_lp4x_odt_info_bit31,             dec, lp4x_index,        odt_info,           31, 0x1,        2
+phy_lp4x_odten_freq_mhz,                  dec, lp4x_index,        dq_odten_freq,      12, 0xfff,      2
+lp4x_dq_odten_freq_mhz,                   dec, lp4x_index,        dq_odten_freq,      0,  0xfff,      2
+reserved_lp4x_dq_odten_freq_bit24_31,     dec, lp4x_index,        dq_odten_freq,      24, 0xff,       2
+phy_lp4x_dq_sr_when_odten,                dec, lp4x_index,        sr_when_odten,      0,  0xff,       2
+phy_lp4x_ca_sr_when_odten,                dec, lp4x_index,        sr_when_odten,      8,  0xff,       2
+phy_lp4x_clk_sr_when_odten,               dec, lp4x_index,        sr_when_odten,      16, 0xff,       2
+reserved_lp4x_sr_when_odten_bit24_31,     dec, lp4x_index,        sr_when_odten,      24, 0xff,       2
+phy_lp4x_dq_sr_when_odtoff,               dec, lp4x_index,        sr_when_odtoff,     0,  0xff,       2
+phy_lp4x_ca_sr_when_odtoff,               dec, lp4x_index,        sr_when_odtoff,     8,  0xff,       2
+phy_lp4x_clk_sr_when_odtoff,              dec, lp4x_index,        sr_when_odtoff,     16, 0xff,       2
+reserved_lp4x_sr_when_odtoff_bit24_31,    dec, lp4x_index,        sr_when_odtoff,     24, 0xff,       2
+lp4x_ca_odten_freq_mhz,                   dec, lp4x_index,        ca_odten_freq,      0,  0xfff,      2
+reserved_lp4x_ca_odten_freq_bit12_31,     dec, lp4x_index,        ca_odten_freq,      12, 0xfffff,    2
+phy_lp4x_cs_drv_odten,                    dec, lp4x_index,        cs_drv_ca_odt_info, 0,  0xff,       2
+phy_lp4x_cs_drv_odtoff,                   dec, lp4x_index,        cs_drv_ca_odt_info, 8,  0xff,       2
+lp4x_odte_ck,                             dec, lp4x_index,        cs_drv_ca_odt_info, 16, 0x1,        2
+lp4x_odte_cs_en,                          dec, lp4x_index,        cs_drv_ca_odt_info, 17, 0x1,        2
+lp4x_odtd_ca_en,                          dec, lp4x_index,        cs_drv_ca_odt_info, 18, 0x1,        2
+reserved_lp4xcs_drv_ca_odt_info_bit19_31, dec, lp4x_index,        cs_drv_ca_odt_info, 19, 0x1fff,     2
+phy_lp4x_dq_vref_when_odten,              dec, lp4x_index,        vref_when_odten,    0,  0x3ff,      2
+lp4x_dq_vref_when_odten,                  dec, lp4x_index,        vref_when_odten,    10, 0x3ff,      2
+lp4x_ca_vref_when_odten,                  dec, lp4x_index,        vref_when_odten,    20, 0x3ff,      2
+reserved_lp4x_vref_when_odten_bit30_31,   dec, lp4x_index,        vref_when_odten,    30, 0x3,        2
+phy_lp4x_dq_vref_when_odtoff,             dec, lp4x_index,        vref_when_odtoff,   0,  0x3ff,      2
+lp4x_dq_vref_when_odtoff,                 dec, lp4x_index,        vref_when_odtoff,   10, 0x3ff,      2
+lp4x_ca_vref_when_odtoff,                 dec, lp4x_index,        vref_when_odtoff,   20, 0x3ff,      2
+reserved_lp4x_vref_when_odtoff_bit30_31,  dec, lp4x_index,        vref_when_odtoff,   30, 0x3,        2
+
+lp5_f1_freq_mhz,                          dec, lp5_index,         ddr_freq0_1,        12, 0xfff,      2
+reserved_lp5_ddr_freq0_1_bit24_31,        dec, lp5_index,         ddr_freq0_1,        24, 0xff,       2
+lp5_f2_freq_mhz,                          dec, lp5_index,         ddr_freq2_3,        0,  0xfff,      2
+lp5_f3_freq_mhz,                          dec, lp5_index,         ddr_freq2_3,        12, 0xfff,      2
+reserved_lp5_ddr_freq2_3_bit24_31,        dec, lp5_index,         ddr_freq2_3,        24, 0xff,       2
+lp5_f4_freq_mhz,                          dec, lp5_index,         ddr_freq4_5,        0,  0xfff,      2
+lp5_f5_freq_mhz,                          dec, lp5_index,         ddr_freq4_5,        12, 0xfff,      2
+reserved_lp5_ddr_freq4_5_bit24_31,        dec, lp5_index,         ddr_freq4_5,        24, 0xff,       2
+phy_lp5_dq_drv_when_odten_ohm,            dec, lp5_index,         drv_when_odten,     0,  0xff,       2
+phy_lp5_ca_drv_when_odten_ohm,            dec, lp5_index,         drv_when_odten,     8,  0xff,       2
+phy_lp5_clk_drv_when_odten_ohm,           dec, lp5_index,         drv_when_odten,     16, 0xff,       2
+lp5_dq_drv_when_odten_ohm,                dec, lp5_index,         drv_when_odten,     24, 0xff,       2
+phy_lp5_dq_drv_when_odtoff_ohm,           dec, lp5_index,         drv_when_odtoff,    0,  0xff,       2
+phy_lp5_ca_drv_when_odtoff_ohm,           dec, lp5_index,         drv_when_odtoff,    8,  0xff,       2
+phy_lp5_clk_drv_when_odtoff_ohm,          dec, lp5_index,         drv_when_odtoff,    16, 0xff,       2
+lp5_dq_drv_when_odtoff_ohm,               dec, lp5_index,         drv_when_odtoff,    24, 0xff,       2
+phy_lp5_odt_ohm,                          dec, lp5_index,         odt_info,           8,  0x3ff,      2
+lp5_odt_ohm,                              dec, lp5_index,         odt_info,           0,  0xff,       2
+lp5_ca_odt_ohm,                           dec, lp5_index,         odt_info,           18, 0xff,       2
+lp5_drv_pu_cal_odten,                     dec, lp5_index,         odt_info,           26, 0x1,        2
+lp5_drv_pu_cal_odtoff,                    dec, lp5_index,         odt_info,           27, 0x1,        2
+phy_lp5_drv_pull_dn_en_odten,             dec, lp5_index,         odt_info,           28, 0x1,        2
+phy_lp5_drv_pull_dn_en_odtoff,            dec, lp5_index,         odt_info,           29, 0x1,        2
+reserved_lp5_odt_info_bit31,              dec, lp5_index,         odt_info,           31, 0x1,        2
+phy_lp5_odten_freq_mhz,                   dec, lp5_index,         dq_odten_freq,      12, 0xfff,      2
+lp5_dq_odten_freq_mhz,                    dec, lp5_index,         dq_odten_freq,      0,  0xfff,      2
+reserved_lp5_dq_odten_freq_bit24_31,      dec, lp5_index,         dq_odten_freq,      24, 0xff,       2
+phy_lp5_dq_sr_when_odten,                 dec, lp5_index,         sr_when_odten,      0,  0xff,       2
+phy_lp5_ca_sr_when_odten,                 dec, lp5_index,         sr_when_odten,      8,  0xff,       2
+phy_lp5_clk_sr_when_odten,                dec, lp5_index,         sr_when_odten,      16, 0xff,       2
+reserved_lp5_sr_when_odten_bit24_31,      dec, lp5_index,         sr_when_odten,      24, 0xff,       2
+phy_lp5_dq_sr_when_odtoff,                dec, lp5_index,         sr_when_odtoff,     0,  0xff,       2
+phy_lp5_ca_sr_when_odtoff,                dec, lp5_index,         sr_when_odtoff,     8,  0xff,       2
+phy_lp5_clk_sr_when_odtoff,               dec, lp5_index,         sr_when_odtoff,     16, 0xff,       2
+reserved_lp5_sr_when_odtoff_bit24_31,     dec, lp5_index,         sr_when_odtoff,     24, 0xff,       2
+lp5_ca_odten_freq_mhz,                    dec, lp5_index,         ca_odten_freq,      0,  0xfff,      2
+lp5_wck_odt_en_freq,                      dec, lp5_index,         ca_odten_freq,      12, 0xfff,      2
+lp5_wck_odt,                              dec, lp5_index,         ca_odten_freq,      24, 0xff,       2
+phy_lp5_cs_drv_odten,                     dec, lp5_index,         cs_drv_ca_odt_info, 0,  0xff,       2
+phy_lp5_cs_drv_odtoff,                    dec, lp5_index,         cs_drv_ca_odt_info, 8,  0xff,       2
+lp5_odte_ck,                              dec, lp5_index,         cs_drv_ca_odt_info, 16, 0x1,        2
+lp5_odte_cs_en,                           dec, lp5_index,         cs_drv_ca_odt_info, 17, 0x1,        2
+lp5_odtd_ca_en,                           dec, lp5_index,         cs_drv_ca_odt_info, 18, 0x1,        2
+lp5_nt_odt,                               dec, lp5_index,         cs_drv_ca_odt_info, 24, 0xff,       2
+reserved_lp5_cs_drv_ca_odt_info_bit19_23, dec, lp5_index,         cs_drv_ca_odt_info, 19, 0x1f,       2
+phy_lp5_dq_vref_when_odten,               dec, lp5_index,         vref_when_odten,    0,  0x3ff,      2
+lp5_dq_vref_when_odten,                   dec, lp5_index,         vref_when_odten,    10, 0x3ff,      2
+lp5_ca_vref_when_odten,                   dec, lp5_index,         vref_when_odten,    20, 0x3ff,      2
+reserved_lp5_vref_when_odten_bit30_31,    dec, lp5_index,         vref_when_odten,    30, 0x3,        2
+phy_lp5_dq_vref_when_odtoff,              dec, lp5_index,         vref_when_odtoff,   0,  0x3ff,      2
+lp5_dq_vref_when_odtoff,                  dec, lp5_index,         vref_when_odtoff,   10, 0x3ff,      2
+lp5_ca_vref_when_odtoff,                  dec, lp5_index,         vref_when_odtoff,   20, 0x3ff,      2
+reserved_lp5_vref_when_odtoff_bit30_31,   dec, lp5_index,         vref_when_odtoff,   30, 0x3,        2
+
+lp4_4x_ch_mask0,                          hex, lp4_4x_hash_index, ch_mask_0,          0,  0xffffffff, 3
+lp4_4x_ch_mask1,                          hex, lp4_4x_hash_index, ch_mask_1,          0,  0xffffffff, 3
+lp4_4x_bank_mask0,                        hex, lp4_4x_hash_index, bank_mask_0,        0,  0xffffffff, 3
+lp4_4x_bank_mask1,                        hex, lp4_4x_hash_index, bank_mask_1,        0,  0xffffffff, 3
+lp4_4x_bank_mask2,                        hex, lp4_4x_hash_index, bank_mask_2,        0,  0xffffffff, 3
+lp4_4x_bank_mask3,                        hex, lp4_4x_hash_index, bank_mask_3,        0,  0xffffffff, 3
+lp4_4x_rank_mask0,                        hex, lp4_4x_hash_index, rank_mask0,         0,  0xffffffff, 3
+lp4_4x_rank_mask1,                        hex, lp4_4x_hash_index, rank_mask1,         0,  0xffffffff, 3
+
+lp5_ch_mask0,                             hex, lp5_hash_index,    ch_mask_0,          0,  0xffffffff, 4
+lp5_ch_mask1,                             hex, lp5_hash_index,    ch_mask_1,          0,  0xffffffff, 4
+lp5_bank_mask0,                           hex, lp5_hash_index,    bank_mask_0,        0,  0xffffffff, 4
+lp5_bank_mask1,                           hex, lp5_hash_index,    bank_mask_1,        0,  0xffffffff, 4
+lp5_bank_mask2,                           hex, lp5_hash_index,    bank_mask_2,        0,  0xffffffff, 4
+lp5_bank_mask3,                           hex, lp5_hash_index,    bank_mask_3,        0,  0xffffffff, 4
+lp5_rank_mask0,                           hex, lp5_hash_index,    rank_mask0,         0,  0xffffffff, 4
+lp5_rank_mask1,                           hex, lp5_hash_index,    rank_mask1,         0,  0xffffffff, 4
+
+ddr4_ch_mask0,                            hex, ddr4_hash_index,   ch_mask_0,          0,  0xffffffff, 4
+ddr4_ch_mask1,                            hex, ddr4_hash_index,   ch_mask_1,          0,  0xffffffff, 4
+ddr4_bank_mask0,                          hex, ddr4_hash_index,   bank_mask_0,        0,  0xffffffff, 4
+ddr4_bank_mask1,                          hex, ddr4_hash_index,   bank_mask_1,        0,  0xffffffff, 4
+ddr4_bank_mask2,                          hex, ddr4_hash_index,   bank_mask_2,        0,  0xffffffff, 4
+ddr4_bank_mask3,                          hex, ddr4_hash_index,   bank_mask_3,        0,  0xffffffff, 4
+ddr4_rank_mask0,                          hex, ddr4_hash_index,   rank_mask0,         0,  0xffffffff, 4
+ddr4_rank_mask1,                          hex, ddr4_hash_index,   rank_mask1,         0,  0xffffffff, 4
+
+lp3_ch_mask0,                             hex, lp3_hash_index,    ch_mask_0,          0,  0xffffffff, 4
+lp3_ch_mask1,                             hex, lp3_hash_index,    ch_mask_1,          0,  0xffffffff, 4
+lp3_bank_mask0,                           hex, lp3_hash_index,    bank_mask_0,        0,  0xffffffff, 4
+lp3_bank_mask1,                           hex, lp3_hash_index,    bank_mask_1,        0,  0xffffffff, 4
+lp3_bank_mask2,                           hex, lp3_hash_index,    bank_mask_2,        0,  0xffffffff, 4
+lp3_bank_mask3,                           hex, lp3_hash_index,    bank_mask_3,        0,  0xffffffff, 4
+lp3_rank_mask0,                           hex, lp3_hash_index,    rank_mask0,         0,  0xffffffff, 4
+lp3_rank_mask1,                           hex, lp3_hash_index,    rank_mask1,         0,  0xffffffff, 4
+
+ddr3_ch_mask0,                            hex, ddr3_hash_index,   ch_mask_0,          0,  0xffffffff, 4
+ddr3_ch_mask1,                            hex, ddr3_hash_index,   ch_mask_1,          0,  0xffffffff, 4
+ddr3_bank_mask0,                          hex, ddr3_hash_index,   bank_mask_0,        0,  0xffffffff, 4
+ddr3_bank_mask1,                          hex, ddr3_hash_index,   bank_mask_1,        0,  0xffffffff, 4
+ddr3_bank_mask2,                          hex, ddr3_hash_index,   bank_mask_2,        0,  0xffffffff, 4
+ddr3_bank_mask3,                          hex, ddr3_hash_index,   bank_mask_3,        0,  0xffffffff, 4
+ddr3_rank_mask0,                          hex, ddr3_hash_index,   rank_mask0,         0,  0xffffffff, 4
+ddr3_rank_mask1,                          hex, ddr3_hash_index,   rank_mask1,         0,  0xffffffff, 4
+
+lp2_ch_mask0,                             hex, lp2_hash_index,    ch_mask_0,          0,  0xffffffff, 4
+lp2_ch_mask1,                             hex, lp2_hash_index,    ch_mask_1,          0,  0xffffffff, 4
+lp2_bank_mask0,                           hex, lp2_hash_index,    bank_mask_0,        0,  0xffffffff, 4
+lp2_bank_mask1,                           hex, lp2_hash_index,    bank_mask_1,        0,  0xffffffff, 4
+lp2_bank_mask2,                           hex, lp2_hash_index,    bank_mask_2,        0,  0xffffffff, 4
+lp2_bank_mask3,                           hex, lp2_hash_index,    bank_mask_3,        0,  0xffffffff, 4
+lp2_rank_mask0,                           hex, lp2_hash_index,    rank_mask0,         0,  0xffffffff, 4
+lp2_rank_mask1,                           hex, lp2_hash_index,    rank_mask1,         0,  0xffffffff, 4
+
+ddr2_ch_mask0,                            hex, ddr2_hash_index,   ch_mask_0,          0,  0xffffffff, 4
+ddr2_ch_mask1,                            hex, ddr2_hash_index,   ch_mask_1,          0,  0xffffffff, 4
+ddr2_bank_mask0,                          hex, ddr2_hash_index,   bank_mask_0,        0,  0xffffffff, 4
+ddr2_bank_mask1,                          hex, ddr2_hash_index,   bank_mask_1,        0,  0xffffffff, 4
+ddr2_bank_mask2,                          hex, ddr2_hash_index,   bank_mask_2,        0,  0xffffffff, 4
+ddr2_bank_mask3,                          hex, ddr2_hash_index,   bank_mask_3,        0,  0xffffffff, 4
+ddr2_rank_mask0,                          hex, ddr2_hash_index,   rank_mask0,         0,  0xffffffff, 4
+ddr2_rank_mask1,                          hex, ddr2_hash_index,   rank_mask1,         0,  0xffffffff, 4
+
+ddr5_ch_mask0,                            hex, ddr5_hash_index,   ch_mask_0,          0,  0xffffffff, 4
+ddr5_ch_mask1,                            hex, ddr5_hash_index,   ch_mask_1,          0,  0xffffffff, 4
+ddr5_bank_mask0,                          hex, ddr5_hash_index,   bank_mask_0,        0,  0xffffffff, 4
+ddr5_bank_mask1,                          hex, ddr5_hash_index,   bank_mask_1,        0,  0xffffffff, 4
+ddr5_bank_mask2,                          hex, ddr5_hash_index,   bank_mask_2,        0,  0xffffffff, 4
+ddr5_bank_mask3,                          hex, ddr5_hash_index,   bank_mask_3,        0,  0xffffffff, 4
+ddr5_rank_mask0,                          hex, ddr5_hash_index,   rank_mask0,         0,  0xffffffff, 4
+ddr5_rank_mask1,                          hex, ddr5_hash_index,   rank_mask1,         0,  0xffffffff, 4
+
+reserved_skew_ddr3_skew_freq_bit12_31,    hex, skew_index,        ddr3_skew_freq,     12, 0xfffff,    4
+ddr3_skew_freq_mhz,                       dec, skew_index,        ddr3_skew_freq,     0,  0xfff,      4
+ddr3_ca0_skew,                            hex, skew_index,        ddr3_ca_skew_2,     8,  0xff,       4
+ddr3_ca1_skew,                            hex, skew_index,        ddr3_ca_skew_0,     0,  0xff,       4
+ddr3_ca2_skew,                            hex, skew_index,        ddr3_ca_skew_1,     24, 0xff,       4
+ddr3_ca3_skew,                            hex, skew_index,        ddr3_ca_skew_1,     8,  0xff,       4
+ddr3_ca4_skew,                            hex, skew_index,        ddr3_ca_skew_1,     16, 0xff,       4
+ddr3_ca5_skew,                            hex, skew_index,        ddr3_ca_skew_2,     24, 0xff,       4
+ddr3_ca6_skew,                            hex, skew_index,        ddr3_ca_skew_1,     0,  0xff,       4
+ddr3_ca7_skew,                            hex, skew_index,        ddr3_ca_skew_2,     0,  0xff,       4
+ddr3_ca8_skew,                            hex, skew_index,        ddr3_ca_skew_3,     16, 0xff,       4
+ddr3_ca9_skew,                            hex, skew_index,        ddr3_ca_skew_0,     24, 0xff,       4
+ddr3_ca10_skew,                           hex, skew_index,        ddr3_ca_skew_3,     24, 0xff,       4
+ddr3_ca11_skew,                           hex, skew_index,        ddr3_ca_skew_2,     16, 0xff,       4
+ddr3_ca12_skew,                           hex, skew_index,        ddr3_ca_skew_4,     0,  0xff,       4
+ddr3_ca13_skew,                           hex, skew_index,        ddr3_ca_skew_0,     8,  0xff,       4
+ddr3_ca14_skew,                           hex, skew_index,        ddr3_ca_skew_0,     16, 0xff,       4
+ddr3_ca15_skew,                           hex, skew_index,        ddr3_ca_skew_5,     16, 0xff,       4
+ddr3_ras_skew,                            hex, skew_index,        ddr3_ca_skew_5,     8,  0xff,       4
+ddr3_cas_skew,                            hex, skew_index,        ddr3_ca_skew_7,     24, 0xff,       4
+ddr3_ba0_skew,                            hex, skew_index,        ddr3_ca_skew_5,     24, 0xff,       4
+ddr3_ba1_skew,                            hex, skew_index,        ddr3_ca_skew_3,     0,  0xff,       4
+ddr3_ba2_skew,                            hex, skew_index,        ddr3_ca_skew_4,     8,  0xff,       4
+ddr3_we_skew,                             hex, skew_index,        ddr3_ca_skew_6,     8,  0xff,       4
+ddr3_cke0_skew,                           hex, skew_index,        ddr3_ca_skew_4,     24, 0xff,       4
+ddr3_cke1_skew,                           hex, skew_index,        ddr3_ca_skew_5,     0,  0xff,       4
+ddr3_ckn_skew,                            hex, skew_index,        ddr3_ca_skew_6,     24, 0xff,       4
+ddr3_ckp_skew,                            hex, skew_index,        ddr3_ca_skew_6,     16, 0xff,       4
+ddr3_odt0_skew,                           hex, skew_index,        ddr3_ca_skew_3,     8,  0xff,       4
+ddr3_odt1_skew,                           hex, skew_index,        ddr3_ca_skew_6,     0,  0xff,       4
+ddr3_cs0_skew,                            hex, skew_index,        ddr3_ca_skew_7,     0,  0xff,       4
+ddr3_cs1_skew,                            hex, skew_index,        ddr3_ca_skew_7,     16, 0xff,       4
+ddr3_resetn_skew,                         hex, skew_index,        ddr3_ca_skew_7,     8,  0xff,       4
+
+reserved_skew_ddr4_skew_freq_bit12_31,    hex, skew_index,        ddr4_skew_freq,     12, 0xfffff,    4
+ddr4_skew_freq_mhz,                       dec, skew_index,        ddr4_skew_freq,     0,  0xfff,      4
+ddr4_ca0_skew,                            hex, skew_index,        ddr4_ca_skew_0,     24, 0xff,       4
+ddr4_ca1_skew,                            hex, skew_index,        ddr4_ca_skew_0,     16, 0xff,       4
+ddr4_ca2_skew,                            hex, skew_index,        ddr4_ca_skew_0,     8,  0xff,       4
+ddr4_ca3_skew,                            hex, skew_index,        ddr4_ca_skew_0,     0,  0xff,       4
+ddr4_ca4_skew,                            hex, skew_index,        ddr4_ca_skew_1,     24, 0xff,       4
+ddr4_ca5_skew,                            hex, skew_index,        ddr4_ca_skew_1,     16, 0xff,       4
+ddr4_ca6_skew,                            hex, skew_index,        ddr4_ca_skew_1,     8,  0xff,       4
+ddr4_ca7_skew,                            hex, skew_index,        ddr4_ca_skew_1,     0,  0xff,       4
+ddr4_ca8_skew,                            hex, skew_index,        ddr4_ca_skew_2,     24, 0xff,       4
+ddr4_ca9_skew,                            hex, skew_index,        ddr4_ca_skew_2,     16, 0xff,       4
+ddr4_ca10_skew,                           hex, skew_index,        ddr4_ca_skew_2,     8,  0xff,       4
+ddr4_ca11_skew,                           hex, skew_index,        ddr4_ca_skew_2,     0,  0xff,       4
+ddr4_ca12_skew,                           hex, skew_index,        ddr4_ca_skew_3,     24, 0xff,       4
+ddr4_ca13_skew,                           hex, skew_index,        ddr4_ca_skew_3,     16, 0xff,       4
+ddr4_ca14_skew,                           hex, skew_index,        ddr4_ca_skew_3,     8,  0xff,       4
+ddr4_ca15_skew,                           hex, skew_index,        ddr4_ca_skew_3,     0,  0xff,       4
+ddr4_ca16_skew,                           hex, skew_index,        ddr4_ca_skew_4,     24, 0xff,       4
+ddr4_ca17_skew,                           hex, skew_index,        ddr4_ca_skew_4,     16, 0xff,       4
+ddr4_ba0_skew,                            hex, skew_index,        ddr4_ca_skew_4,     8,  0xff,       4
+ddr4_ba1_skew,                            hex, skew_index,        ddr4_ca_skew_4,     0,  0xff,       4
+ddr4_bg0_skew,                            hex, skew_index,        ddr4_ca_skew_5,     24, 0xff,       4
+ddr4_bg1_skew,                            hex, skew_index,        ddr4_ca_skew_5,     16, 0xff,       4
+ddr4_cke0_skew,                           hex, skew_index,        ddr4_ca_skew_5,     8,  0xff,       4
+ddr4_cke1_skew,                           hex, skew_index,        ddr4_ca_skew_5,     0,  0xff,       4
+ddr4_ckn_skew,                            hex, skew_index,        ddr4_ca_skew_6,     24, 0xff,       4
+ddr4_ckp_skew,                            hex, skew_index,        ddr4_ca_skew_6,     16, 0xff,       4
+ddr4_odt0_skew,                           hex, skew_index,        ddr4_ca_skew_6,     8,  0xff,       4
+ddr4_odt1_skew,                           hex, skew_index,        ddr4_ca_skew_6,     0,  0xff,       4
+ddr4_cs0_skew,                            hex, skew_index,        ddr4_ca_skew_7,     24, 0xff,       4
+ddr4_cs1_skew,                            hex, skew_index,        ddr4_ca_skew_7,     16, 0xff,       4
+ddr4_resetn_skew,                         hex, skew_index,        ddr4_ca_skew_7,     8,  0xff,       4
+ddr4_actn_skew,                           hex, skew_index,        ddr4_ca_skew_7,     0,  0xff,       4
+
+reserved_skew_lp3_skew_freq_bit12_31,     hex, skew_index,        lp3_skew_freq,      12, 0xfffff,    4
+lp3_skew_freq_mhz,                        dec, skew_index,        lp3_skew_freq,      0,  0xfff,      4
+lp3_ca0_skew,                             hex, skew_index,        lp3_ca_skew_3,      0,  0xff,       4
+lp3_ca1_skew,                             hex, skew_index,        lp3_ca_skew_4,      0,  0xff,       4
+lp3_ca2_skew,                             hex, skew_index,        lp3_ca_skew_2,      16, 0xff,       4
+lp3_ca3_skew,                             hex, skew_index,        lp3_ca_skew_3,      16, 0xff,       4
+lp3_ca4_skew,                             hex, skew_index,        lp3_ca_skew_3,      24, 0xff,       4
+lp3_ca5_skew,                             hex, skew_index,        lp3_ca_skew_1,      24, 0xff,       4
+lp3_ca6_skew,                             hex, skew_index,        lp3_ca_skew_2,      24, 0xff,       4
+lp3_ca7_skew,                             hex, skew_index,        lp3_ca_skew_2,      0,  0xff,       4
+lp3_ca8_skew,                             hex, skew_index,        lp3_ca_skew_5,      24, 0xff,       4
+lp3_ca9_skew,                             hex, skew_index,        lp3_ca_skew_7,      0,  0xff,       4
+lp3_cke0_skew,                            hex, skew_index,        lp3_ca_skew_4,      8,  0xff,       4
+lp3_cke1_skew,                            hex, skew_index,        lp3_ca_skew_5,      0,  0xff,       4
+lp3_ckn_skew,                             hex, skew_index,        lp3_ca_skew_6,      24, 0xff,       4
+lp3_ckp_skew,                             hex, skew_index,        lp3_ca_skew_6,      16, 0xff,       4
+lp3_odt0_skew,                            hex, skew_index,        lp3_ca_skew_6,      8,  0xff,       4
+lp3_odt1_skew,                            hex, skew_index,        lp3_ca_skew_6,      0,  0xff,       4
+lp3_odt2_skew,                            hex, skew_index,        lp3_ca_skew_0,      24, 0xff,       4
+lp3_odt3_skew,                            hex, skew_index,        lp3_ca_skew_0,      8,  0xff,       4
+lp3_cs0_skew,                             hex, skew_index,        lp3_ca_skew_7,      16, 0xff,       4
+lp3_cs1_skew,                             hex, skew_index,        lp3_ca_skew_7,      24, 0xff,       4
+lp3_cs2_skew,                             hex, skew_index,        lp3_ca_skew_1,      8,  0xff,       4
+lp3_cs3_skew,                             hex, skew_index,        lp3_ca_skew_3,      8,  0xff,       4
+
+reserved_skew_lp4_skew_freq_bit12_31,     hex, skew_index,        null,               0,  0,          4
+lp4_skew_freq_mhz,                        dec, skew_index,        null,               0,  0,          4
+lp4_ca0_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca1_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca2_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca3_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca4_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca5_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_odt0_a_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_odt1_a_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_cke0_a_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_cke1_a_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_ckn_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ckp_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_cs0_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_cs1_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca0_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca1_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca2_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca3_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca4_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ca5_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_odt0_b_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_odt1_b_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_cke0_b_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_cke1_b_skew,                          hex, skew_index,        null,               0,  0,          4
+lp4_ckn_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_ckp_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_cs0_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_cs1_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp4_resetn_skew,                          hex, skew_index,        null,               0,  0,          4
+
+reserved_skew_lp5_skew_freq_bit12_31,     hex, skew_index,        null,               0,  0,          4
+lp5_skew_freq_mhz,                        dec, skew_index,        null,               0,  0,          4
+lp5_ca0_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca1_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca2_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca3_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca4_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca5_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca6_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ckn_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ckp_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_cs0_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_cs1_a_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca0_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca1_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca2_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca3_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca4_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca5_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ca6_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ckn_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_ckp_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_cs0_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_cs1_b_skew,                           hex, skew_index,        null,               0,  0,          4
+lp5_resetn_skew,                          hex, skew_index,        null,               0,  0,          4
+'''
+
+# One row of base_info_table, it is a tuple so it is immutable and small.
+# v0_info is (offset, shift, mask) or None.
+FieldSpec = namedtuple('FieldSpec', ['key', 'num_base', 'index', 'position', 'shift', 'mask',
+    'version', 'v0_info'])
+
+# {key: FieldSpec}
+base_info_full = {}
+# the keys of base_info_full in order, and {key: position in field_key_list}
+field_key_list = []
+field_key_index = {}
+# [('key=', hex) or None for the reserved keys, ...] in the order of field_key_list
+field_text_spec = []
+
+# The values of the fields of one bin are kept in an array in the order of
+# field_key_list, so a bin takes a few KB instead of a dict of all the fields.
+u32_typecode = 'I' if array('I').itemsize >= 4 else 'L'
+
+
+# word offset of sdram_head_info_v0 from 'start tag'
+head_v0_word_base = sdram_head_info_v0[0][0] // 4
+
+# u32 words of struct rk3528_skew_info after 'skew_sub_version', like 'ddr3_ca_skew_0'
+rk3528_skew_words = [group + '_' + name for group in rk3528_skew_info if group != 'skew_sub_version'
+    for name in rk3528_ca_skew]
+
+start_tag = 0x12345678
+
+field_spec_cache = {}
+head_codec_cache = {}
+
+
+def get_base_info_full():
+    """build base_info_full from base_info_table on the first use"""
+    if len(base_info_full) != 0:
+        return base_info_full
+
+    for line in base_info_table.split('\n'):
+        if line.strip() == '':
+            continue
+        item = [column.strip() for column in line.split(',')]
+        v0_info = None
+        if len(item) > 7:
+            v0_info = tuple(int(column, 0) for column in item[7].split())
+        field_key_index[item[0]] = len(field_key_list)
+        field_key_list.append(item[0])
+        # num_base, index and position are shared by many fields
+        base_info_full[item[0]] = FieldSpec(item[0], sys.intern(item[1]), sys.intern(item[2]),
+            sys.intern(item[3]), int(item[4], 0), int(item[5], 0), int(item[6]), v0_info)
+
+    return base_info_full
+
+
+def get_field_text_spec():
+    """build field_text_spec for the txt of gen_param_text() on the first use"""
+    if len(field_text_spec) == 0:
+        base_info = get_base_info_full()
+        field_text_spec.extend(None if "reserved" in key else (key + '=', base_info[key].num_base == 'hex')
+            for key in field_key_list)
+    return field_text_spec
+
+
+def get_head_index_list(version):
+    index_list = list(sdram_head_info_index_v2)
+    if version >= 3:
+        index_list += list(sdram_head_info_index_v2_3)
+    if version >= 4:
+        index_list += list(sdram_head_info_index_v3_4)
+
+    return index_list
+
+
+def get_head_info_struct(version):
+    if version < 5:
+        return sdram_head_info_v2
+    return sdram_head_info_v5
+
+
+def compile_field_spec(version, skew_en):
+    """
+    Flatten base_info_full for one header version into (key, index_name, word, shift, mask).
+    version 0/1: word is the u32 offset from 'start tag', index_name is 'null'.
+    version 2~5: word is the u32 position inside the struct of index_name,
+    skew fields count from the first word after 'skew_sub_version'.
+    The result is cached, it only depends on the version and rk3528 skew support.
+    """
+    spec_key = (version, skew_en)
+    if spec_key in field_spec_cache:
+        return field_spec_cache[spec_key]
+
+    field_spec = []
+    if version < 2:
+        v0_offset_list = [info[0] for info in sdram_head_info_v0]
+        for key, value in get_base_info_full().items():
+            if value.version <= version and value.v0_info[0] in v0_offset_list:
+                field_spec.append((key, 'null', value.v0_info[0] // 4, value.v0_info[1], value.v0_info[2]))
+    else:
+        head_info = get_head_info_struct(version)
+        for key, value in get_base_info_full().items():
+            index_name = value.index
+            if value.version > version or index_name == 'null':
+                continue
+            if 'skew' not in index_name:
+                position_list = list(head_info.get(index_name[:-6] + '_info', {}))
+                if value.position in position_list:
+                    field_spec.append((key, index_name, position_list.index(value.position),
+                        value.shift, value.mask))
+            elif skew_en and value.position in rk3528_skew_words:
+                field_spec.append((key, index_name, rk3528_skew_words.index(value.position),
+                    value.shift, value.mask))
+
+    field_spec_cache[spec_key] = field_spec
+    return field_spec
+
+
+class SdramHeadCodec:
+    """
+    Word layout of one sdram header, resolved from the version and the index table
+    read from the bin. Every word offset is counted in u32 from 'start tag', the
+    whole header is decoded by a single struct.unpack_from().
+    """
+
+    def __init__(self, version, index_table, skew_en):
+        self.version = version
+        # {index_name: first word}, {index_name: word number}
+        self.word_base = {}
+        self.word_num = {}
+        # [(key, word, shift, mask), ...]
+        self.fields = []
+        # rk3528 skew_info, decoded only when skew_sub_version is 0x1
+        self.skew_word = 0
+        self.skew_fields = []
+        self.skew_write_num = 0
+
+        field_spec = compile_field_spec(version, skew_en)
+        if version < 2:
+            span = head_v0_word_base + len(sdram_head_info_v0)
+            self.word_base['null'] = 0
+            self.word_num['null'] = span
+        else:
+            head_info = get_head_info_struct(version)
+            span = 2
+            for index_name, (offset, size) in zip(get_head_index_list(version), index_table):
+                if offset == 0:
+                    continue
+                if 'skew' not in index_name:
+                    head_info_name = index_name[:-6] + '_info'
+                    if head_info_name not in head_info:
+                        continue
+                    self.word_num[index_name] = min(size, len(head_info[head_info_name]))
+                    self.word_base[index_name] = offset
+                    span = max(span, offset + self.word_num[index_name])
+                else:
+                    self.skew_word = offset
+                    span = max(span, offset + 1)
+                    if skew_en:
+                        self.skew_write_num = min(len(rk3528_skew_words), size)
+                        span = max(span, offset + 1 + len(rk3528_skew_words))
+
+        for key, index_name, word, shift, mask in field_spec:
+            if 'skew' in index_name:
+                if self.skew_word != 0:
+                    self.skew_fields.append((key, self.skew_word + 1 + word, shift, mask))
+            elif index_name in self.word_base and word < self.word_num[index_name]:
+                self.fields.append((key, self.word_base[index_name] + word, shift, mask))
+
+        self.struct = struct.Struct('<{}I'.format(span))
+        # [(position in field_key_list, word, shift, mask), ...]
+        self.decode_list = [(field_key_index[key], word, shift, mask) for key, word, shift, mask in self.fields]
+        self.skew_decode_list = [(field_key_index[key], word, shift, mask)
+            for key, word, shift, mask in self.skew_fields]
+        self.zero_values = array(u32_typecode, [0]) * len(field_key_list)
+        self.zero_values[field_key_index['start tag']] = start_tag
+
+    def skew_valid(self, words):
+        return self.skew_word != 0 and self.skew_fields and (words[self.skew_word] & 0xff) == 0x1
+
+    def read_words(self, buf, tag_offset):
+        """return the u32 words of the header as an array"""
+        return array(u32_typecode, self.struct.unpack_from(buf, tag_offset))
+
+    def decode(self, words):
+        """return the values of all keys in field_key_list as an array, the missing fields are 0"""
+        values = self.zero_values[:]
+        for index, word, shift, mask in self.decode_list:
+            values[index] = (words[word] >> shift) & mask
+        if self.skew_valid(words):
+            for index, word, shift, mask in self.skew_decode_list:
+                values[index] = (words[word] >> shift) & mask
+
+        return values
+
+    def get_field_layout(self, words):
+        """return {key: (word, shift, mask)} of the fields in this header"""
+        field_layout = {key: (word, shift, mask) for key, word, shift, mask in self.fields}
+        if self.skew_valid(words):
+            field_layout.update({key: (word, shift, mask) for key, word, shift, mask in self.skew_fields})
+        return field_layout
+
+    def apply_patch_plan(self, plan_list, words):
+        """
+        plan_list: [(index_name, word, clear_mask, set_bits), ...] from compile_patch_plan()
+        return [(word, u32), ...] to write back, the words not in this header are skipped.
+        """
+        new_words = {}
+        skew_valid = self.skew_valid(words)
+        for index_name, word, clear_mask, set_bits in plan_list:
+            if 'skew' in index_name:
+                if not skew_valid or word >= self.skew_write_num:
+                    continue
+                word += self.skew_word + 1
+            elif index_name in self.word_base and word < self.word_num[index_name]:
+                word += self.word_base[index_name]
+            else:
+                continue
+            new_words[word] = (new_words.get(word, words[word]) & ~clear_mask) | set_bits
 
+        return sorted(new_words.items())
 
-def bin_data_2_info(info_from_bin, read_out, ddrbin_index, version, info_from_txt):
-    info_from_bin['start tag']['value'] = 0x12345678
 
+def get_head_codec(content, tag_offset, version, chip):
+    """Look up the codec of the header at tag_offset, it is shared by the bins with the same index table."""
+    skew_en = (chip == 'rk3528')
     if version < 2:
-        for key, value in info_from_bin.items():
-            if value['version'] <= version:
-                for i in range(len(read_out)):
-                    # read_out is sdram_head_info_v0 = [[offset, value], ...]
-                    # info_from_bin v0_info = [offset, shift, mask]
-                    if value['v0_info'][0] == read_out[i][0]:
-                        temp_value = (read_out[i][1] >> value['v0_info'][1]) & value['v0_info'][2]
-                        info_from_bin[key]['value'] = temp_value
-                        #print(f"D: {key} = {value} {hex(value['v0_info'][0])}={read_out[i][1]}")
-    elif version <= version_max:
-        for index_name in ddrbin_index:
-            head_info_name = index_name[:-6]+'_info'
-            if ddrbin_index[index_name]['offset'] != 0 and 'skew' not in index_name:
-                for key, value in info_from_bin.items():
-                    if value['index'] == index_name and value['version'] <= version:
-                        temp_value = read_out[head_info_name][value['position']]
-                        temp_value = (temp_value >> value['shift']) & value['mask']
-                        info_from_bin[key]['value'] = temp_value
-                        #print(f"D: {key} = {value} {value['position']}={temp_value}")
-            elif ddrbin_index[index_name]['offset'] != 0 and 'skew' in index_name:
-                if chip_info == 'rk3528':
-                    for key, value in info_from_bin.items():
-                        if value['index'] == index_name and value['version'] <= version:
-                            position_1 = value['position'][ : value['position'].find('_')]
-                            position_2 = value['position'][value['position'].find('_') + 1 : ]
-                            # read_out is sdram_head_info_v2 or sdram_head_info_v5
-                            if position_1 in list(read_out[head_info_name].keys()):
-                                temp_value = read_out[head_info_name][position_1][position_2]
-                                temp_value = (temp_value >> value['shift']) & value['mask']
-                                info_from_bin[key]['value'] = temp_value
-                                #print(f"D: {key} = {value} {value['position']}={temp_value}")
+        index_table = ()
+    else:
+        index_num = len(get_head_index_list(version))
+        index_bytes = bytes(content[tag_offset + 8 : tag_offset + 8 + index_num * 2])
+        if len(index_bytes) != index_num * 2:
+            return None
+        index_table = tuple(zip(index_bytes[0::2], index_bytes[1::2]))
+
+    codec_key = (version, index_table, skew_en)
+    if codec_key not in head_codec_cache:
+        head_codec_cache[codec_key] = SdramHeadCodec(version, index_table, skew_en)
+
+    return head_codec_cache[codec_key]
+
+
+def get_field_max(key):
+    """the max value of a field in all header versions"""
+    value = get_base_info_full()[key]
+    field_max = value.mask
+    if value.v0_info is not None:
+        field_max = max(field_max, value.v0_info[2])
+    return field_max
+
+
+def compile_patch_plan(update_info, version):
+    """
+    Compile the parameters to update into [(index_name, word, clear_mask, set_bits), ...]
+    for one header version, index_name and word are the same as compile_field_spec().
+    A bin is patched by word = (word & ~clear_mask) | set_bits, the bits not in
+    update_info are kept.
+    """
+    plan = {}
+    for key, index_name, word, shift, mask in compile_field_spec(version, True):
+        if key in update_info:
+            clear_mask, set_bits = plan.get((index_name, word), (0, 0))
+            plan[(index_name, word)] = (clear_mask | (mask << shift),
+                set_bits | ((update_info[key] & mask) << shift))
+
+    return [(index_name, word, clear_mask, set_bits)
+        for (index_name, word), (clear_mask, set_bits) in plan.items()]
+
+
+def save_patch_plan(plan_path, update_info, tag=start_tag):
+    """
+    Save the patch plans of all header versions, it is used as ddrbin_param.txt
+    for function 1 and no need to parse the txt again.
+    """
+    plan_info = {
+        'tool': tool_version,
+        'start tag': tag,
+        'param': update_info,
+        'plan': {str(version): compile_patch_plan(update_info, version) for version in range(version_max + 1)},
+    }
+    try:
+        with open(plan_path, 'w', encoding='utf-8') as file:
+            json.dump(plan_info, file)
+    except Exception:
+        print("The file {} write failed".format(plan_path))
+        return -1
 
     return 0
 
 
-def modefy_2_bin_data(info_from_txt, write_in, ddrbin_index, version):
-    global rk3528_skew_info
+def ddrbin_compile(argc, argv):
+    """./ddrbin_tool compile ddrbin_param.txt plan.json"""
+    if argc != 4:
+        print("The number of parameters error")
+        print_help()
+        return -1
+
+    ddrbin = DdrBin()
+    if ddrbin.load_param(argv[2]) != 0:
+        return -1
+    if save_patch_plan(argv[3], ddrbin.update_info, ddrbin.start_tag) != 0:
+        return -1
 
-    if version < 2:
-        for key, value in info_from_txt.items():
-            if value['version'] <= version:
-                for i in range(len(write_in)):
-                    if value['v0_info'][0] == write_in[i][0]:
-                        write_in[i][1] |= (value['value'] << value['v0_info'][1])
-    elif version <= version_max:
-        for index_name in ddrbin_index:
-            head_info_name = index_name[:-6]+'_info'
-            if ddrbin_index[index_name]['offset'] != 0 and 'skew' not in index_name:
-                position_name = 'null'
-                for key, value in info_from_txt.items():
-                    if value['index'] == index_name and value['version'] <= version:
-                        if position_name != value['position']:
-                            position_name = value['position']
-                            position_value = 0
-                        position_value |= (value['value'] << value['shift'])
-                        write_in[head_info_name][value['position']] = position_value
-                        #print(f"D: {key} = {value}, {value['position']}={position_value}")
-            elif ddrbin_index[index_name]['offset'] != 0 and 'skew' in index_name:
-                if chip_info == 'rk3528':
-                    write_in.update({'skew_info' : rk3528_skew_info})
-                    if rk3528_skew_info['skew_sub_version'] == 0x1:
-                        for key, value in info_from_txt.items():
-                            if value['index'] == index_name and value['version'] <= version:
-                                position_1 = value['position'][ : value['position'].find('_')]
-                                position_2 = value['position'][value['position'].find('_') + 1 : ]
-                                if position_1 in list(write_in[head_info_name].keys()):
-                                    temp_value =  write_in[head_info_name][position_1][position_2]
-                                    temp_value &= ~(value['mask'] << value['shift'])
-                                    temp_value |= value['value'] << value['shift']
-                                    write_in[head_info_name][position_1][position_2] = temp_value
-                                    #print(f"D: {key} = {value}, {temp_value}")
-
-    #print(f"D: write_in = {write_in}")
+    print("compile {} to {} ok.".format(argv[2], argv[3]))
     return 0
 
 
-def write_in_bin_data_v2(filebin, bin_skew_offset, write_in, ddrbin_index, info_from_txt, version):
-    for index_name in ddrbin_index:
-        head_info_name = index_name[:-6]+'_info'
-        if ddrbin_index[index_name]['offset'] != 0 and 'skew' not in index_name:
-            filebin.seek(bin_skew_offset + (ddrbin_index[index_name]['offset'] - 1) * 4)
-            index_size = ddrbin_index[index_name]['size']
-            for key in write_in[head_info_name]:
-                if index_size > 0:
-                    try:
-                        filebin.write(write_in[head_info_name][key].to_bytes(4,byteorder='little'))
-                        #print(f"D: {head_info_name} {key} = {write_in[head_info_name][key]}")
-                        index_size -= 1
-                    except:
-                        print("write bin {} to file fail".format(head_info_name))
-                        return -1
-        elif ddrbin_index[index_name]['offset'] != 0 and 'skew' in index_name:
-            if chip_info == 'rk3528' and write_in[head_info_name]["skew_sub_version"] == 1:
-                filebin.seek(bin_skew_offset + (ddrbin_index[index_name]['offset'] - 1) * 4)
-                index_size = ddrbin_index[index_name]['size']
-                for key in write_in[head_info_name]:
-                    if key == 'skew_sub_version':
-                        temp_value = write_in[head_info_name]["skew_sub_version"]
-                        filebin.write(temp_value.to_bytes(4,byteorder='little'))
-                        continue
-                    for key_1 in write_in[head_info_name][key]:
-                        if index_size > 0:
-                            try:
-                                temp_value = write_in[head_info_name][key][key_1]
-                                #print(f"D: {head_info_name} {key}.{key_1} = {temp_value}")
-                                filebin.write(temp_value.to_bytes(4,byteorder='little'))
-                                index_size -= 1
-                            except:
-                                print("write bin {} to file fail".format(head_info_name))
-                                return -1
+# 'DDR ' is before ',fwver:' within this distance in the version information
+verinfo_max_length = 100
 
-    return 0
 
+def find_all(content, pattern):
+    """return the offsets of every pattern in content, they do not overlap"""
+    position_list = []
+    position = content.find(pattern)
+    while position >= 0:
+        position_list.append(position)
+        position = content.find(pattern, position + len(pattern))
+    return position_list
 
-#info from bin + info from txt generate to loader parameters
-def txt_data_2_bin_data(info_from_txt, info_from_bin, ddrbin_index, write_in, version):
-    print("\nnew bin config:")
 
-    for key, value in info_from_txt.items():
-        if key == 'start tag':
-            continue
-        if (info_from_txt[key]['value'] == 0) and (key not in update_key_list):
-            info_from_txt[key]['value'] = info_from_bin[key]['value']
+def scan_ddrbin_header(content, tag=start_tag):
+    """
+    Find the 'start tag', 'DDR ' and ',fwver:' in content, every pattern is searched by
+    find(), it is much faster than a regular expression on the large images.
+    return (tag_list, verinfo_list):
+        tag_list: [(offset, version), ...] of every 'start tag', the version may be invalid.
+        verinfo_list: [(offset of 'DDR ', offset of ',fwver:'), ...], ',fwver:' is the
+        first one after 'DDR ' and within verinfo_max_length.
+    """
+    tag_list = [(position, int.from_bytes(content[position + 4: position + 8], byteorder='little'))
+        for position in find_all(content, struct.pack('<I', tag))]
+
+    verinfo_list = []
+    ddr_position_list = find_all(content, b'DDR ')
+    index = 0
+    for position in find_all(content, b',fwver:'):
+        while index < len(ddr_position_list) and ddr_position_list[index] < position:
+            if position - ddr_position_list[index] < verinfo_max_length:
+                verinfo_list.append((ddr_position_list[index], position))
+            index += 1
+
+    return tag_list, verinfo_list
+
+
+param_file_cache = {}
+
+
+def parse_param_line(line):
+    """
+    Parse one line of ddrbin_param.txt.
+    return None if it is a comment or not 'key=', (key, None) if the value is blank,
+    or (key, value). ValueError(key, value) is raised if the key or the value is invalid.
+    """
+    if '/*' in line or '=' not in line:
+        return None
+
+    index_of_line = line.find('=')
+    key = line[ : index_of_line]
+    if line[index_of_line : ].strip() == '=':
+        return key, None
+
+    value = line[index_of_line + 1 : ]
+    try:
+        if '0x' in value:
+            value = int(value[2:], 16)
         else:
-            if info_from_txt[key]['num_base'] == 'hex':
-                print("{}: {}".format(key, hex(info_from_txt[key]['value'])))
+            value = int(value)
+    except ValueError:
+        raise ValueError(key, value)
+
+    if key not in get_base_info_full():
+        raise ValueError(key, value)
+    if key != 'start tag' and (value < 0 or value > get_field_max(key)):
+        raise ValueError(key, value)
+    return key, value
+
+
+def read_param_file(param_path):
+    """
+    Parse ddrbin_param.txt or a patch plan file.
+    return (start tag or None, {key: value}, {version: plan_list}) or None if fail
+    """
+    update_info = {}
+    hot = 0
+    info_dict_key = ''
+    info_dict_value = ''
+    try:
+        with open(param_path, 'r', encoding='UTF-8') as file:
+            text = file.read()
+
+        if text.lstrip().startswith('{'):
+            plan_info = json.loads(text)
+            update_info = {key: int(value) for key, value in plan_info['param'].items()}
+            if plan_info['tool'] == tool_version:
+                patch_plan = {int(version): [tuple(plan) for plan in plan_list]
+                    for version, plan_list in plan_info['plan'].items()}
             else:
-                print("{}: {}".format(key, info_from_txt[key]['value']))
-    #print(info_from_txt)
+                patch_plan = {}
+            return plan_info['start tag'], update_info, patch_plan
+
+        for line in text.splitlines():
+            try:
+                param = parse_param_line(line)
+            except ValueError as e:
+                info_dict_key, info_dict_value = e.args
+                raise
+            if param is None:
+                continue
 
-    modefy_2_bin_data(info_from_txt, write_in, ddrbin_index, version)
+            if param[1] is not None:
+                update_info[param[0]] = param[1]
+            hot = hot + 1
+    except (KeyError, ValueError):
+        print("KeyError or ValueError: {}={}".format(info_dict_key, info_dict_value))
+        return None
+    except Exception:
+        print("The file {} read failed".format(param_path))
+        return None
+
+    if hot == 0:
+        print("Failed to read DRAM parameters from the file")
+        return None
+
+    return update_info.pop('start tag', None), update_info, {}
+
+
+def write_file_atomic(path, data):
+    """
+    Write data to a temporary file next to path, fsync it and rename it to path,
+    the file keeps its mode. The file is not touched if it has the same data.
+    return 1 if the file is written, 0 if it is not changed.
+    """
+    path = os.path.realpath(path)
+    # like /dev/null, it can not be renamed
+    if os.path.exists(path) and not os.path.isfile(path):
+        with open(path, 'wb') as file:
+            file.write(data)
+        return 1
 
-    return 0
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as file:
+                if file.read() == data:
+                    return 0
+    except OSError:
+        pass
+
+    temp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return 1
+
+
+def get_source_date_epoch():
+    """return $SOURCE_DATE_EPOCH as an int, None if it is not set or not a number"""
+    try:
+        return int(os.environ['SOURCE_DATE_EPOCH'])
+    except (KeyError, ValueError):
+        return None
+
+
+class PhaseProfiler:
+    """
+    The wall time and the tracemalloc peak of every phase, enabled by --profile.
+    The peak is the memory allocated in the phase above the memory at its start,
+    the phases are not nested.
+    like:
+        with tool_profiler.phase('tag search'):
+            scan_ddrbin_header(content)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # {name: [count, seconds, peak bytes]}
+        self.phase_info = {}
+        self.phase_name = ''
+        self.load_reported = False
+        self.start_time = 0
+        self.start_memory = 0
+        # tracemalloc is imported by start(), it is slow to import
+        self.tracemalloc = None
+
+    def start(self):
+        import tracemalloc
+
+        self.tracemalloc = tracemalloc
+        self.enabled = True
+        self.phase_info = {}
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        self.enabled = False
+        if self.tracemalloc.is_tracing():
+            self.tracemalloc.stop()
+
+    def add(self, name, seconds, peak=0):
+        info = self.phase_info.setdefault(name, [0, 0.0, 0])
+        info[0] += 1
+        info[1] += seconds
+        info[2] = max(info[2], peak)
+
+    def phase(self, name):
+        self.phase_name = name
+        return self
+
+    def __enter__(self):
+        if self.enabled:
+            self.start_memory = self.tracemalloc.get_traced_memory()[0]
+            # python 3.9 or later
+            if hasattr(self.tracemalloc, 'reset_peak'):
+                self.tracemalloc.reset_peak()
+            self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.enabled:
+            seconds = time.perf_counter() - self.start_time
+            peak = self.tracemalloc.get_traced_memory()[1] - self.start_memory
+            self.add(self.phase_name, seconds, max(peak, 0))
+
+    def report(self):
+        print("\nprofile:")
+        print("{:<16} {:>6} {:>12} {:>12}".format('phase', 'count', 'time(ms)', 'peak(KB)'))
+        total = 0.0
+        for name, (count, seconds, peak) in self.phase_info.items():
+            total += seconds
+            print("{:<16} {:>6} {:>12.3f} {:>12.1f}".format(name, count, seconds * 1000, peak / 1024))
+        print("{:<16} {:>6} {:>12.3f}".format('total', '', total * 1000))
+
+
+tool_profiler = PhaseProfiler()
+
+
+class DdrBin:
+    """
+    The sdram header of one ddr bin, all the state is kept in the object,
+    so many bins can be handled in one process.
+    like:
+        ddrbin = DdrBin('rk3588')
+        ddrbin.open('rk3588_ddr_lp4_2112MHz_lp5_2400MHz_v1.18.bin')
+        ddrbin.parse()
+        ddrbin.get('uart baudrate')
+        ddrbin.set('uart baudrate', 1500000)
+        ddrbin.save()
+        ddrbin.close()
+    The methods return 0 on success and -1 on fail like ddrbin_tool().
+    """
+
+    def __init__(self, chip='null'):
+        self.chip = chip if chip in chip_list else 'others chip'
+        self.path = ''
+        self.content = b''
+        self.file = None
+        self.version_old_hit = 0
+        self.start_tag = start_tag
+
+        self.tag_list = []
+        self.verinfo_list = []
+        self.tag_offset = -1
+        # the offset of the content in the file, it is not 0 for the headers found by --scan
+        self.content_offset = 0
+        self.version = -1
+        self.codec = None
+        self.read_out = ()
+        # the values of field_key_list decoded from the bin
+        self.field_values = array(u32_typecode)
+        # the parameters to update, set from ddrbin_param.txt or set()
+        self.update_info = {}
+        # {version: plan_list} compiled from update_info
+        self.patch_plan = {}
+        # used for verinfo_editable when it is not given, set by set_verinfo_stamp()
+        self.verinfo_stamp = ''
+
+        self.verinfo_full = ''
+        self.verinfo_full_offset = 0
+        self.verinfo_full_length = 0
+        self.verinfo_editable_offset = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, path, use_mmap=False, write=False):
+        """
+        path: the bin file, '-' is stdin.
+        use_mmap: map the file instead of reading it, the header is decoded and
+        patched in place on the mapping, it is used for the large images.
+        write: map the file writable, it is needed by save() when use_mmap.
+        Without write the mapping is copy on write, patch() changes only the
+        memory of the tool and the file is never touched, like for --output.
+        """
+        self.close()
+        if path == '-':
+            self.load(sys.stdin.buffer.read(), path)
+            return 0
+
+        try:
+            if use_mmap:
+                file = open(path, 'rb+' if write else 'rb')
+                try:
+                    content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if write else mmap.ACCESS_COPY)
+                except Exception:
+                    file.close()
+                    raise
+            else:
+                with open(path, 'rb') as file:
+                    content = bytearray(file.read())
+        except Exception:
+            print("The file {} read failed".format(path))
+            return -1
+
+        self.load(content, path)
+        if use_mmap:
+            self.file = file
+        return 0
+
+    def close(self):
+        if self.file is not None:
+            self.content.close()
+            self.file.close()
+            self.file = None
+            self.content = b''
+
+    def load(self, content, path=''):
+        """
+        use the bin content already in memory, path is only used to save.
+        The content is patched in place if it is a bytearray or a writable mmap.
+        """
+        self.path = path
+        self.content = content if isinstance(content, (bytearray, mmap.mmap)) else bytearray(content)
+        self.version_old_hit = 0
+        for key in version_old_list:
+            # there is no file name for stdin, check the chip
+            if key in path or (path == '-' and key == self.chip):
+                self.version_old_hit = 1
+
+        self.tag_list = []
+        self.verinfo_list = []
+        self.tag_offset = -1
+        self.content_offset = 0
+        self.version = -1
+        self.codec = None
+        self.read_out = ()
+        # the values of field_key_list decoded from the bin
+        self.field_values = array(u32_typecode)
+        self.verinfo_full = ''
+        self.verinfo_full_offset = 0
+        self.verinfo_full_length = 0
+        self.verinfo_editable_offset = 0
+
+    def load_param(self, param_path):
+        """
+        Read the parameters that need to be modified from the txt file, or from
+        the patch plan saved by 'ddrbin_tool compile'. The parsed file is kept
+        in param_file_cache, so it is parsed once in a process.
+        """
+        try:
+            stat = os.stat(param_path)
+            cache_key = (os.path.abspath(param_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            print("The file {} read failed".format(param_path))
+            return -1
 
+        if cache_key not in param_file_cache:
+            param_info = read_param_file(param_path)
+            if param_info is None:
+                return -1
+            param_file_cache[cache_key] = param_info
 
-def bin_data_readout(filebin, ddrbin_index, read_out, bin_skew_offset, version, info_from_txt):
-    global rk3528_skew_info
+        tag, update_info, patch_plan = param_file_cache[cache_key]
+        if tag is not None:
+            self.start_tag = tag
+        if len(self.update_info) == 0:
+            self.patch_plan = patch_plan
+        else:
+            self.patch_plan = {}
+        self.update_info.update(update_info)
+        return 0
+
+    def parse(self):
+        content = self.content
+        with tool_profiler.phase('tag search'):
+            self.tag_list, self.verinfo_list = scan_ddrbin_header(content, self.start_tag)
+
+        valid_tag_list = [tag for tag in self.tag_list if tag[1] <= version_max]
+        if len(valid_tag_list) == 0:
+            if len(self.tag_list) == 0:
+                print("Find the 'start tag' in the ddrbin file failed")
+            else:
+                version = self.tag_list[-1][1]
+                print("version = {}, invalid.".format(version))
+                if version > version_max and version < (version_max + 5):
+                    print("Please check if there is a new version of the tool available.")
+            return -1
 
-    if version < 2:
-        for i in range(len(read_out)):
+        self.tag_offset, version = valid_tag_list[0]
+        self.version = version
+
+        # get ddrbin version information from bin file
+        # eg: DDR 03ea844c5d typ 24/09/03-10:42:57,fwver: v1.23
+        with tool_profiler.phase('verinfo search'):
+            for position, position_1 in self.verinfo_list:
+                if content[position_1 - verinfo_editable_length - 1] == ord(' '):
+                    verinfo_full = content[position: position_1+30].decode('utf-8', errors='replace')
+                    verinfo_full = verinfo_full[:verinfo_full.find('\n')]
+                    self.verinfo_editable_offset = position_1 - verinfo_editable_length
+                    self.verinfo_full_offset = position
+                    self.verinfo_full_length = len(verinfo_full.encode('utf-8'))
+                    self.verinfo_full = verinfo_full
+                    break
+
+        with tool_profiler.phase('field table'):
+            self.codec = get_head_codec(content, self.tag_offset, version, self.chip)
+        if self.codec is None:
+            print("readout ddrbin_index fail")
+            return -1
+
+        try:
+            with tool_profiler.phase('readout'):
+                self.read_out = self.codec.read_words(content, self.tag_offset)
+        except struct.error:
+            print("read bin file fail")
+            return -1
+
+        with tool_profiler.phase('decode'):
+            self.field_values = self.codec.decode(self.read_out)
+        return 0
+
+    @property
+    def info_from_bin(self):
+        """{key: value} decoded from the bin, it is built from field_values every time"""
+        return dict(zip(field_key_list, self.field_values))
+
+    def get(self, key):
+        if key in self.update_info:
+            return self.update_info[key]
+        return self.field_values[field_key_index[key]]
+
+    def set(self, key, value):
+        if key not in get_base_info_full() or key == 'start tag':
+            raise KeyError(key)
+        if value < 0 or value > get_field_max(key):
+            raise ValueError("{}={} out of range".format(key, value))
+        self.update_info[key] = value
+        self.patch_plan = {}
+
+    def get_info(self):
+        """info from bin + info to update"""
+        new_info = self.info_from_bin.copy()
+        new_info.update(self.update_info)
+        return new_info
+
+    def get_verinfo(self):
+        return self.content[self.verinfo_full_offset : self.verinfo_full_offset +
+            self.verinfo_full_length].decode('utf-8', errors='replace')
+
+    def gen_param_text(self, gen_format='txt'):
+        """
+        return the config of the bin as text.
+        txt: key=value like ddrbin_param.txt.
+        json: one object with the header information and the list of fields.
+        jsonl: the header information in the first line, then one field per line.
+        The fields in json and jsonl have the offset in the file, the u32 word,
+        shift and mask, the offset is null if the field is not in this header.
+        """
+        base_info = get_base_info_full()
+        if gen_format == 'txt':
+            write_buff = ['/* ' + self.verinfo_full + ' */']
+            for text_spec, value in zip(get_field_text_spec(), self.field_values):
+                if text_spec is None:
+                    continue
+                write_buff.append(text_spec[0] + (hex(value) if text_spec[1] else str(value)))
+            write_buff.append('end')
+            return '\n'.join(write_buff) + '\n'
+
+        head_info = {
+            'file': self.path,
+            'chip': self.chip,
+            'version': self.version,
+            'tag_offset': self.content_offset + self.tag_offset,
+            'verinfo': self.verinfo_full,
+        }
+        field_layout = self.codec.get_field_layout(self.read_out)
+        field_list = []
+        for key, value in zip(field_key_list, self.field_values):
+            if "reserved" in key or key == 'start tag':
+                continue
+            field_info = {'name': key, 'value': value, 'num_base': base_info[key].num_base,
+                'offset': None, 'word': None, 'shift': None, 'mask': None}
+            if key in field_layout:
+                word, shift, mask = field_layout[key]
+                field_info.update({'offset': self.content_offset + self.tag_offset + word * 4,
+                    'word': self.read_out[word],
+                    'shift': shift, 'mask': mask})
+            field_list.append(field_info)
+
+        if gen_format == 'json':
+            head_info['fields'] = field_list
+            return json.dumps(head_info, indent=1) + '\n'
+
+        write_buff = [json.dumps(head_info)]
+        write_buff += [json.dumps(field_info) for field_info in field_list]
+        return '\n'.join(write_buff) + '\n'
+
+    def gen_param(self, filegen_path, gen_format='txt'):
+        try:
+            with open(filegen_path, 'w', encoding='utf-8') as file:
+                file.write(self.gen_param_text(gen_format))
+        except Exception:
+            return -1
+
+        return 0
+
+    def patch(self, verinfo_editable=''):
+        """
+        Write the parameters to update into self.content.
+        return [(offset, bytes), ...] which are changed in the content, the words
+        which already have the new value are not in it. The date & time is used
+        for verinfo_editable if it is '', it is only stamped when a word is changed,
+        so the list is empty if the bin is not changed.
+        """
+        content = self.content
+        patch_list = []
+        if self.version not in self.patch_plan:
+            with tool_profiler.phase('patch plan'):
+                self.patch_plan[self.version] = compile_patch_plan(self.update_info, self.version)
+        with tool_profiler.phase('patch'):
+            for word, temp_value in self.codec.apply_patch_plan(self.patch_plan[self.version], self.read_out):
+                # the old chips keep the ddr frequency words
+                if self.version < 2 and self.version_old_hit == 1 and word < head_v0_word_base + 3:
+                    continue
+                offset = self.tag_offset + word * 4
+                data = temp_value.to_bytes(4, byteorder='little')
+                if content[offset : offset + 4] != data:
+                    patch_list.append((offset, data))
+
+        # update ddrbin version information
+        if self.verinfo_editable_offset != 0 and (verinfo_editable != '' or len(patch_list) != 0):
+            if verinfo_editable == '':
+                verinfo_editable = self.verinfo_stamp
+            if verinfo_editable == '':
+                current_time = datetime.now()
+                verinfo_editable = current_time.strftime("%y/%m/%d-%H:%M.%S")
+            if len(verinfo_editable) < verinfo_editable_length:
+                verinfo_editable = verinfo_editable.ljust(verinfo_editable_length)
+
+            verinfo_editable_bytes = verinfo_editable.encode('utf-8')[:verinfo_editable_length]
+            offset = self.verinfo_editable_offset
+            if content[offset : offset + len(verinfo_editable_bytes)] != verinfo_editable_bytes:
+                patch_list.append((offset, verinfo_editable_bytes))
+
+        for offset, data in patch_list:
+            content[offset : offset + len(data)] = data
+
+        return patch_list
+
+    def set_verinfo_stamp(self, mode='date'):
+        """
+        Set the text which replaces the date & time in the version information
+        when the bin is changed and verinfo_editable is not given.
+        date: the current date & time.
+        epoch: the date & time of $SOURCE_DATE_EPOCH in UTC.
+        hash: the first 17 hex digits of the sha256 of the bin and the parameters.
+        epoch and hash give the same bin for the same inputs, call it before patch().
+        """
+        if mode == 'date':
+            self.verinfo_stamp = ''
+        elif mode == 'epoch':
+            epoch = get_source_date_epoch()
             try:
-                read_out[i][1] = int.from_bytes(filebin.read(4), byteorder='little')
-                #print(f"D: read_out {hex(read_out[i][0])} = {read_out[i][1]}")
-            except:
-                print("read bin file fail")
+                stamp_time = datetime.fromtimestamp(epoch, timezone.utc)
+            except (TypeError, ValueError, OverflowError, OSError):
+                print("SOURCE_DATE_EPOCH is not set or invalid")
                 return -1
-    elif version <= version_max:
-        for index_name in ddrbin_index:
-            head_info_name = index_name[:-6]+'_info'
-            if ddrbin_index[index_name]['offset'] != 0 and 'skew' not in index_name:
-                filebin.seek(bin_skew_offset + (ddrbin_index[index_name]['offset'] - 1) * 4)
-                index_size = ddrbin_index[index_name]['size']
-                for key in read_out[head_info_name]:
-                    if index_size > 0:
-                        try:
-                            temp_value = int.from_bytes(filebin.read(4), byteorder='little')
-                            read_out[head_info_name][key] = temp_value
-                            #print(f"D: {head_info_name} {key} = {read_out[head_info_name][key]}")
-                            index_size -= 1
-                        except:
-                            print("read {} from bin file fail".format(head_info_name))
-                            return -1
-            elif ddrbin_index[index_name]['offset'] != 0 and 'skew' in index_name:
+            self.verinfo_stamp = stamp_time.strftime("%y/%m/%d-%H:%M.%S")
+        elif mode == 'hash':
+            import hashlib
+
+            param_info = {
+                'start tag': self.start_tag,
+                'param': sorted(self.update_info.items()),
+                'version_old_hit': self.version_old_hit,
+            }
+            bin_hash = hashlib.sha256(self.content)
+            bin_hash.update(json.dumps(param_info, sort_keys=True).encode('utf-8'))
+            self.verinfo_stamp = bin_hash.hexdigest()[:verinfo_editable_length]
+        else:
+            print("The verinfo_stamp {} is not support".format(mode))
+            return -1
+
+        return 0
+
+    def save(self, verinfo_editable=''):
+        """
+        Write the modified bin to the file. The whole bin is written to a temporary
+        file and renamed to the bin, so a crash never leaves a half patched bin.
+        With --mmap the changed words are patched in place on the mapping.
+        Nothing is written if the bin is not changed.
+        """
+        try:
+            patch_list = self.patch(verinfo_editable)
+            if len(patch_list) == 0:
+                print("The bin is not changed, skip the write back")
+                return 0
+            with tool_profiler.phase('write back'):
+                if self.file is not None:
+                    self.content.flush()
+                else:
+                    write_file_atomic(self.path, self.content)
+        except Exception:
+            print("write bin file fail")
+            return -1
+
+        return 0
+
+
+# the loader image merged by boot_merger from RKBOOT/*.ini, like rk3588_spl_loader_v1.18.113.bin
+loader_tag_list = [b'BOOT', b'LDR ']
+
+
+def gen_batch_job_list(manifest_path):
+    """
+    Every line of the manifest is the arguments of one ddrbin_tool command,
+    the ddr bin file can be a glob pattern, like:
+        rk3588 ddrbin_param.txt ../bin/rk35/rk3588_ddr_lp4_*.bin
+        rk3568 -g gen_param/ ../bin/rk35/rk3568_ddr_*.bin
+    The -g output is used as a directory when the pattern matches many bins.
+    """
+    import glob
+
+    job_list = []
+    try:
+        if manifest_path == '-':
+            lines = sys.stdin.readlines()
+        else:
+            with open(manifest_path, 'r', encoding='UTF-8') as file:
+                lines = file.readlines()
+    except Exception:
+        print("The file {} read failed".format(manifest_path))
+        return None
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if line == '' or line.startswith('/*') or line.startswith('#'):
+            continue
+
+        args = shlex.split(line)
+        if len(args) < 3:
+            print("manifest line {}: the number of parameters error".format(line_num))
+            return None
+
+        # the stdout of the jobs is the messages of the batch
+        if get_stdout_option(['ddrbin_tool'] + args):
+            print("manifest line {}: '-' as the output is not supported in the batch".format(line_num))
+            return None
+
+        # the same positions as argv of ddrbin_tool
+        bin_index = 3 if args[1] == '-g' else 2
+        if len(args) <= bin_index:
+            print("manifest line {}: the number of parameters error".format(line_num))
+            return None
+
+        if glob.has_magic(args[bin_index]):
+            bin_list = sorted(glob.glob(args[bin_index]))
+        else:
+            bin_list = [args[bin_index]]
+        if len(bin_list) == 0:
+            print("manifest line {}: no file match {}".format(line_num, args[bin_index]))
+            return None
+
+        gen_dir = ''
+        if args[1] == '-g' and (len(bin_list) > 1 or os.path.isdir(args[2])):
+            gen_dir = args[2]
+
+        for filebin_path in bin_list:
+            job_args = list(args)
+            job_args[bin_index] = filebin_path
+            if gen_dir != '':
+                job_args[2] = os.path.join(gen_dir,
+                    os.path.splitext(os.path.basename(filebin_path))[0] + '.txt')
+            job_list.append(['ddrbin_tool'] + job_args)
+
+    return job_list
+
+
+def run_batch_job(job_args):
+    """run one ddrbin_tool command in the worker process, return (ret, last output line, seconds)"""
+    output = io.StringIO()
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            ret = ddrbin_tool(len(job_args), job_args)
+        except Exception as e:
+            print("{}: {}".format(type(e).__name__, e))
+            ret = -1
+    elapsed = time.perf_counter() - start_time
+
+    lines = [line for line in output.getvalue().split('\n') if line.strip() != '']
+    return ret, lines[-1] if lines else '', elapsed
+
+
+def ddrbin_batch(argc, argv):
+    """function 3: run the commands of a manifest on a process pool"""
+    jobs = os.cpu_count() or 1
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'j:h', ['jobs='])
+        for opt, arg in opts:
+            if opt in ('-j', '--jobs'):
+                jobs = max(1, int(arg))
+            elif opt == '-h':
+                print_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        print_help()
+        return -1
+
+    if len(args) != 1:
+        print("The number of parameters error")
+        print_help()
+        return -1
+
+    job_list = gen_batch_job_list(args[0])
+    if job_list is None:
+        return -1
+
+    start_time = time.perf_counter()
+    if jobs == 1 or len(job_list) <= 1:
+        result_list = [run_batch_job(job_args) for job_args in job_list]
+    else:
+        # it is slow to import, only the batch needs it
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(job_list))) as executor:
+            result_list = list(executor.map(run_batch_job, job_list, chunksize=4))
+    elapsed = time.perf_counter() - start_time
+
+    fail_num = 0
+    print("{:>4}  {:<4}  {:>8}  {:<12}  {}".format('job', 'ret', 'time(ms)', 'chip', 'ddr bin / message'))
+    for i, (job_args, (ret, message, job_time)) in enumerate(zip(job_list, result_list)):
+        if ret != 0:
+            fail_num += 1
+        print("{:>4}  {:<4}  {:>8.1f}  {:<12}  {}".format(i, 'ok' if ret == 0 else 'fail',
+            job_time * 1000, job_args[1], job_args[4 if job_args[2] == '-g' else 3]))
+        if ret != 0:
+            print("{:>4}  {:<4}  {:>8}  {:<12}  {}".format('', '', '', '', message))
+    print("{} jobs, {} fail, {} workers, {:.2f}s".format(len(job_list), fail_num,
+        1 if jobs == 1 else min(jobs, max(1, len(job_list))), elapsed))
+
+    return 0 if fail_num == 0 else -1
+
+
+def parse_size(size_str):
+    """'512M' -> 536870912, the unit can be K, M or G"""
+    unit_list = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    size_str = size_str.strip().upper()
+    if size_str[-1:] in unit_list:
+        return int(float(size_str[:-1]) * unit_list[size_str[-1]])
+    return int(size_str)
+
+
+class DdrBinCache:
+    """
+    Content-addressed cache of the -g output and the modified bins, like ccache.
+    Every entry is 'cache_dir/ab/abcd...' with the data and 'cache_dir/ab/abcd....json'
+    with the information to print. The mtime of an entry is updated on hit, and the
+    least recently used entries are removed when the cache is over max_size.
+    cache_dir: $DDRBIN_CACHE_DIR or ~/.cache/ddrbin_tool
+    max_size: $DDRBIN_CACHE_MAX_SIZE or 512M
+    """
+
+    def __init__(self, cache_dir='', max_size=0):
+        if cache_dir == '':
+            cache_dir = os.environ.get('DDRBIN_CACHE_DIR',
+                os.path.join(os.path.expanduser('~'), '.cache', 'ddrbin_tool'))
+        if max_size == 0:
+            max_size = parse_size(os.environ.get('DDRBIN_CACHE_MAX_SIZE', '512M'))
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.stats_path = os.path.join(cache_dir, 'stats.json')
+
+    def get_entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key):
+        """return (info, data) or None"""
+        entry_path = self.get_entry_path(key)
+        try:
+            with open(entry_path + '.json', 'r', encoding='utf-8') as file:
+                cache_info = json.load(file)
+            with open(entry_path, 'rb') as file:
+                data = file.read()
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            self.update_stats('miss')
+            return None
+
+        self.update_stats('hit')
+        return cache_info, data
+
+    def put(self, key, cache_info, data):
+        entry_path = self.get_entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # write to a temporary file and rename, it is safe for the parallel jobs
+            for path, mode, value in ((entry_path, 'wb', data),
+                    (entry_path + '.json', 'w', json.dumps(cache_info))):
+                temp_path = '{}.{}.tmp'.format(path, os.getpid())
+                with open(temp_path, mode) as file:
+                    file.write(value)
+                os.replace(temp_path, path)
+        except OSError:
+            return -1
+
+        self.update_stats('store')
+        self.evict()
+        return 0
+
+    def get_entry_list(self):
+        """return [(atime, size, path), ...] of the cached data"""
+        entry_list = []
+        try:
+            sub_dir_list = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return entry_list
+
+        for sub_dir in sub_dir_list:
+            for entry in os.scandir(sub_dir):
+                if entry.name.endswith('.json') or entry.name.endswith('.tmp'):
+                    continue
                 try:
-                    filebin.seek(bin_skew_offset + (ddrbin_index[index_name]['offset'] - 1) * 4)
-                    skew_sub_ver = int.from_bytes(filebin.read(4), byteorder='little') & 0xff
-                except:
-                    print("read skew_sub_ver from bin file fail")
-                    return -1
-                if chip_info == 'rk3528' and skew_sub_ver == 0x1:
-                    for i in rk3528_skew_info:
-                        if i == 'skew_sub_version':
-                            rk3528_skew_info[i] = skew_sub_ver
-                            continue
-                        for j in rk3528_skew_info[i]:
-                            try:
-                                temp_value = int.from_bytes(filebin.read(4), byteorder='little')
-                                rk3528_skew_info[i][j] = temp_value
-                                #print(f"D: {i}.{j}={rk3528_skew_info[i][j]}")
-                            except:
-                                print("read {} from bin file fail".format(head_info_name))
-                                return -1
-
-                read_out.update({'skew_info' : rk3528_skew_info})
+                    stat = entry.stat()
+                    info_size = os.path.getsize(entry.path + '.json')
+                except OSError:
+                    continue
+                entry_list.append((stat.st_mtime, stat.st_size + info_size, entry.path))
+
+        return entry_list
+
+    def evict(self):
+        entry_list = self.get_entry_list()
+        total_size = sum(entry[1] for entry in entry_list)
+        if total_size <= self.max_size:
+            return 0
 
-    return 0
+        evict_num = 0
+        for mtime, size, path in sorted(entry_list):
+            if total_size <= self.max_size * 0.9:
+                break
+            for remove_path in (path, path + '.json'):
+                try:
+                    os.remove(remove_path)
+                except OSError:
+                    pass
+            total_size -= size
+            evict_num += 1
 
+        self.update_stats('evict', evict_num)
+        return evict_num
 
-def gen_info_from_bin(filegen_path, info_from_bin, verinfo_full, version):
-    with open(filegen_path, 'w+', encoding='utf-8') as file:
-        file.write('/* ' + verinfo_full + ' */\n')
+    def get_stats(self):
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as file:
+                stats = json.load(file)
+        except (OSError, ValueError):
+            stats = {}
+        for name in ('hit', 'miss', 'store', 'evict'):
+            stats.setdefault(name, 0)
+        return stats
+
+    def update_stats(self, name, count=1):
+        """the counters are best effort, some updates may be lost by the parallel jobs"""
+        stats = self.get_stats()
+        stats[name] += count
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = '{}.{}.tmp'.format(self.stats_path, os.getpid())
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(stats, file)
+            os.replace(temp_path, self.stats_path)
+        except OSError:
+            pass
+
+    def clear(self):
+        for mtime, size, path in self.get_entry_list():
+            for remove_path in (path, path + '.json'):
+                try:
+                    os.remove(remove_path)
+                except OSError:
+                    pass
+        try:
+            os.remove(self.stats_path)
+        except OSError:
+            pass
+
+
+def gen_cache_key(ddrbin, tool_option):
+    """sha256 of the bin content, the normalized parameters, the chip and the tool version"""
+    import hashlib
+
+    key_info = {
+        'tool': tool_version,
+        'chip': ddrbin.chip,
+        'bin': hashlib.sha256(ddrbin.content).hexdigest(),
+        'gen': tool_option['gen'],
+    }
+    if tool_option['gen'] == 1:
+        key_info['format'] = tool_option['format']
+        # the json formats have the file name
+        if tool_option['format'] != 'txt':
+            key_info['file'] = ddrbin.path
+    else:
+        key_info['start tag'] = ddrbin.start_tag
+        key_info['param'] = sorted(ddrbin.update_info.items())
+        key_info['verinfo_editable'] = tool_option['verinfo_editable']
+        key_info['verinfo_stamp'] = ddrbin.verinfo_stamp
+        key_info['version_old_hit'] = ddrbin.version_old_hit
 
-    with open(filegen_path, 'a', encoding='utf-8') as file:
-        for key, value in info_from_bin.items():
-            if "reserved" in key:
-                continue
+    return hashlib.sha256(json.dumps(key_info, sort_keys=True).encode('utf-8')).hexdigest()
 
-            if value['num_base'] == 'hex':
-                value_str = str(hex(value['value']))
-            else:
-                value_str = str(value['value'])
 
-            write_buff = key + '=' + value_str
-            #print(f"D: {write_buff}")
-            file.write(write_buff + '\n')
+def ddrbin_cache_cmd(argc, argv):
+    """./ddrbin_tool cache stats|clear [--cache_dir=DIR]"""
+    cache_dir = ''
+    try:
+        opts, args = getopt.gnu_getopt(argv[2:], 'h', ['cache_dir='])
+    except getopt.GetoptError:
+        print_help()
+        return -1
+    for opt, arg in opts:
+        if opt == '--cache_dir':
+            cache_dir = arg
+        elif opt == '-h':
+            print_help()
+            return -1
+
+    if len(args) != 1 or args[0] not in ('stats', 'clear'):
+        print("The number of parameters error")
+        print_help()
+        return -1
 
-    with open(filegen_path, 'a', encoding='utf-8') as file:
-        file.write('end' + '\n')
+    cache = DdrBinCache(cache_dir)
+    if args[0] == 'clear':
+        cache.clear()
+        print("cache {} cleared".format(cache.cache_dir))
+        return 0
+
+    stats = cache.get_stats()
+    entry_list = cache.get_entry_list()
+    lookup_num = stats['hit'] + stats['miss']
+    print("cache directory: {}".format(cache.cache_dir))
+    print("cache entries: {}".format(len(entry_list)))
+    print("cache size: {:.1f} MB / {:.1f} MB".format(sum(entry[1] for entry in entry_list) / (1 << 20),
+        cache.max_size / (1 << 20)))
+    print("hits: {}".format(stats['hit']))
+    print("misses: {}".format(stats['miss']))
+    print("hit rate: {:.2f} %".format(stats['hit'] * 100 / lookup_num if lookup_num else 0))
+    print("stored: {}".format(stats['store']))
+    print("evicted: {}".format(stats['evict']))
 
     return 0
 
 
+def guess_chip(path):
+    """the chip name at the start of the file name, 'null' if there is no one"""
+    name = os.path.basename(path).lower()
+    for chip in sorted(chip_list, key=len, reverse=True):
+        if name.startswith(chip):
+            return chip
+    return 'null'
+
+
+def gen_catalog_file_list(path_list, skip_path):
+    """the files in path_list, the directories are walked, the hidden ones are skipped"""
+    file_list = []
+    for root in path_list:
+        if os.path.isfile(root):
+            file_list.append(os.path.normpath(root))
+            continue
+        for dir_path, dir_names, file_names in os.walk(root):
+            dir_names[:] = sorted(name for name in dir_names if not name.startswith('.'))
+            for name in sorted(file_names):
+                path = os.path.normpath(os.path.join(dir_path, name))
+                if not name.startswith('.') and os.path.abspath(path) != skip_path:
+                    file_list.append(path)
+    return file_list
+
+
 def print_help():
     print(
         "For more details, please refer to the ddrbin_tool_user_guide.txt\n"\
-        "This tools support two functions\n"\
+        "This tools support these functions\n"\
         "for example:\n"\
         "function 1: modify ddr.bin file from ddrbin_param.txt.\n"\
         "	1) modify 'ddrbin_param.txt', set ddr frequency, uart info etc what you want.\n"\
@@ -1098,12 +2193,100 @@ def print_help():
         "\n"\
         "	OPTION: --verinfo_editable=TEXT		The TEXT(max 17 chars) will replace\n"\
         "						the date & time in the version information.\n"\
+        "	OPTION: --verinfo_stamp=date|epoch|hash	Without --verinfo_editable, replace the date & time\n"\
+        "						by the current time, $SOURCE_DATE_EPOCH, or the hash\n"\
+        "						of the bin and the parameters, default: epoch if\n"\
+        "						$SOURCE_DATE_EPOCH is a number, otherwise date.\n"\
         "	like: ./ddrbin_tool px30 ddrbin_param.txt px30_ddr_333MHz_v1.13.bin [OPTION]\n"\
         "\n"\
+        "	OPTION: --output=FILE			Write the modified bin to FILE and keep the bin\n"\
+        "						file unchanged, '-' is stdout.\n"\
+        "	The bin file '-' is stdin, then the modified bin is written to stdout by default.\n"\
+        "	like: cat px30_ddr_333MHz_v1.13.bin | ./ddrbin_tool px30 ddrbin_param.txt - > new.bin\n"\
+        "\n"\
+        "	OPTION: --mmap				Map the bin file instead of reading it, and patch\n"\
+        "						it in place, it is also used by function 2.\n"\
+        "\n"\
+        "	The bin file can be a loader merged by boot_merger, the ddr bin in it is patched and\n"\
+        "	the checksums of the loader are updated.\n"\
+        "	like: ./ddrbin_tool rk3588 ddrbin_param.txt rk3588_spl_loader_v1.18.113.bin\n"\
+        "\n"\
+        "	OPTION: --watch				Patch the bins again when ddrbin_param.txt or the bins are\n"\
+        "						changed, only the changed lines are parsed and the words\n"\
+        "						of the changed items are patched, the changes are printed.\n"\
+        "	OPTION: --poll_interval=MS		Poll the files every MS instead of inotify.\n"\
+        "	like: ./ddrbin_tool rk3588 ddrbin_param.txt a.bin b.bin --watch\n"\
+        "\n"\
         "function 2: get ddr.bin file config to gen_param.txt file\n"\
         "	If want to get ddrbin file config, please run like that:\n"\
         "	./ddrbin_tool px30 -g gen_param.txt px30_ddr_333MHz_v1.15.bin\n"\
-        "	The config will show in gen_param.txt.\n"\
+        "	The config will show in gen_param.txt, use '-g -' to write it to stdout.\n"\
+        "\n"\
+        "	OPTION: --format=txt|json|jsonl	The format of the config, json and jsonl have\n"\
+        "						the offset, word, shift and mask of every item.\n"\
+        "\n"\
+        "function 3: run many ddrbin_tool commands in parallel\n"\
+        "	Every line of the manifest is the arguments of one command, the ddr bin file can be\n"\
+        "	a glob pattern, and the -g output is a directory when the pattern matches many bins.\n"\
+        "	like: ./ddrbin_tool batch [-j JOBS] manifest.txt\n"\
+        "	manifest.txt:\n"\
+        "		rk3588 ddrbin_param.txt rk3588_ddr_lp4_*.bin --verinfo_editable=board_a\n"\
+        "		rk3568 -g gen_param/ rk3568_ddr_*.bin\n"\
+        "\n"\
+        "function 4: cache the result of function 1 and function 2\n"\
+        "	OPTION: --cache, --cache_dir=DIR	The result is cached by the sha256 of the bin, the\n"\
+        "						parameters, the chip and the tool version.\n"\
+        "						Function 1 is cached with --verinfo_editable or --verinfo_stamp=epoch|hash.\n"\
+        "	like: ./ddrbin_tool px30 -g gen_param.txt px30_ddr_333MHz_v1.15.bin --cache\n"\
+        "	./ddrbin_tool cache stats|clear [--cache_dir=DIR]\n"\
+        "	The default DIR is $DDRBIN_CACHE_DIR or ~/.cache/ddrbin_tool, and the max size\n"\
+        "	is $DDRBIN_CACHE_MAX_SIZE or 512M, the least recently used results are removed.\n"\
+        "\n"\
+        "function 5: compile ddrbin_param.txt to a patch plan\n"\
+        "	The plan is the words to modify for every ddrbin version, it can be used as\n"\
+        "	ddrbin_param.txt in function 1 and function 3 without parsing the txt again.\n"\
+        "	like: ./ddrbin_tool compile ddrbin_param.txt plan.json\n"\
+        "	      ./ddrbin_tool px30 plan.json px30_ddr_333MHz_v1.13.bin\n"\
+        "\n"\
+        "function 6: catalog the ddr bins in a tree to sqlite and query them\n"\
+        "	The ddr bins are found by the 'start tag', the catalog is refreshed by the mtime\n"\
+        "	and the sha256 of the files, the default catalog is ddrbin_catalog.db.\n"\
+        "	like: ./ddrbin_tool catalog [--db=FILE] ../bin\n"\
+        "	      ./ddrbin_tool query [--db=FILE] 'path=*rk35*' 'lp4x_freq>=2112' 'uart id=2'\n"\
+        "	The conditions are ITEM OP VALUE, OP is one of = != > >= < <=, ITEM is an item of\n"\
+        "	gen_param.txt, chip, version or path, path = is a glob pattern.\n"\
+        "\n"\
+        "function 7: export the ddr bins to a columnar file, one column per item\n"\
+        "	The format is npz (numpy, one array per column), npy (numpy structured array) or\n"\
+        "	csv, it is taken from the extension of OUTPUT. npz and npy need numpy.\n"\
+        "	like: ./ddrbin_tool export [--format=npz|npy|csv] fleet.npz dumps/ '../bin/rk35/*.bin'\n"\
+        "\n"\
+        "function 8: show the items which are different between ddr bins\n"\
+        "	The first bin is the baseline, the others are compared with it.\n"\
+        "	like: ./ddrbin_tool diff [--chip=CHIP] [--format=txt|json] old.bin new.bin [BIN...]\n"\
+        "\n"\
+        "function 9: scan a large flash image for the ddr bins and patch them in place\n"\
+        "	The image is mapped and scanned in chunks on JOBS processes, every header is listed.\n"\
+        "	like: ./ddrbin_tool scan [-j JOBS] [--chunk_size=SIZE] [--chip=CHIP] emmc.img\n"\
+        "	OPTION: --scan				Scan the bin file like this in function 1 and function 2,\n"\
+        "						every header is patched in place, -g gets the first one.\n"\
+        "	OPTION: --offset=OFFSET			Only the header at OFFSET, it can be given many times.\n"\
+        "	OPTION: -j JOBS, --chunk_size=SIZE	The processes and the chunk size of --scan.\n"\
+        "	like: ./ddrbin_tool rk3588 ddrbin_param.txt emmc.img --scan --offset=0x2000b2b\n"\
+        "\n"\
+        "function 10: serve function 1 and function 2 on a unix socket\n"\
+        "	The field tables are built once, then JOBS workers are forked with them. ddrbin_client.py\n"\
+        "	sends the commands to the service, the files are relative to the directory of the client.\n"\
+        "	like: ./ddrbin_tool serve [--socket=PATH] [-j JOBS] [--max_queue=N] &\n"\
+        "	      ./ddrbin_client.py rk3588 -g - rk3588_ddr_lp4_2112MHz_lp5_2400MHz_v1.18.bin\n"\
+        "	      ./ddrbin_client.py --batch manifest.txt -j 4\n"\
+        "	      ./ddrbin_client.py --metrics\n"\
+        "	The default PATH is $DDRBIN_SOCKET or /tmp/ddrbin_tool-<uid>.sock.\n"\
+        "\n"\
+        "OPTION of function 1 and function 2:\n"\
+        "	--profile				Print the time and the tracemalloc peak memory of\n"\
+        "						every phase, tracemalloc makes the phases slower.\n"\
+        "	--cprofile=FILE			Save the cProfile stats to FILE, read it by pstats.\n"\
         "\n"\
         "Note:	The function 1 and function 2 are two separate functions\n"\
         "The gen_param.txt file which is generated by function 2 is no need used in function 1.\n"\
@@ -1112,25 +2295,129 @@ def print_help():
     )
 
 
-def ddrbin_tool(argc, argv):
-    global updata_key_list
-    global chip_info
+tool_short_option = 'g:hj:'
+tool_long_option = ['verinfo_editable=', 'mmap', 'cache', 'cache_dir=', 'format=', 'output=', 'profile',
+    'cprofile=', 'verinfo_stamp=', 'scan', 'jobs=', 'chunk_size=', 'offset=', 'watch', 'poll_interval=']
+subcmd_list = ['batch', 'cache', 'compile', 'catalog', 'query', 'export', 'diff', 'scan', 'serve']
+
+
+def get_stdout_option(argv):
+    """
+    The data is written to stdout with '-g -' or '--output -', or when
+    modify the bin from stdin without --output, or with 'diff --format=json'.
+    """
+    if len(argv) > 2 and argv[1] == 'diff':
+        try:
+            opts, args = getopt.gnu_getopt(argv[2:], 'h', ['chip=', 'format='])
+        except getopt.GetoptError:
+            return False
+        return dict(opts).get('--format') == 'json'
+    if len(argv) < 2 or argv[1] in subcmd_list:
+        return False
+    try:
+        opts, args = getopt.gnu_getopt(argv, tool_short_option, tool_long_option)
+    except getopt.GetoptError:
+        return False
 
-    info_from_txt = copy.deepcopy(base_info_full)
-    info_from_bin = copy.deepcopy(base_info_full)
-    ddrbin_index = copy.deepcopy(sdram_head_info_index_v2)
+    opt_info = dict(opts)
+    if opt_info.get('-g') == '-' or opt_info.get('--output') == '-':
+        return True
+    return '-g' not in opt_info and '--output' not in opt_info and len(argv) > 3 and argv[3] == '-'
+
+
+def write_output(path, data, data_out):
+    """write the bytes-like data to path, or to data_out if path is '-'"""
+    try:
+        if path == '-':
+            data_out.flush()
+            if hasattr(data_out, 'buffer'):
+                data_out.buffer.write(data)
+                data_out.buffer.flush()
+            else:
+                data_out.write(bytes(data).decode('utf-8', errors='replace'))
+        else:
+            write_file_atomic(path, data)
+    except Exception:
+        print("The file {} write failed".format(path))
+        return -1
+
+    return 0
+
+
+def get_profile_option(argv):
+    """return (--profile, the file of --cprofile)"""
+    if len(argv) < 2 or argv[1] in subcmd_list:
+        return False, ''
+    try:
+        opts, args = getopt.gnu_getopt(argv, tool_short_option, tool_long_option)
+    except getopt.GetoptError:
+        return False, ''
+
+    opt_info = dict(opts)
+    return '--profile' in opt_info, opt_info.get('--cprofile', '')
+
+
+def ddrbin_tool_profile(argc, argv, data_out):
+    """run ddrbin_tool_main() with --profile and --cprofile"""
+    profile, cprofile_path = get_profile_option(argv)
+    if profile:
+        tool_profiler.start()
+        # only the first command of the process loads the module
+        if not tool_profiler.load_reported:
+            tool_profiler.load_reported = True
+            tool_profiler.add('module load', time.perf_counter() - tool_load_time)
+
+    if cprofile_path != '':
+        import cProfile
+        profiler = cProfile.Profile()
+        ret = profiler.runcall(ddrbin_tool_main, argc, argv, data_out)
+        try:
+            profiler.dump_stats(cprofile_path)
+            print("save the cProfile stats to {}".format(cprofile_path))
+        except Exception:
+            print("The file {} write failed".format(cprofile_path))
+    else:
+        ret = ddrbin_tool_main(argc, argv, data_out)
 
-    version_old_hit = 0
-    gen_txt_from_bin = 0
+    if profile:
+        tool_profiler.stop()
+        tool_profiler.report()
+    return ret
 
-    verinfo_full = ''
-    verinfo_full_offset = 0
-    verinfo_full_length = 0
-    verinfo_editable = ''
-    verinfo_editable_offset = 0
-    verinfo_editable_length = 17
 
-    print("version v1.21 20241211")
+def ddrbin_tool(argc, argv):
+    # the messages are printed to stderr when the data is written to stdout
+    if get_stdout_option(argv):
+        data_out = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            return ddrbin_tool_profile(argc, argv, data_out)
+
+    return ddrbin_tool_profile(argc, argv, sys.stdout)
+
+
+def ddrbin_tool_main(argc, argv, data_out):
+    tool_option = {
+        'gen': 0,
+        'filegen_path': '',
+        'format': 'txt',
+        'data_out': data_out,
+        'verinfo_editable': '',
+        # the date & time is reproducible if $SOURCE_DATE_EPOCH is a number
+        'verinfo_stamp': 'epoch' if get_source_date_epoch() is not None else 'date',
+        'mmap': False,
+        'cache': False,
+        'cache_dir': '',
+        'output': '',
+        'scan': False,
+        'jobs': 0,
+        # 0 is scan_chunk_size of ddrbin_scan
+        'chunk_size': 0,
+        'offset': [],
+        'watch': False,
+        'poll_interval': 0,
+    }
+
+    print("version {}".format(tool_version))
     print("python {}, {}, {}".format(sys.version.split(' ', 1)[0], platform.system(), platform.machine()))
     if sys.version_info < (3, 6):
         print("Warning: Please installed Python 3.6 or later.")
@@ -1139,31 +2426,113 @@ def ddrbin_tool(argc, argv):
         print_help()
         return -1
 
-    chip_info = argv[1]
-    if chip_info not in chip_list:
-        chip_info = 'others chip'
-    print("chip: {}".format(chip_info))
+    if argv[1] == 'batch':
+        return ddrbin_batch(argc, argv)
+    if argv[1] == 'cache':
+        return ddrbin_cache_cmd(argc, argv)
+    if argv[1] == 'compile':
+        return ddrbin_compile(argc, argv)
+    if argv[1] == 'catalog':
+        from ddrbin_catalog import ddrbin_catalog
+        return ddrbin_catalog(argc, argv)
+    if argv[1] == 'query':
+        from ddrbin_catalog import ddrbin_query
+        return ddrbin_query(argc, argv)
+    if argv[1] == 'export':
+        from ddrbin_export import ddrbin_export
+        return ddrbin_export(argc, argv)
+    if argv[1] == 'diff':
+        from ddrbin_diff import ddrbin_diff
+        return ddrbin_diff(argc, argv, data_out)
+    if argv[1] == 'scan':
+        from ddrbin_scan import ddrbin_scan
+        return ddrbin_scan(argc, argv)
+    if argv[1] == 'serve':
+        from ddrbin_serve import ddrbin_serve
+        return ddrbin_serve(argc, argv)
+
+    ddrbin = DdrBin(argv[1])
+    print("chip: {}".format(ddrbin.chip))
+
+    with tool_profiler.phase('args'):
+        ret = ddrbin_tool_args(argc, argv, tool_option)
+    if ret != 0:
+        return -1
+
+    if tool_option['watch']:
+        from ddrbin_watch import ddrbin_watch
+        return ddrbin_watch(argv, tool_option)
+
+    if tool_option['gen'] == 1:
+        filebin_path = argv[4]
+    else:
+        filebin_path = argv[3]
+        with tool_profiler.phase('param parse'):
+            if ddrbin.load_param(argv[2]) != 0:
+                return -1
+
+    with ddrbin:
+        return ddrbin_tool_run(ddrbin, filebin_path, tool_option)
 
+
+def ddrbin_tool_args(argc, argv, tool_option):
+    """parse the options to tool_option and check the files"""
     try:
-        opts, args = getopt.gnu_getopt(argv, 'g:h', ['verinfo_editable='])
+        opts, args = getopt.gnu_getopt(argv, tool_short_option, tool_long_option)
     except:
         print_help()
         return -1
 
     for opt, arg in opts:
         if opt == '-g':
-            gen_txt_from_bin = 1
-            filegen_path = arg
+            tool_option['gen'] = 1
+            tool_option['filegen_path'] = arg
         elif opt == '--verinfo_editable':
-            verinfo_editable = arg
-            if len(verinfo_editable) > verinfo_editable_length:
+            tool_option['verinfo_editable'] = arg
+            if len(arg) > verinfo_editable_length:
                 print("The character count of 'verinfo_editable' exceeds the allowed limit of 17.")
                 return -1
+        elif opt == '--verinfo_stamp':
+            if arg not in ('date', 'epoch', 'hash'):
+                print("The verinfo_stamp {} is not support".format(arg))
+                return -1
+            tool_option['verinfo_stamp'] = arg
+        elif opt == '--mmap':
+            tool_option['mmap'] = True
+        elif opt == '--format':
+            if arg not in ('txt', 'json', 'jsonl'):
+                print("The format {} is not support".format(arg))
+                return -1
+            tool_option['format'] = arg
+        elif opt == '--cache':
+            tool_option['cache'] = True
+        elif opt == '--cache_dir':
+            tool_option['cache'] = True
+            tool_option['cache_dir'] = arg
+        elif opt == '--output':
+            tool_option['output'] = arg
+        elif opt == '--scan':
+            tool_option['scan'] = True
+        elif opt == '--watch':
+            tool_option['watch'] = True
+        elif opt in ('-j', '--jobs', '--chunk_size', '--offset', '--poll_interval'):
+            try:
+                if opt == '--chunk_size':
+                    tool_option['chunk_size'] = parse_size(arg)
+                elif opt == '--offset':
+                    tool_option['offset'].append(int(arg, 0))
+                elif opt == '--poll_interval':
+                    tool_option['poll_interval'] = max(1, int(arg))
+                else:
+                    tool_option['jobs'] = max(1, int(arg))
+            except ValueError:
+                print("The {} {} is invalid".format(opt, arg))
+                return -1
         elif opt == '-h':
             print_help()
             return -1
 
-    if gen_txt_from_bin == 1:
+    if tool_option['gen'] == 1:
         # function: get ddr.bin file config to gen_param.txt file
         if argc < 5:
             print("The number of parameters error")
@@ -1171,7 +2540,7 @@ def ddrbin_tool(argc, argv):
             return -1
 
         filebin_path = argv[4]
-        if os.path.exists(filebin_path) != True:
+        if filebin_path != '-' and os.path.exists(filebin_path) != True:
             print("The file {} not exist".format(filebin_path))
             return -1
 
@@ -1189,213 +2558,140 @@ def ddrbin_tool(argc, argv):
             return -1
 
         filebin_path = argv[3]
-        if os.path.exists(filebin_path) != True:
+        if filebin_path != '-' and os.path.exists(filebin_path) != True:
             print("The file {} not exist".format(filebin_path))
             return -1
 
-        for key in version_old_list:
-            if key in argv[3]:
-                version_old_hit = 1
-        #print(f"D: fileskew_path={fileskew_path},{filebin_path},version_old_hit={version_old_hit}")
-
-    if gen_txt_from_bin != 1:
-        # Read the parameters that need to be modified from the txt file.
-        key_list = list(info_from_txt.keys())
-        hot = 0
-        try:
-            with open(fileskew_path,'r', encoding='UTF-8') as file:
-                for line in file:
-                    if '/*' in line:
-                        continue
+        # modify the bin from stdin and write it to stdout
+        if filebin_path == '-' and tool_option['output'] == '':
+            tool_option['output'] = '-'
+
+    if tool_option['watch'] and (tool_option['gen'] == 1 or tool_option['output'] != '' or tool_option['scan']):
+        print("The --watch only patches the bin files in place, -g, --output and --scan are not supported")
+        return -1
+
+    return 0
 
-                    if '=' in line:
-                        index_of_line = line.find('=')
-                        if line[index_of_line : ].strip() != '=':
-                            info_dict_key = line[ : index_of_line]
-                            info_dict_value = line[index_of_line + 1 : -1]
 
-                            if '0x' in info_dict_value:
-                                info_dict_value = int(info_dict_value[2:], 16)
-                            else:
-                                info_dict_value = int(info_dict_value)
+def print_new_bin_config(ddrbin):
+    print("\nnew bin config:")
+    base_info = get_base_info_full()
+    for key in base_info:
+        if key in ddrbin.update_info:
+            if base_info[key].num_base == 'hex':
+                print("{}: {}".format(key, hex(ddrbin.update_info[key])))
+            else:
+                print("{}: {}".format(key, ddrbin.update_info[key]))
 
-                            info_from_txt[info_dict_key]['value'] = info_dict_value
 
-                            # append info_dict_key to update_key_list, need updata value from txt
-                            update_key_list.append(info_dict_key)
-                            #print(f"D: update_key_list append, {info_dict_key}={info_dict_value}")
+def ddrbin_tool_cached(ddrbin, filebin_path, tool_option, cache, cache_key):
+    """output the cached result without parsing the bin, return -1 if it is not cached"""
+    cache_entry = cache.get(cache_key)
+    if cache_entry is None:
+        return -1
 
-                        hot = hot + 1
-        except (KeyError, ValueError):
-            print("KeyError or ValueError: {}={}".format(info_dict_key, info_dict_value))
-            return -1
-        except Exception:
-            print("The file {} read failed".format(fileskew_path))
+    cache_info, data = cache_entry
+    ddrbin.close()
+    if tool_option['gen'] == 1:
+        if write_output(tool_option['filegen_path'], data, tool_option['data_out']) != 0:
             return -1
+    elif write_output(tool_option['output'] or filebin_path, data, tool_option['data_out']) != 0:
+        return -1
 
-        if hot == 0:
-            print("Failed to read DRAM parameters from the file")
-            return -1
+    print("version {}".format(cache_info['version']))
+    if cache_info['verinfo'] != '':
+        print("{}".format(cache_info['verinfo']))
+    if tool_option['gen'] == 1:
+        print("generate info from bin file ok.")
     else:
-        info_from_txt['start tag']['value'] = 0x12345678
-
-    # get info from bin file
-    with open(filebin_path, 'rb') as file:
-        content = file.read()
-    # convert the target byte sequence 'start tag' into bytes, byteorder little
-    target_bytes = struct.pack('<I', info_from_txt['start tag']['value'])
-    start_position = 0
-    while True:
-        position = content.find(target_bytes, start_position)
-        if position == -1:
-            break
-
-        version = int.from_bytes(content[position + 4: position + 8], byteorder='little')
-        if version >= 0 and version <= version_max:
-            break
-        else:
-            start_position = position + len(target_bytes)
+        print_new_bin_config(ddrbin)
+        print("modify end\n")
+        if cache_info['new_verinfo'] != '':
+            print("new ddrbin version information: {}".format(cache_info['new_verinfo']))
 
-    if position == -1:
-        if start_position == 0:
-            print("Find the 'start tag' in the ddrbin file failed")
-        else:
-            print("version = {}, invalid.".format(version))
-            if version > version_max and version < (version_max + 5):
-                print("Please check if there is a new version of the tool available.")
-        return -1
+    return 0
 
-    # get ddrbin parameters version
-    try:
-        bin_skew_offset = position + 4
-        filebin = open(filebin_path, 'rb+')
-        filebin.seek(bin_skew_offset)
-        version = int.from_bytes(filebin.read(4), byteorder='little')
-    except:
-        print("get version fail")
-        filebin.close()
+
+def ddrbin_tool_run(ddrbin, filebin_path, tool_option):
+    if tool_option['scan']:
+        from ddrbin_scan import ddrbin_scan_run
+        return ddrbin_scan_run(ddrbin, filebin_path, tool_option)
+
+    with tool_profiler.phase('read bin'):
+        # --output never writes the input bin, map it copy on write
+        ret = ddrbin.open(filebin_path, tool_option['mmap'], tool_option['gen'] != 1 and tool_option['output'] == '')
+    if ret != 0:
         return -1
 
-    print("version {}".format(version))
-
-    # get ddrbin version information from bin file
-    # eg: DDR 03ea844c5d typ 24/09/03-10:42:57,fwver: v1.23
-    target_bytes = b'DDR '
-    target_bytes_1 = b',fwver:'
-    start_position = 0
-    while True:
-        position = content.find(target_bytes, start_position)
-        position_1 = content.find(target_bytes_1, start_position)
-        if position == -1 or position_1 == -1:
-            break
-        elif (position_1 - position) < 100:
-            verinfo_full = content[position: position_1+30].decode('utf-8', errors='replace')
-            verinfo_full = verinfo_full[:verinfo_full.find('\n')]
-            if content[position_1 - verinfo_editable_length - 1].to_bytes(1, 'little') == b' ':
-                verinfo_editable_offset = position_1 - verinfo_editable_length
-                verinfo_full_offset = position
-                verinfo_full_length = len(verinfo_full.encode('utf-8'))
-                print("{}".format(verinfo_full))
-                break
-        else:
-            start_position = position + len(target_bytes)
+    if tool_option['gen'] != 1 and tool_option['verinfo_editable'] == '':
+        if ddrbin.set_verinfo_stamp(tool_option['verinfo_stamp']) != 0:
+            return -1
 
-    if version < 2:
-        read_out = copy.deepcopy(sdram_head_info_v0)
-        write_in = copy.deepcopy(sdram_head_info_v0)
-
-        # skip gcpu_gen_freq after version_info
-        filebin.seek(bin_skew_offset + 8)
-    elif version <= 5:
-        if version >= 3:
-            ddrbin_index.update(sdram_head_info_index_v2_3)
-        if version >= 4:
-            ddrbin_index.update(sdram_head_info_index_v3_4)
-
-        if version < 5:
-            read_out = copy.deepcopy(sdram_head_info_v2)
-            write_in = copy.deepcopy(sdram_head_info_v2)
-        else:
-            read_out = copy.deepcopy(sdram_head_info_v5)
-            write_in = copy.deepcopy(sdram_head_info_v5)
+    cache = None
+    cache_key = ''
+    # the date & time in verinfo is not cacheable
+    if tool_option['cache'] and (tool_option['gen'] == 1 or tool_option['verinfo_editable'] != '' or
+            ddrbin.verinfo_stamp != ''):
+        with tool_profiler.phase('cache'):
+            cache = DdrBinCache(tool_option['cache_dir'])
+            cache_key = gen_cache_key(ddrbin, tool_option)
+            ret = ddrbin_tool_cached(ddrbin, filebin_path, tool_option, cache, cache_key)
+        if ret == 0:
+            return 0
 
-        #index_info read out
-        for key in ddrbin_index:
-            try:
-                ddrbin_index[key]['offset'] = int.from_bytes(filebin.read(1), byteorder='little')
-                ddrbin_index[key]['size'] = int.from_bytes(filebin.read(1), byteorder='little')
-            except:
-                filebin.close()
-                print("readout ddrbin_index fail")
-                return -1
-            #print(f"D: {key} = {index[key]}",ddrbin_index[key]["offset"],ddrbin_index[key]["size"])
-    else:
-        filebin.close()
-        print("version not support")
-        return -1
+    if ddrbin.content[:4] in loader_tag_list:
+        from ddrbin_loader import ddrbin_loader_run
+        return ddrbin_loader_run(ddrbin, filebin_path, tool_option, cache, cache_key)
 
-    if bin_data_readout(filebin, ddrbin_index, read_out, bin_skew_offset, version, info_from_txt) != 0:
-        filebin.close()
-        print("bin_data_readout failed")
+    if ddrbin.parse() != 0:
         return -1
 
-    bin_data_2_info(info_from_bin, read_out, ddrbin_index, version, info_from_txt)
-    if gen_txt_from_bin == 1:
-        if gen_info_from_bin(filegen_path, info_from_bin, verinfo_full, version) == 0:
+    print("version {}".format(ddrbin.version))
+    if ddrbin.verinfo_editable_offset != 0:
+        print("{}".format(ddrbin.verinfo_full))
+
+    cache_info = {'version': ddrbin.version, 'verinfo': ddrbin.verinfo_full, 'new_verinfo': ''}
+    if tool_option['gen'] == 1:
+        with tool_profiler.phase('dump'):
+            data = ddrbin.gen_param_text(tool_option['format']).encode('utf-8')
+        with tool_profiler.phase('write back'):
+            ret = write_output(tool_option['filegen_path'], data, tool_option['data_out'])
+        if ret == 0:
             print("generate info from bin file ok.")
-            filebin.close()
+            if cache is not None:
+                cache.put(cache_key, cache_info, data)
             return 0
         else:
             print("generate info fail.")
-            filebin.close()
             return -1
 
-    txt_data_2_bin_data(info_from_txt, info_from_bin, ddrbin_index, write_in, version)
+    print_new_bin_config(ddrbin)
 
-    if version < 2:
-        if version_old_hit == 0:
-            filebin.seek(bin_skew_offset + 8)
-            for i in range(len(write_in)):
-                try:
-                    filebin.write(write_in[i][1].to_bytes(4,byteorder='little'))
-                except:
-                    print("write bin file fail")
-        else:
-            filebin.seek(bin_skew_offset + 20)
-            for i in range(3, len(write_in)):
-                try:
-                    filebin.write(write_in[i][1].to_bytes(4,byteorder='little'))
-                except:
-                    print("write bin file fail")
-    elif version <= version_max:
-        write_in_bin_data_v2(filebin, bin_skew_offset, write_in, ddrbin_index, info_from_txt, version)
+    if tool_option['output'] != '':
+        ddrbin.patch(tool_option['verinfo_editable'])
+        with tool_profiler.phase('write back'):
+            # the view is released before the mapping is closed
+            with memoryview(ddrbin.content) as data:
+                ret = write_output(tool_option['output'], data, tool_option['data_out'])
+        if ret != 0:
+            return -1
+    elif ddrbin.save(tool_option['verinfo_editable']) != 0:
+        return -1
     print("modify end\n")
 
-    # update ddrbin version information to bin file
-    if verinfo_editable_offset != 0:
-        if verinfo_editable == '':
-            #print(f"position_1={position_1}, position_2={position_2}, {old_verinfo_editable}")
-            current_time = datetime.now()
-            verinfo_editable = current_time.strftime("%y/%m/%d-%H:%M.%S")
-        if len(verinfo_editable) < verinfo_editable_length:
-            verinfo_editable = verinfo_editable.ljust(verinfo_editable_length)
+    if ddrbin.verinfo_editable_offset != 0:
+        cache_info['new_verinfo'] = ddrbin.get_verinfo()
+        print("new ddrbin version information: {}".format(cache_info['new_verinfo']))
 
-        verinfo_editable_bytes = verinfo_editable.encode('utf-8')[:verinfo_editable_length]
-        try:
-            filebin.seek(verinfo_editable_offset)
-            filebin.write(verinfo_editable_bytes)
-            filebin.seek(verinfo_full_offset)
-            new_verinfo_full = filebin.read(verinfo_full_length).decode('utf-8', errors='replace')
-            print("new ddrbin version information: {}".format(new_verinfo_full))
-        except:
-            print("change verinfo_editable error")
-
-    filebin.close()
+    if cache is not None:
+        cache.put(cache_key, cache_info, ddrbin.content)
 
     return 0
 
 
 if __name__ == '__main__':
     #print(f"D: argc = {len(sys.argv)}, argv = {sys.argv}")
-    ddrbin_tool(len(sys.argv), sys.argv)
-
+    # the modules of the subcommands import ddrbin_tool, they get this one instead of a second copy
+    sys.modules.setdefault('ddrbin_tool', sys.modules['__main__'])
+    if ddrbin_tool(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)
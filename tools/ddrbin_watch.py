@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# function 1 with --watch, it keeps running and patches the bins when ddrbin_param.txt is changed.
+# It is imported only with --watch, so the other commands do not load it.
+import os
+import sys
+import time
+import getopt
+
+import ddrbin_tool as ddrbin_lib
+
+# ms, the poll interval when inotify is not supported
+watch_poll_interval = 500
+# the events of one save are merged until the files are quiet for this time
+watch_settle_time = 0.02
+# IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+watch_inotify_mask = 0x2 | 0x4 | 0x8 | 0x80 | 0x100 | 0x200
+
+
+def get_watch_stat(path):
+    """the file is changed if (mtime, size, inode) is changed, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def open_inotify(path_list):
+    """watch the directories of path_list by inotify, return the fd, or -1 if inotify is not supported"""
+    try:
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return -1
+    if inotify_fd < 0:
+        return -1
+
+    # the editors save the file by rename, so the directories are watched instead of the files
+    for dir_path in sorted(set(os.path.dirname(os.path.abspath(path)) for path in path_list)):
+        if libc.inotify_add_watch(inotify_fd, dir_path.encode(), watch_inotify_mask) < 0:
+            os.close(inotify_fd)
+            return -1
+    return inotify_fd
+
+
+def wait_watch_change(inotify_fd, poll_interval):
+    """wait until a file may be changed, the changed files are found by get_watch_stat()"""
+    import select
+
+    if inotify_fd < 0:
+        time.sleep(poll_interval / 1000)
+        return
+
+    select.select([inotify_fd], [], [])
+    while select.select([inotify_fd], [], [], watch_settle_time)[0]:
+        try:
+            os.read(inotify_fd, 65536)
+        except BlockingIOError:
+            break
+
+
+class DdrBinWatch:
+    """
+    function 1 with --watch. The lines of ddrbin_param.txt are kept with the result of
+    parse_param_line(), only the new lines are parsed when the file is changed. The bins
+    are kept in memory after they are parsed, only the words of the changed items are
+    patched and the items are decoded again to print the changes. A bin changed by others
+    is read again and all the items are patched. The loaders are patched by function 1.
+    """
+
+    def __init__(self, chip, param_path, path_list, tool_option):
+        self.chip = chip
+        self.param_path = param_path
+        self.path_list = path_list
+        self.tool_option = tool_option
+        self.param_stat = None
+        # {line: (key, value) or None} of the last read
+        self.line_cache = {}
+        self.tag = None
+        self.update_info = {}
+        # {path: (stat after the last patch, DdrBin, None for a loader or 'fail' if it is not a ddr bin)}
+        self.bin_info = {}
+
+    def read_param(self):
+        """
+        parse the lines which are not in the last read of the param file,
+        return (start tag or None, {key: value}, the number of the parsed lines) or None if fail
+        """
+        try:
+            with open(self.param_path, 'r', encoding='UTF-8') as file:
+                text = file.read()
+        except Exception:
+            print("The file {} read failed".format(self.param_path))
+            return None
+        if text.lstrip().startswith('{'):
+            print("The patch plan is not supported by --watch")
+            return None
+
+        line_cache = {}
+        update_info = {}
+        parse_num = 0
+        hot = 0
+        for line in text.splitlines():
+            if line in line_cache:
+                param = line_cache[line]
+            elif line in self.line_cache:
+                param = line_cache[line] = self.line_cache[line]
+            else:
+                try:
+                    param = line_cache[line] = ddrbin_lib.parse_param_line(line)
+                except ValueError as e:
+                    print("KeyError or ValueError: {}={}".format(*e.args))
+                    return None
+                parse_num += 1
+            if param is None:
+                continue
+            if param[1] is not None:
+                update_info[param[0]] = param[1]
+            hot = hot + 1
+
+        if hot == 0:
+            print("Failed to read DRAM parameters from the file")
+            return None
+
+        self.line_cache = line_cache
+        return update_info.pop('start tag', None), update_info, parse_num
+
+    def open_bin(self, path):
+        """read and parse the bin, return the DdrBin, None for a loader, or -1 if fail"""
+        ddrbin = ddrbin_lib.DdrBin(self.chip)
+        if self.tag is not None:
+            ddrbin.start_tag = self.tag
+        if ddrbin.open(path, self.tool_option['mmap'], True) != 0:
+            return -1
+        if ddrbin.content[:4] in ddrbin_lib.loader_tag_list:
+            ddrbin.close()
+            return None
+        if ddrbin.parse() != 0:
+            ddrbin.close()
+            return -1
+        return ddrbin
+
+    def patch_bin(self, ddrbin, update_info):
+        """patch the words of update_info, print the items which are changed, return the patched words or -1"""
+        tool_option = self.tool_option
+        field_layout = ddrbin.codec.get_field_layout(ddrbin.read_out)
+        old_values = ddrbin.field_values
+        ddrbin.update_info = update_info
+        ddrbin.patch_plan = {}
+        if tool_option['verinfo_editable'] == '':
+            if ddrbin.set_verinfo_stamp(tool_option['verinfo_stamp']) != 0:
+                return -1
+        patch_list = ddrbin.patch(tool_option['verinfo_editable'])
+        if len(patch_list) != 0:
+            try:
+                if ddrbin.file is not None:
+                    ddrbin.content.flush()
+                else:
+                    ddrbin_lib.write_file_atomic(ddrbin.path, ddrbin.content)
+            except Exception:
+                print("write bin file fail")
+                return -1
+            ddrbin.read_out = ddrbin.codec.read_words(ddrbin.content, ddrbin.tag_offset)
+            ddrbin.field_values = ddrbin.codec.decode(ddrbin.read_out)
+
+        word_num = len([offset for offset, data in patch_list if offset != ddrbin.verinfo_editable_offset])
+        print("{}: version {}, {} words patched".format(ddrbin.path, ddrbin.version, word_num))
+        base_info = ddrbin_lib.get_base_info_full()
+        for key in sorted(update_info, key=lambda key: ddrbin_lib.field_key_index[key]):
+            if key not in field_layout:
+                print("    {}: not in the header".format(key))
+                continue
+            old_value = old_values[ddrbin_lib.field_key_index[key]]
+            new_value = ddrbin.field_values[ddrbin_lib.field_key_index[key]]
+            if old_value != new_value:
+                if base_info[key].num_base == 'hex':
+                    old_value, new_value = hex(old_value), hex(new_value)
+                print("    {}: {} -> {}".format(key, old_value, new_value))
+        if word_num != 0 and ddrbin.verinfo_editable_offset != 0:
+            print("    new ddrbin version information: {}".format(ddrbin.get_verinfo()))
+        return word_num
+
+    def patch_loader(self, path, update_info):
+        """patch the ddr bins of a loader by function 1, return 0 or -1"""
+        ddrbin = ddrbin_lib.DdrBin(self.chip)
+        if self.tag is not None:
+            ddrbin.start_tag = self.tag
+        with ddrbin:
+            if ddrbin.open(path, self.tool_option['mmap'], True) != 0:
+                return -1
+            ddrbin.update_info = dict(update_info)
+            if self.tool_option['verinfo_editable'] == '':
+                if ddrbin.set_verinfo_stamp(self.tool_option['verinfo_stamp']) != 0:
+                    return -1
+            print("{}:".format(path))
+            from ddrbin_loader import ddrbin_loader_run
+            return ddrbin_loader_run(ddrbin, path, dict(self.tool_option, gen=0, output=''), None, '')
+
+    def update(self):
+        """
+        patch the bins by the changes of the files since the last update,
+        return the number of the changed files, or -1 if the param file is invalid
+        """
+        start_time = time.perf_counter()
+        change_num = 0
+        changed_info = {}
+        reload = False
+
+        param_stat = get_watch_stat(self.param_path)
+        if param_stat != self.param_stat:
+            self.param_stat = param_stat
+            change_num += 1
+            param_info = self.read_param()
+            if param_info is None:
+                return -1
+            tag, update_info, parse_num = param_info
+            changed_info = {key: value for key, value in update_info.items() if self.update_info.get(key) != value}
+            removed_list = [key for key in self.update_info if key not in update_info]
+            print("{}: {} lines parsed, {} items changed".format(self.param_path, parse_num, len(changed_info)))
+            if len(removed_list) != 0:
+                print("    {} removed, the bins keep the values".format(', '.join(removed_list)))
+            # the headers are found by the start tag again
+            reload = tag != self.tag
+            self.tag = tag
+            self.update_info = update_info
+
+        for path in self.path_list:
+            stat, ddrbin = self.bin_info.get(path, (None, None))
+            if reload or get_watch_stat(path) != stat:
+                if isinstance(ddrbin, ddrbin_lib.DdrBin):
+                    ddrbin.close()
+                ddrbin = self.open_bin(path)
+                if ddrbin == -1:
+                    # it is not patched again until it is changed
+                    self.bin_info[path] = (get_watch_stat(path), 'fail')
+                    change_num += 1
+                    continue
+                update_info = self.update_info
+            elif ddrbin == 'fail':
+                continue
+            elif len(changed_info) != 0:
+                update_info = changed_info
+            else:
+                continue
+
+            change_num += 1
+            if ddrbin is None:
+                self.patch_loader(path, update_info)
+            else:
+                self.patch_bin(ddrbin, update_info)
+            self.bin_info[path] = (get_watch_stat(path), ddrbin)
+
+        if change_num != 0:
+            print("update {:.1f} ms\n".format((time.perf_counter() - start_time) * 1000))
+            sys.stdout.flush()
+        return change_num
+
+    def close(self):
+        for stat, ddrbin in self.bin_info.values():
+            if isinstance(ddrbin, ddrbin_lib.DdrBin):
+                ddrbin.close()
+
+
+def ddrbin_watch(argv, tool_option):
+    """./ddrbin_tool CHIP ddrbin_param.txt BIN... --watch [--poll_interval=MS]"""
+    opts, args = getopt.gnu_getopt(argv, ddrbin_lib.tool_short_option, ddrbin_lib.tool_long_option)
+    param_path = args[2]
+    path_list = list(dict.fromkeys(args[3:]))
+    for path in path_list:
+        if path == '-' or os.path.isfile(path) != True:
+            print("The file {} not exist".format(path))
+            return -1
+
+    watch = DdrBinWatch(args[1], param_path, path_list, tool_option)
+    try:
+        if watch.update() < 0:
+            return -1
+
+        inotify_fd = -1
+        if tool_option['poll_interval'] == 0:
+            inotify_fd = open_inotify([param_path] + path_list)
+        poll_interval = tool_option['poll_interval'] or watch_poll_interval
+        print("watch {} and {} bins by {}, Ctrl-C to stop".format(param_path, len(path_list),
+            'inotify' if inotify_fd >= 0 else 'polling every {} ms'.format(poll_interval)))
+        sys.stdout.flush()
+        try:
+            while True:
+                wait_watch_change(inotify_fd, poll_interval)
+                watch.update()
+        except KeyboardInterrupt:
+            print("stop watching")
+        finally:
+            if inotify_fd >= 0:
+                os.close(inotify_fd)
+    finally:
+        watch.close()
+
+    return 0
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+import io
+import os
+import re
+import sys
+import glob
+import json
+import time
+import struct
+import getopt
+import hashlib
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+import ddrbin_loader as loader_lib
+
+builder_version = 'v1.00 20241220'
+
+# the merger version in the head of the loaders of boot_merger
+merger_version = 0x01000000
+loader_head_size = 102
+loader_entry_size = 57
+# the entries are padded to 2048 bytes, or [SYSTEM] ALIGN sectors
+loader_align_size = 2048
+loader_sector_size = 512
+
+# the chip type of the old chips, the others are the 4 characters after 'RK' of the name
+chip_type_info = {
+    'RK27': 0x10,
+    'RKCAYMAN': 0x11,
+    'RK28': 0x20,
+    'RK281X': 0x21,
+    'RKPANDA': 0x22,
+    'RKNANO': 0x30,
+    'RKSMART': 0x31,
+    'RKCROWN': 0x40,
+    'RK29': 0x50,
+    'RK292X': 0x51,
+    'RK30': 0x60,
+    'RK30B': 0x61,
+    'RK31': 0x70,
+    'RK32': 0x80,
+}
+
+# the idblock head of [SYSTEM] NEWIDB, the BOOTn_PARAM words and the images of it
+idb_boot_param_offset = [48, 88]
+idb_boot_param_num = 10
+idb_head_flag = 0x180
+idb_image_max = 4
+
+# the classic idblock of CREATE_IDB: rc4 sector 0, sector 1, 2 sectors of zeros, FlashData, FlashBoot
+idb_sector0_tag = 0x0FF0AA55
+idb_sector1_tag = b'RK28'
+
+state_file_name = '.loader_builder.json'
+
+# {cache key: (data, crc, plain hash)} of the components built by this process
+component_cache = {}
+
+
+def read_ini_file(ini_path):
+    """return {section: {key: value}}, the keys keep the case of the ini"""
+    section_info = {}
+    section = None
+    try:
+        with open(ini_path, 'r', encoding='utf-8', errors='replace') as file:
+            lines = file.readlines()
+    except OSError:
+        print("The file {} read failed".format(ini_path))
+        return None
+
+    for line in lines:
+        line = line.strip()
+        if line == '' or line.startswith('#') or line.startswith(';'):
+            continue
+        match = re.match(r'^\[(.*)\]$', line)
+        if match:
+            section = section_info.setdefault(match.group(1).strip(), {})
+        elif '=' in line and section is not None:
+            key, value = line.split('=', 1)
+            section[key.strip()] = value.strip()
+
+    return section_info
+
+
+def parse_int(value):
+    """'0x3f00000' is hex and '07' is decimal, like strtoul of boot_merger"""
+    value = value.strip()
+    if value.lower().startswith('0x'):
+        return int(value, 16)
+    return int(value, 10)
+
+
+def get_chip_type(name):
+    if name in chip_type_info:
+        return chip_type_info[name]
+    return int.from_bytes(name[2:6].encode('ascii', errors='replace'), byteorder='big')
+
+
+def get_entry_name(path):
+    """the file name before the first '.', 20 utf-16 characters at most"""
+    return os.path.basename(path).split('.', 1)[0][:20]
+
+
+def read_recipe(ini_path):
+    """
+    return the recipe of a RKBOOT ini, like:
+    {'chip': 'RK3588', 'version': 0x10b, 'code471': [path, ...], 'sleep': 1, 'code472': [path, ...],
+     'loader': [(name, path), ...], 'loader_param': [(addr, flag), ...], 'boot_param': [[word, ...], ...],
+     'output': path, 'idb_output': path, 'flag': {...}, 'align': 2048}
+    return None if the ini is not valid, the paths are not checked.
+    """
+    ini = read_ini_file(ini_path)
+    if ini is None:
+        return None
+
+    try:
+        chip = ini.get('CHIP_NAME', {}).get('NAME', '')
+        if chip == '':
+            print("{}: chip is blank".format(ini_path))
+            return None
+        version_info = ini.get('VERSION', {})
+        version = (parse_int(version_info.get('MAJOR', '0')) << 8) | parse_int(version_info.get('MINOR', '0'))
+
+        recipe = {
+            'ini': ini_path,
+            'chip': chip,
+            'version': version & 0xffff,
+            'code471': [],
+            'sleep': 0,
+            'code472': [],
+            'loader': [],
+            'loader_param': [],
+            'boot_param': [],
+        }
+        for section, name in (('CODE471_OPTION', 'code471'), ('CODE472_OPTION', 'code472')):
+            option = ini.get(section, {})
+            for i in range(parse_int(option.get('NUM', '0'))):
+                recipe[name].append(option['Path{}'.format(i + 1)])
+        recipe['sleep'] = parse_int(ini.get('CODE471_OPTION', {}).get('Sleep', '0'))
+
+        option = ini.get('LOADER_OPTION', {})
+        for i in range(parse_int(option.get('NUM', '0'))):
+            name = option['LOADER{}'.format(i + 1)]
+            recipe['loader'].append((name, option[name]))
+            param = ini.get('LOADER{}_PARAM'.format(i + 1), {})
+            recipe['loader_param'].append((parse_int(param.get('LOAD_ADDR', '0xffffffff')),
+                parse_int(param.get('FLAG', '0'))))
+
+        for i in range(len(idb_boot_param_offset)):
+            param = ini.get('BOOT{}_PARAM'.format(i), {})
+            recipe['boot_param'].append([parse_int(param.get('WORD_{}'.format(n), '0'))
+                for n in range(idb_boot_param_num)])
+    except (KeyError, ValueError) as e:
+        print("{}: the option {} error".format(ini_path, e))
+        return None
+
+    output = ini.get('OUTPUT', {})
+    recipe['output'] = output.get('PATH', '')
+    if recipe['output'] == '':
+        print("{}: output is blank".format(ini_path))
+        return None
+
+    flag = ini.get('FLAG', {})
+    system = ini.get('SYSTEM', {})
+    recipe['flag'] = {
+        'rc4_off': flag.get('RC4_OFF', '').lower() == 'true',
+        '471_rc4_off': flag.get('471_RC4_OFF', '').lower() == 'true',
+        'create_idb': flag.get('CREATE_IDB', '').lower() == 'true',
+        'crc_off': flag.get('CRC_OFF', '').lower() == 'true',
+        'newidb': system.get('NEWIDB', '').lower() == 'true',
+    }
+    recipe['idb_output'] = output.get('IDB_PATH', 'idblock.img') if recipe['flag']['create_idb'] else ''
+    try:
+        align = parse_int(system.get('ALIGN', '0'))
+    except ValueError:
+        print("{}: the option ALIGN error".format(ini_path))
+        return None
+    recipe['align'] = align * loader_sector_size if align > 0 else loader_align_size
+
+    return recipe
+
+
+def get_recipe_input_list(recipe):
+    """the files used by the recipe, in the order of the entries"""
+    input_list = []
+    for path in recipe['code471'] + recipe['code472'] + [path for name, path in recipe['loader']]:
+        if path not in input_list:
+            input_list.append(path)
+    return input_list
+
+
+def get_file_hash(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def get_component(content, mode, align, cache):
+    """
+    return (data, crc, plain hash) of an entry: the content padded to align and scrambled
+    by mode, the rkcrc32 of data and the sha256 of the padded content for the idblock heads.
+    The components are cached by the hash of the content, the loaders which share a bin
+    only scramble and crc it once.
+    """
+    key_info = {
+        'builder': builder_version,
+        'content': hashlib.sha256(content).hexdigest(),
+        'mode': mode,
+        'align': align,
+    }
+    key = hashlib.sha256(json.dumps(key_info, sort_keys=True).encode('utf-8')).hexdigest()
+    if key in component_cache:
+        return component_cache[key]
+
+    if cache is not None:
+        cache_value = cache.get(key)
+        if cache_value is not None:
+            cache_info, data = cache_value
+            component = (data, cache_info['crc'], bytes.fromhex(cache_info['plain hash']))
+            component_cache[key] = component
+            return component
+
+    plain = content + bytes(-len(content) % align)
+    data = loader_lib.rc4_xor(plain, 0, mode)
+    component = (data, loader_lib.rkcrc32(data), hashlib.sha256(plain).digest())
+    if cache is not None:
+        cache.put(key, {'crc': component[1], 'plain hash': component[2].hex(), 'size': len(content)}, data)
+    component_cache[key] = component
+    return component
+
+
+def gen_idb_head(image_list, boot_param, align):
+    """
+    return the plain idblock head of [(size, addr, flag, plain hash), ...], it is one align long.
+    The images follow the head, the offsets and sizes are in sectors.
+    """
+    head = bytearray(align)
+    struct.pack_into('<4sIII', head, 0, loader_lib.idb_head_magic, 0,
+        (len(image_list) << 16) | idb_head_flag, 1)
+    for offset, words in zip(idb_boot_param_offset, boot_param):
+        struct.pack_into('<{}I'.format(len(words)), head, offset, *words)
+
+    sector = align // loader_sector_size
+    for i, (size, addr, flag, plain_hash) in enumerate(image_list):
+        offset = loader_lib.idb_image_offset + i * loader_lib.idb_image_size
+        struct.pack_into('<IIII', head, offset, ((size // loader_sector_size) << 16) | sector,
+            addr, flag, i + 1)
+        head[offset + loader_lib.idb_image_hash_offset : offset + loader_lib.idb_image_hash_offset
+            + len(plain_hash)] = plain_hash
+        sector += size // loader_sector_size
+    head[loader_lib.idb_head_hash_size : loader_lib.idb_head_hash_size + 32] = hashlib.sha256(
+        head[:loader_lib.idb_head_hash_size]).digest()
+
+    return bytes(head)
+
+
+def gen_head_component(head, mode):
+    data = loader_lib.rc4_xor(head, 0, mode)
+    return data, loader_lib.rkcrc32(data), hashlib.sha256(head).digest()
+
+
+def get_release_time():
+    """the local time, or $SOURCE_DATE_EPOCH in utc for the reproducible build"""
+    if 'SOURCE_DATE_EPOCH' in os.environ:
+        release_time = time.gmtime(int(os.environ['SOURCE_DATE_EPOCH']))
+    else:
+        release_time = time.localtime()
+    return struct.pack('<HBBBBB', release_time.tm_year, release_time.tm_mon, release_time.tm_mday,
+        release_time.tm_hour, release_time.tm_min, release_time.tm_sec)
+
+
+def gen_classic_idblock(flash_data, flash_boot):
+    """the idblock of CREATE_IDB without NEWIDB, flash_data and flash_boot are the scrambled components"""
+    sector0 = bytearray(loader_sector_size)
+    struct.pack_into('<I', sector0, 0, idb_sector0_tag)
+    struct.pack_into('<HH', sector0, 12, 4, 4)
+    data_sector = len(flash_data) // loader_sector_size
+    struct.pack_into('<HH', sector0, 506, data_sector, data_sector + len(flash_boot) // loader_sector_size)
+
+    sector1 = bytearray(loader_sector_size)
+    struct.pack_into('<HH', sector1, 0, 0x0C, 0xFFFF)
+    sector1[10:14] = idb_sector1_tag
+
+    return b''.join([loader_lib.rc4_xor(sector0, 0, 'block'), bytes(sector1),
+        loader_lib.rc4_xor(bytes(loader_sector_size * 2), 0, 'block'), flash_data, flash_boot])
+
+
+def read_recipe_input(recipe, root_dir):
+    """return {path: content} of the files used by the recipe, or None"""
+    content_info = {}
+    for path in get_recipe_input_list(recipe):
+        try:
+            with open(os.path.join(root_dir, path), 'rb') as file:
+                content_info[path] = file.read()
+        except OSError:
+            print("The file {} is not found".format(path))
+            return None
+    return content_info
+
+
+def build_loader(recipe, content_info, cache):
+    """return {output name: data} of the recipe, or None"""
+    flag = recipe['flag']
+    align = recipe['align']
+    code_mode = 'plain' if flag['471_rc4_off'] else 'stream'
+    # [(type, name, delay, component), ...]
+    entry_list = []
+    for path in recipe['code471']:
+        entry_list.append((1, get_entry_name(path), recipe['sleep'],
+            get_component(content_info[path], code_mode, align, cache)))
+    for path in recipe['code472']:
+        entry_list.append((2, get_entry_name(path), 0, get_component(content_info[path], code_mode, align, cache)))
+    loader_list = []
+    for (name, path), (addr, loader_flag) in zip(recipe['loader'], recipe['loader_param']):
+        component = get_component(content_info[path], 'block', align, cache)
+        loader_list.append((name, addr, loader_flag, component))
+        entry_list.append((4, name, 0, component))
+
+    output_info = {}
+    if flag['newidb']:
+        if len(loader_list) > idb_image_max or len(entry_list) - len(loader_list) > idb_image_max:
+            print("{}: the idblock head has {} images at most".format(recipe['ini'], idb_image_max))
+            return None
+        usb_image_list = [(len(component[0]), 0xffffffff, 0, component[2])
+            for entry_type, name, delay, component in entry_list if entry_type != 4]
+        flash_image_list = [(len(component[0]), addr, loader_flag, component[2])
+            for name, addr, loader_flag, component in loader_list]
+        usb_head = gen_idb_head(usb_image_list, recipe['boot_param'], align)
+        flash_head = gen_idb_head(flash_image_list, recipe['boot_param'], align)
+        entry_list.insert(0, (1, 'UsbHead', recipe['sleep'], gen_head_component(usb_head, 'plain')))
+        entry_list.insert(len(recipe['code471']) + len(recipe['code472']) + 1,
+            (4, 'FlashHead', 0, gen_head_component(flash_head, 'block')))
+        if flag['create_idb']:
+            output_info[recipe['idb_output']] = b''.join([flash_head] +
+                [content_info[path] + bytes(-len(content_info[path]) % align) for name, path in recipe['loader']])
+    elif flag['create_idb']:
+        loader_info = {name: component[0] for name, addr, loader_flag, component in loader_list}
+        if 'FlashData' not in loader_info or 'FlashBoot' not in loader_info:
+            print("{}: FlashData or FlashBoot is not found".format(recipe['ini']))
+            return None
+        output_info[recipe['idb_output']] = gen_classic_idblock(loader_info['FlashData'], loader_info['FlashBoot'])
+
+    num_list = [len([entry for entry in entry_list if entry[0] == entry_type]) for entry_type in (1, 2, 4)]
+    entry_offset = loader_head_size
+    offset_list = []
+    for num in num_list:
+        offset_list.append(entry_offset)
+        entry_offset += num * loader_entry_size
+    head = struct.pack(loader_lib.loader_head_format,
+        ddrbin_lib.loader_tag_list[1] if flag['newidb'] else ddrbin_lib.loader_tag_list[0],
+        loader_head_size, recipe['version'], merger_version, get_release_time(), get_chip_type(recipe['chip']),
+        num_list[0], offset_list[0], loader_entry_size, num_list[1], offset_list[1], loader_entry_size,
+        num_list[2], offset_list[2], loader_entry_size, 0, 1 if flag['rc4_off'] else 0)
+    # the reserved bytes begin with the flag of the idblock heads and CRC_OFF, the crc32 is still appended
+    head += bytes([1 if flag['newidb'] else 0, 1 if flag['crc_off'] else 0])
+    head += bytes(loader_head_size - len(head))
+
+    data_offset = entry_offset
+    entry_table = []
+    for entry_type, name, delay, component in entry_list:
+        entry_table.append(struct.pack(loader_lib.loader_entry_format, loader_entry_size, entry_type,
+            name.encode('utf-16-le')[:40], data_offset, len(component[0]), delay))
+        data_offset += len(component[0])
+
+    # the crc of the components are cached, they are shifted and combined
+    data_list = [head] + entry_table
+    crc = loader_lib.rkcrc32(b''.join(data_list))
+    for entry_type, name, delay, component in entry_list:
+        crc = loader_lib.rkcrc32_shift(crc, len(component[0])) ^ component[1]
+        data_list.append(component[0])
+    data_list.append(struct.pack('<I', crc))
+    output_info[recipe['output']] = b''.join(data_list)
+
+    return output_info
+
+
+def get_output_dir(output_dir, recipe, subdir):
+    if subdir:
+        return os.path.join(output_dir, os.path.splitext(os.path.basename(recipe['ini']))[0])
+    return output_dir
+
+
+def build_recipe_job(job_args):
+    """
+    build one recipe in the worker process, return (ret, message, seconds, input state, output state),
+    the state is {path: [size, mtime_ns, sha256]} of the inputs and {path: [size, mtime_ns]} of the outputs.
+    """
+    recipe, root_dir, output_dir, cache_dir, use_cache = job_args
+    output = io.StringIO()
+    start_time = time.perf_counter()
+    input_state = {}
+    output_state = {}
+    ret = -1
+    with contextlib.redirect_stdout(output):
+        try:
+            cache = ddrbin_lib.DdrBinCache(cache_dir) if use_cache else None
+            for path in get_recipe_input_list(recipe):
+                try:
+                    stat = os.stat(os.path.join(root_dir, path))
+                except OSError:
+                    continue
+                input_state[path] = [stat.st_size, stat.st_mtime_ns]
+            content_info = read_recipe_input(recipe, root_dir)
+            output_info = None
+            if content_info is not None:
+                for path, content in content_info.items():
+                    input_state[path].append(hashlib.sha256(content).hexdigest())
+                output_info = build_loader(recipe, content_info, cache)
+            if output_info is not None:
+                os.makedirs(output_dir, exist_ok=True)
+                for name, data in output_info.items():
+                    path = os.path.realpath(os.path.join(output_dir, name))
+                    ddrbin_lib.write_file_atomic(path, data)
+                    stat = os.stat(path)
+                    output_state[path] = [stat.st_size, stat.st_mtime_ns]
+                print(', '.join(output_info))
+                ret = 0
+        except Exception as e:
+            print("{}: {}".format(type(e).__name__, e))
+            ret = -1
+    elapsed = time.perf_counter() - start_time
+
+    lines = [line for line in output.getvalue().split('\n') if line.strip() != '']
+    return ret, lines[-1] if lines else '', elapsed, input_state, output_state
+
+
+def read_state_file(state_path):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        state = {}
+    if state.get('builder') != builder_version:
+        state = {'builder': builder_version, 'recipes': {}}
+    return state
+
+
+def is_recipe_up_to_date(recipe_state, ini_hash, root_dir, hash_cache):
+    """
+    The recipe is up to date if the ini and the inputs have the same sha256 as the last
+    build and the outputs are not changed. The sha256 of an input is only computed
+    when its size or mtime is changed, the new size and mtime are saved to the state.
+    """
+    if recipe_state is None or recipe_state['ini'] != ini_hash or recipe_state['root'] != root_dir:
+        return False
+
+    for path, (size, mtime_ns, file_hash) in recipe_state['inputs'].items():
+        full_path = os.path.join(root_dir, path)
+        try:
+            stat = os.stat(full_path)
+            if [stat.st_size, stat.st_mtime_ns] == [size, mtime_ns]:
+                continue
+            if full_path not in hash_cache:
+                hash_cache[full_path] = get_file_hash(full_path)
+        except OSError:
+            return False
+        if hash_cache[full_path] != file_hash:
+            return False
+        # only touched, it is not hashed again by the next build
+        recipe_state['inputs'][path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+
+    for path, (size, mtime_ns) in recipe_state['outputs'].items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if [stat.st_size, stat.st_mtime_ns] != [size, mtime_ns]:
+            return False
+
+    return True
+
+
+def gen_ini_list(pattern_list):
+    ini_list = []
+    for pattern in pattern_list:
+        path_list = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if len(path_list) == 0:
+            print("no file match {}".format(pattern))
+            return None
+        for path in path_list:
+            if path not in ini_list:
+                ini_list.append(path)
+    return ini_list
+
+
+def print_builder_help():
+    print(
+        "Build the loaders of RKBOOT/*.ini like boot_merger, in parallel and incrementally.\n"\
+        "usage: ./loader_builder.py [OPTION] INI...\n"\
+        "	INI can be a glob pattern, like 'RKBOOT/*.ini'\n"\
+        "	-j JOBS			The number of processes, default: the number of CPUs\n"\
+        "	-o DIR			The directory of the loaders, default: the current directory\n"\
+        "	--root=DIR		The directory of the bin paths in the ini, default: the current directory\n"\
+        "	--subdir		Put the loaders of every ini to DIR/<ini name>/\n"\
+        "	--force			Build the loaders which are up to date\n"\
+        "	--no_cache		Do not use the component cache\n"\
+        "	--cache_dir=DIR		The component cache, default: $DDRBIN_CACHE_DIR or ~/.cache/ddrbin_tool\n"\
+        "The ini, the bins and the loaders of the last build are saved to DIR/{}, only the\n"\
+        "loaders whose ini or bins are changed are built again. $SOURCE_DATE_EPOCH sets the release time.\n"\
+        .format(state_file_name)
+    )
+
+
+def loader_builder(argc, argv):
+    jobs = os.cpu_count() or 1
+    output_dir = '.'
+    root_dir = '.'
+    subdir = False
+    force = False
+    use_cache = True
+    cache_dir = ''
+
+    try:
+        opts, args = getopt.gnu_getopt(argv[1:], 'j:o:h', ['jobs=', 'root=', 'subdir', 'force', 'no_cache',
+            'cache_dir='])
+        for opt, arg in opts:
+            if opt in ('-j', '--jobs'):
+                jobs = max(1, int(arg))
+            elif opt == '-o':
+                output_dir = arg
+            elif opt == '--root':
+                root_dir = arg
+            elif opt == '--subdir':
+                subdir = True
+            elif opt == '--force':
+                force = True
+            elif opt == '--no_cache':
+                use_cache = False
+            elif opt == '--cache_dir':
+                cache_dir = arg
+            elif opt == '-h':
+                print_builder_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        print_builder_help()
+        return -1
+
+    if len(args) == 0:
+        print("The number of parameters error")
+        print_builder_help()
+        return -1
+
+    ini_list = gen_ini_list(args)
+    if ini_list is None:
+        return -1
+
+    root_dir = os.path.realpath(root_dir)
+    state_path = os.path.join(output_dir, state_file_name)
+    state = read_state_file(state_path)
+    hash_cache = {}
+    output_owner = {}
+    # [(ini path, status, message, seconds)], status: ok, fail or skip
+    result_list = []
+    job_list = []
+    job_index_list = []
+    start_time = time.perf_counter()
+    for ini_path in ini_list:
+        ini_key = os.path.realpath(ini_path)
+        message = io.StringIO()
+        with contextlib.redirect_stdout(message):
+            recipe = read_recipe(ini_path)
+        if recipe is None:
+            result_list.append([ini_path, 'fail', message.getvalue().strip().split('\n')[-1], 0])
+            continue
+
+        recipe_output_dir = get_output_dir(output_dir, recipe, subdir)
+        conflict = ''
+        for name in [recipe['output'], recipe['idb_output']]:
+            if name == '':
+                continue
+            path = os.path.realpath(os.path.join(recipe_output_dir, name))
+            if path in output_owner:
+                conflict = "{} is also built by {}, use --subdir".format(name, output_owner[path])
+            output_owner.setdefault(path, ini_path)
+        if conflict != '':
+            result_list.append([ini_path, 'fail', conflict, 0])
+            continue
+
+        ini_hash = get_file_hash(ini_path)
+        if not force and is_recipe_up_to_date(state['recipes'].get(ini_key), ini_hash, root_dir, hash_cache):
+            result_list.append([ini_path, 'skip', 'up to date', 0])
+            continue
+
+        state['recipes'].pop(ini_key, None)
+        job_index_list.append((len(result_list), ini_key, ini_hash))
+        job_list.append((recipe, root_dir, recipe_output_dir, cache_dir, use_cache))
+        result_list.append([ini_path, 'fail', '', 0])
+
+    if jobs == 1 or len(job_list) <= 1:
+        job_result_list = [build_recipe_job(job_args) for job_args in job_list]
+    else:
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(job_list))) as executor:
+            job_result_list = list(executor.map(build_recipe_job, job_list, chunksize=1))
+    elapsed = time.perf_counter() - start_time
+
+    for (index, ini_key, ini_hash), (ret, message, job_time, input_state, output_state) in zip(
+            job_index_list, job_result_list):
+        result_list[index][1:] = ['ok' if ret == 0 else 'fail', message, job_time]
+        if ret == 0:
+            state['recipes'][ini_key] = {
+                'ini': ini_hash,
+                'root': root_dir,
+                'inputs': input_state,
+                'outputs': output_state,
+            }
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        ddrbin_lib.write_file_atomic(state_path, json.dumps(state, indent=1, sort_keys=True).encode('utf-8'))
+    except OSError:
+        print("The file {} write failed".format(state_path))
+
+    fail_num = 0
+    print("{:>4}  {:<4}  {:>8}  {:<32}  {}".format('job', 'ret', 'time(ms)', 'ini', 'loader / message'))
+    for i, (ini_path, status, message, job_time) in enumerate(result_list):
+        if status == 'fail':
+            fail_num += 1
+        print("{:>4}  {:<4}  {:>8.1f}  {:<32}  {}".format(i, status, job_time * 1000,
+            os.path.basename(ini_path), message))
+    print("{} ini, {} built, {} up to date, {} fail, {} workers, {:.2f}s".format(len(result_list),
+        len([result for result in result_list if result[1] == 'ok']),
+        len([result for result in result_list if result[1] == 'skip']), fail_num,
+        1 if jobs == 1 else min(jobs, max(1, len(job_list))), elapsed))
+
+    return 0 if fail_num == 0 else -1
+
+
+if __name__ == '__main__':
+    if loader_builder(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import getopt
+import fnmatch
+
+import ddrbin_tool as ddrbin_lib
+import loader_builder as loader_lib
+import trust_builder as trust_lib
+
+index_version = 1
+index_file_name = '.rebuild_index.json'
+# the ini of boot_merger and trust_merger, relative to the root
+index_ini_dir_list = [('RKBOOT', 'loader'), ('RKTRUST', 'trust')]
+# the value of a key is a file if it has a '/' or one of the extensions, like 'bin/rk35/rk3588_bl31_v1.48.elf'
+index_file_ext_list = ['.bin', '.elf', '.img']
+# the keys and the sections of the outputs, the other files are the inputs
+index_output_key_list = ['OUTPUT']
+index_output_section_list = ['OUTPUT']
+
+
+def is_file_reference(value):
+    if value == '' or ' ' in value:
+        return False
+    return '/' in value or os.path.splitext(value)[1].lower() in index_file_ext_list
+
+
+def read_ini_reference(ini_path):
+    """
+    return (inputs, outputs) of an ini, every value like Path1=, FlashData=, FlashBoot=, PATH=,
+    TOSTA= and MCU=path,addr,flag is a reference, the values in [OUTPUT] are the outputs.
+    The keys before the first section are also read, like the ini which only has PATH=.
+    """
+    input_list = []
+    output_list = []
+    section = ''
+    with open(ini_path, 'r', encoding='utf-8', errors='replace') as file:
+        lines = file.readlines()
+    for line in lines:
+        line = line.strip()
+        if line == '' or line.startswith('#') or line.startswith(';'):
+            continue
+        match = re.match(r'^\[(.*)\]$', line)
+        if match:
+            section = match.group(1).strip()
+            continue
+        if '=' not in line:
+            continue
+        key, value = [item.strip() for item in line.split('=', 1)]
+        value = value.split(',', 1)[0].strip()
+        if not is_file_reference(value):
+            continue
+        value = os.path.normpath(value)
+        if section in index_output_section_list or key in index_output_key_list:
+            reference_list = output_list
+        else:
+            reference_list = input_list
+        if value not in reference_list:
+            reference_list.append(value)
+
+    return input_list, output_list
+
+
+def get_ini_kind(ini_dir_kind, ini_path):
+    """loader, trust, or tos for the RKTRUST ini which are not for trust_merger"""
+    if ini_dir_kind == 'trust':
+        ini = loader_lib.read_ini_file(ini_path) or {}
+        if 'BL31_OPTION' not in ini:
+            return 'tos'
+    return ini_dir_kind
+
+
+def update_index(index, root_dir):
+    """
+    parse the ini which are new or changed since the last update, remove the deleted ones,
+    return the number of the parsed and removed ini.
+    """
+    ini_info = index['ini']
+    found_list = []
+    update_num = 0
+    for ini_dir, kind in index_ini_dir_list:
+        try:
+            entry_list = sorted(os.scandir(os.path.join(root_dir, ini_dir)), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entry_list:
+            if not entry.name.endswith('.ini') or not entry.is_file():
+                continue
+            name = '{}/{}'.format(ini_dir, entry.name)
+            found_list.append(name)
+            stat = entry.stat()
+            info = ini_info.get(name)
+            if info is not None and [info['size'], info['mtime_ns']] == [stat.st_size, stat.st_mtime_ns]:
+                continue
+            try:
+                input_list, output_list = read_ini_reference(entry.path)
+            except OSError:
+                continue
+            ini_info[name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'kind': get_ini_kind(kind, entry.path),
+                'inputs': input_list,
+                'outputs': output_list,
+            }
+            update_num += 1
+
+    for name in [name for name in ini_info if name not in found_list]:
+        del ini_info[name]
+        update_num += 1
+
+    if update_num != 0 or 'reverse' not in index:
+        # file -> [ini, ...], the reverse of the inputs
+        reverse_info = {}
+        for name in sorted(ini_info):
+            for path in ini_info[name]['inputs']:
+                reverse_info.setdefault(path, []).append(name)
+        index['reverse'] = reverse_info
+
+    return update_num
+
+
+def load_index(index_path, root_dir):
+    """return the index of root_dir, it is updated and saved if any ini is changed"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        index = {}
+    if index.get('version') != index_version or index.get('root') != root_dir:
+        index = {'version': index_version, 'root': root_dir, 'ini': {}}
+
+    if update_index(index, root_dir) != 0 or not os.path.exists(index_path):
+        try:
+            ddrbin_lib.write_file_atomic(index_path, json.dumps(index, indent=1, sort_keys=True).encode('utf-8'))
+        except OSError:
+            print("The file {} write failed".format(index_path))
+    return index
+
+
+def get_index_path(path, root_dir):
+    """the path relative to the root like the references in the ini"""
+    path = os.path.realpath(path)
+    if path == root_dir or path.startswith(root_dir + os.sep):
+        return os.path.relpath(path, root_dir).replace(os.sep, '/')
+    return path
+
+
+def find_rebuild_list(index, root_dir, changed_list):
+    """
+    return ([ini, ...] to rebuild, {changed file: [ini, ...]}), a changed file can be a glob pattern
+    of the index paths, like 'bin/rk35/rk3588_*', or an ini itself.
+    """
+    reverse_info = index['reverse']
+    match_info = {}
+    for changed in changed_list:
+        if glob.has_magic(changed):
+            pattern = os.path.normpath(changed)
+            path_list = sorted(path for path in list(reverse_info) + list(index['ini'])
+                if fnmatch.fnmatch(path, pattern))
+        else:
+            path_list = [get_index_path(changed, root_dir)]
+        for path in path_list:
+            ini_list = list(reverse_info.get(path, []))
+            if path in index['ini']:
+                ini_list.append(path)
+            match_info[path] = ini_list
+
+    rebuild_list = sorted(set(ini for ini_list in match_info.values() for ini in ini_list))
+    return rebuild_list, match_info
+
+
+def run_builder(index, root_dir, rebuild_list, builder_args):
+    """build the ini of rebuild_list by loader_builder.py and trust_builder.py, return 0 if all are built"""
+    ret = 0
+    for kind, builder, name in (('loader', loader_lib.loader_builder, 'loader_builder.py'),
+            ('trust', trust_lib.trust_builder, 'trust_builder.py')):
+        ini_list = [os.path.join(root_dir, ini) for ini in rebuild_list if index['ini'][ini]['kind'] == kind]
+        if len(ini_list) == 0:
+            continue
+        argv = [name, '--root={}'.format(root_dir)] + builder_args + ini_list
+        print("{} {}".format(name, ' '.join(argv[1:])))
+        if builder(len(argv), argv) != 0:
+            ret = -1
+    return ret
+
+
+def print_index_help():
+    print(
+        "Find the RKBOOT and RKTRUST ini which use the changed files, and build them again.\n"\
+        "usage: ./rebuild_index.py [OPTION] [FILE...]\n"\
+        "	FILE is a changed file, an ini or a glob pattern like 'bin/rk35/rk3588_*', '-' reads them from stdin.\n"\
+        "	Without FILE, the number of the ini and the files in the index are shown.\n"\
+        "	--root=DIR		The directory with RKBOOT, RKTRUST and bin, default: the current directory\n"\
+        "	-i FILE			The index, default: DIR/{}\n"\
+        "	--format=txt|json	The format of the result, default: txt\n"\
+        "	--build			Build the ini which use the changed files\n"\
+        "	-o DIR, -j JOBS, --subdir, --force	Passed to loader_builder.py and trust_builder.py with --build\n"\
+        "The index is updated by the ini which are changed since the last run before every query.\n"\
+        .format(index_file_name)
+    )
+
+
+def rebuild_index(argc, argv):
+    root_dir = '.'
+    index_path = ''
+    output_format = 'txt'
+    build = False
+    builder_args = []
+
+    try:
+        opts, args = getopt.gnu_getopt(argv[1:], 'i:o:j:h', ['root=', 'format=', 'build', 'subdir', 'force'])
+        for opt, arg in opts:
+            if opt == '--root':
+                root_dir = arg
+            elif opt == '-i':
+                index_path = arg
+            elif opt == '--format':
+                output_format = arg
+            elif opt == '--build':
+                build = True
+            elif opt in ('-o', '-j'):
+                builder_args += [opt, arg]
+            elif opt in ('--subdir', '--force'):
+                builder_args.append(opt)
+            elif opt == '-h':
+                print_index_help()
+                return -1
+    except getopt.GetoptError:
+        print_index_help()
+        return -1
+
+    if output_format not in ('txt', 'json'):
+        print("The format {} error".format(output_format))
+        return -1
+
+    if args == ['-']:
+        args = [line.strip() for line in sys.stdin if line.strip() != '']
+
+    start_time = time.perf_counter()
+    root_dir = os.path.realpath(root_dir)
+    if index_path == '':
+        index_path = os.path.join(root_dir, index_file_name)
+    index = load_index(index_path, root_dir)
+    if len(args) == 0:
+        kind_list = [info['kind'] for info in index['ini'].values()]
+        print("{} ini ({} loader, {} trust, {} tos), {} files, {:.1f} ms".format(len(kind_list),
+            kind_list.count('loader'), kind_list.count('trust'), kind_list.count('tos'), len(index['reverse']),
+            (time.perf_counter() - start_time) * 1000))
+        return 0
+
+    rebuild_list, match_info = find_rebuild_list(index, root_dir, args)
+    elapsed = time.perf_counter() - start_time
+
+    if output_format == 'json':
+        print(json.dumps({
+            'changed': match_info,
+            'rebuild': [{'ini': ini, 'kind': index['ini'][ini]['kind'], 'outputs': index['ini'][ini]['outputs']}
+                for ini in rebuild_list],
+        }, indent=1))
+    else:
+        for path, ini_list in match_info.items():
+            print("{}: {}".format(path, ', '.join(ini_list) if ini_list else 'not used'))
+        print("{:<6}  {:<40}  {}".format('kind', 'ini', 'outputs'))
+        for ini in rebuild_list:
+            print("{:<6}  {:<40}  {}".format(index['ini'][ini]['kind'], ini, ', '.join(index['ini'][ini]['outputs'])))
+        print("{} changed, {} ini to rebuild, {:.1f} ms".format(len(match_info), len(rebuild_list), elapsed * 1000))
+
+    if build:
+        tos_list = [ini for ini in rebuild_list if index['ini'][ini]['kind'] == 'tos']
+        if len(tos_list) != 0:
+            print("{} are not built, they are not for trust_merger".format(', '.join(tos_list)))
+        return run_builder(index, root_dir, rebuild_list, builder_args)
+
+    return 0
+
+
+if __name__ == '__main__':
+    if rebuild_index(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+# run: python3 -m pytest -q tools, or python3 tools/test_ddrbin_tool.py
+import os
+import csv
+import sys
+import json
+import shutil
+import importlib.util
+import tempfile
+import unittest
+import subprocess
+
+tool_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, tool_dir)
+import ddrbin_tool
+bin_dir = os.path.join(tool_dir, '..', 'bin')
+tool_path = os.path.join(tool_dir, 'ddrbin_tool.py')
+builder_path = os.path.join(tool_dir, 'loader_builder.py')
+rk3588_bin_path = os.path.join(bin_dir, 'rk35', 'rk3588_ddr_lp4_2112MHz_lp5_2400MHz_v1.18.bin')
+# the gen_param.txt of some bins by the original ddrbin_tool.py v1.21 20241211
+gen_param_dir = os.path.join(tool_dir, 'testdata', 'gen_param')
+
+test_param = "uart baudrate=115200\nsr_idle=0x20\npd_idle=0x40\n"
+
+
+def run_tool(*args):
+    return subprocess.run([sys.executable, tool_path] + list(args), cwd=tool_dir,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+def build_loader(ini, out_dir):
+    """build the loader of RKBOOT/<ini>.ini to out_dir, return the path of the loader"""
+    subprocess.run([sys.executable, builder_path, '-j', '1', '-o', out_dir, '--no_cache',
+        os.path.join('RKBOOT', ini + '.ini')], cwd=os.path.join(tool_dir, '..'),
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True)
+    loader_list = [name for name in os.listdir(out_dir) if name.endswith('.bin')]
+    return os.path.join(out_dir, loader_list[0])
+
+
+def read_file(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class ToolTest(unittest.TestCase):
+    """a temp dir with ddrbin_param.txt and a copy of the rk3588 bin"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='ddrbin_test_')
+        self.param_path = os.path.join(self.temp_dir, 'ddrbin_param.txt')
+        with open(self.param_path, 'w') as file:
+            file.write(test_param)
+        self.bin_path = os.path.join(self.temp_dir, os.path.basename(rk3588_bin_path))
+        shutil.copyfile(rk3588_bin_path, self.bin_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+class LibraryTest(ToolTest):
+    """the DdrBin class is used without ddrbin_tool()"""
+
+    def test_get_set_save(self):
+        with ddrbin_tool.DdrBin('rk3588') as ddrbin:
+            self.assertEqual(ddrbin.open(self.bin_path), 0)
+            self.assertEqual(ddrbin.parse(), 0)
+            self.assertEqual(ddrbin.version, 5)
+            self.assertNotEqual(ddrbin.get('uart baudrate'), 115200)
+            with self.assertRaises(KeyError):
+                ddrbin.set('start tag', 0)
+            with self.assertRaises(ValueError):
+                ddrbin.set('sr_idle', ddrbin_tool.get_field_max('sr_idle') + 1)
+            ddrbin.set('uart baudrate', 115200)
+            self.assertEqual(ddrbin.get('uart baudrate'), 115200)
+            ddrbin.set_verinfo_stamp('hash')
+            self.assertEqual(ddrbin.save(), 0)
+
+        with ddrbin_tool.DdrBin('rk3588') as ddrbin:
+            self.assertEqual(ddrbin.open(self.bin_path, use_mmap=True), 0)
+            self.assertEqual(ddrbin.parse(), 0)
+            self.assertEqual(ddrbin.get('uart baudrate'), 115200)
+            self.assertEqual(ddrbin.get_info()['uart baudrate'], 115200)
+
+
+class PatchPlanTest(ToolTest):
+    """function 5, the bin patched by the plan is the same as by ddrbin_param.txt"""
+
+    def test_patch_plan(self):
+        plan_path = os.path.join(self.temp_dir, 'plan.json')
+        self.assertEqual(run_tool('compile', self.param_path, plan_path).returncode, 0)
+        output_list = []
+        for param_path in (self.param_path, plan_path):
+            output_path = os.path.join(self.temp_dir, os.path.basename(param_path) + '.bin')
+            result = run_tool('rk3588', param_path, self.bin_path, '--output=' + output_path,
+                '--verinfo_stamp=hash')
+            self.assertEqual(result.returncode, 0, result.stdout.decode())
+            output_list.append(read_file(output_path))
+        self.assertEqual(output_list[0], output_list[1])
+        self.assertNotEqual(output_list[0], read_file(self.bin_path))
+
+    def test_parse_param_line_max(self):
+        field_max = ddrbin_tool.get_field_max('sr_idle')
+        self.assertEqual(ddrbin_tool.parse_param_line('sr_idle={}'.format(field_max)), ('sr_idle', field_max))
+        self.assertEqual(ddrbin_tool.parse_param_line('sr_idle='), ('sr_idle', None))
+        with self.assertRaises(ValueError):
+            ddrbin_tool.parse_param_line('sr_idle={}'.format(hex(field_max + 1)))
+        with self.assertRaises(ValueError):
+            ddrbin_tool.parse_param_line('no_such_item=1')
+
+
+class SkipWriteTest(ToolTest):
+    """the bin is not written again if the parameters are already in it"""
+
+    def test_skip_write(self):
+        result = run_tool('rk3588', self.param_path, self.bin_path, '--verinfo_stamp=hash')
+        self.assertEqual(result.returncode, 0, result.stdout.decode())
+        self.assertNotIn(b"skip the write back", result.stdout)
+        content = read_file(self.bin_path)
+        stat = os.stat(self.bin_path)
+
+        result = run_tool('rk3588', self.param_path, self.bin_path, '--verinfo_stamp=hash')
+        self.assertIn(b"skip the write back", result.stdout, result.stdout.decode())
+        self.assertEqual(read_file(self.bin_path), content)
+        # the bin is not replaced by a temporary file
+        self.assertEqual(os.stat(self.bin_path).st_ino, stat.st_ino)
+        self.assertEqual(os.stat(self.bin_path).st_mtime_ns, stat.st_mtime_ns)
+
+
+class CacheTest(ToolTest):
+    """function 4, the first run is a miss, the same run again is a hit with the same output"""
+
+    def test_cache_hit_miss(self):
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+        cache = ddrbin_tool.DdrBinCache(cache_dir)
+        gen_list = []
+        for hit, miss in ((0, 1), (1, 1)):
+            gen_path = os.path.join(self.temp_dir, 'gen_param_{}.txt'.format(hit))
+            result = run_tool('rk3588', '-g', gen_path, self.bin_path, '--cache', '--cache_dir=' + cache_dir)
+            self.assertEqual(result.returncode, 0, result.stdout.decode())
+            stats = cache.get_stats()
+            self.assertEqual((stats['hit'], stats['miss']), (hit, miss))
+            gen_list.append(read_file(gen_path))
+        self.assertEqual(gen_list[0], gen_list[1])
+        self.assertEqual(len(cache.get_entry_list()), 1)
+
+        # the bin is changed, it is a miss
+        result = run_tool('rk3588', self.param_path, self.bin_path, '--verinfo_stamp=hash')
+        self.assertEqual(result.returncode, 0, result.stdout.decode())
+        result = run_tool('rk3588', '-g', gen_path, self.bin_path, '--cache', '--cache_dir=' + cache_dir)
+        self.assertEqual(result.returncode, 0, result.stdout.decode())
+        self.assertEqual(cache.get_stats()['miss'], 2)
+        self.assertNotEqual(read_file(gen_path), gen_list[0])
+
+
+class JsonFormatTest(ToolTest):
+    """-g --format=json|jsonl, every field has its value at the offset of the bin"""
+
+    def gen_param(self, gen_format):
+        gen_path = os.path.join(self.temp_dir, 'gen_param.' + gen_format)
+        result = run_tool('rk3588', '-g', gen_path, self.bin_path, '--format=' + gen_format)
+        self.assertEqual(result.returncode, 0, result.stdout.decode())
+        return read_file(gen_path).decode('utf-8')
+
+    def test_json_jsonl(self):
+        head_info = json.loads(self.gen_param('json'))
+        line_list = [json.loads(line) for line in self.gen_param('jsonl').splitlines()]
+        self.assertEqual(line_list[0], {key: value for key, value in head_info.items() if key != 'fields'})
+        self.assertEqual(line_list[1:], head_info['fields'])
+        self.assertEqual((head_info['chip'], head_info['version']), ('rk3588', 5))
+
+        content = read_file(self.bin_path)
+        field_num = 0
+        for field_info in head_info['fields']:
+            if field_info['offset'] is None:
+                continue
+            word = int.from_bytes(content[field_info['offset'] : field_info['offset'] + 4], 'little')
+            self.assertEqual(word, field_info['word'], field_info['name'])
+            self.assertEqual((word >> field_info['shift']) & field_info['mask'], field_info['value'],
+                field_info['name'])
+            field_num += 1
+        self.assertGreater(field_num, 0)
+
+
+class GenParamTest(unittest.TestCase):
+    """function 2 gets the same gen_param.txt as the baseline tool"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='ddrbin_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check_gen_param(self, chip, bin_path):
+        name = os.path.basename(bin_path)
+        expect = read_file(os.path.join(gen_param_dir, name + '.txt'))
+        for extra_args in ([], ['--mmap']):
+            gen_path = os.path.join(self.temp_dir, name + '.txt')
+            result = run_tool(chip, '-g', gen_path, os.path.join(bin_dir, bin_path), *extra_args)
+            self.assertEqual(result.returncode, 0, result.stdout.decode())
+            self.assertEqual(read_file(gen_path), expect, name)
+
+    def test_gen_param_version_0(self):
+        self.check_gen_param('px3se', os.path.join('rk31', 'px3se_ddr_300MHz_v2.09_uart1.bin'))
+
+    def test_gen_param_version_2(self):
+        self.check_gen_param('rk3308', os.path.join('rk33', 'rk3308_ddr_393MHz_uart2_m1_v2.10.bin'))
+
+    def test_gen_param_version_5(self):
+        self.check_gen_param('rk3588', os.path.join('rk35', 'rk3588_ddr_lp4_2112MHz_lp5_2400MHz_v1.18.bin'))
+
+    def test_gen_param_skew(self):
+        # rk3528 has the skew_info after the header
+        self.check_gen_param('rk3528', os.path.join('rk35', 'rk3528_ddr_1056MHz_v1.10.bin'))
+
+
+class OutputTest(ToolTest):
+    """--output writes the modified bin to FILE without touching the input"""
+
+    def check_output(self, chip, bin_path, extra_args):
+        filebin_path = os.path.join(self.temp_dir, os.path.basename(bin_path))
+        output_path = filebin_path + '.out'
+        shutil.copyfile(bin_path, filebin_path)
+        content = read_file(filebin_path)
+
+        result = run_tool(chip, self.param_path, filebin_path, '--output=' + output_path,
+            '--verinfo_stamp=hash', *extra_args)
+        self.assertIn(b"modify end", result.stdout, result.stdout.decode())
+        self.assertEqual(read_file(filebin_path), content)
+        output = read_file(output_path)
+        self.assertEqual(len(output), len(content))
+        self.assertNotEqual(output, content)
+        return output
+
+    def test_bin_output(self):
+        output = self.check_output('rk3588', rk3588_bin_path, [])
+        # the same bin is written with or without --mmap
+        self.assertEqual(self.check_output('rk3588', rk3588_bin_path, ['--mmap']), output)
+
+    def test_loader_output(self):
+        loader_path = build_loader('RK3588MINIALL', os.path.join(self.temp_dir, 'loader'))
+        output = self.check_output('rk3588', loader_path, [])
+        self.assertEqual(self.check_output('rk3588', loader_path, ['--mmap']), output)
+
+    def test_loader_version_old(self):
+        # rk3328 keeps the frequency words of the old bins, a renamed loader is patched the same
+        with open(self.param_path, 'a') as file:
+            file.write("ddr2_freq=800\nlp2_freq=800\nddr3_freq=800\n")
+        loader_path = build_loader('RK3328MINIALL', os.path.join(self.temp_dir, 'loader'))
+        rename_path = os.path.join(self.temp_dir, 'loader', 'loader.bin')
+        shutil.copyfile(loader_path, rename_path)
+        self.assertEqual(self.check_output('rk3328', rename_path, []),
+            self.check_output('rk3328', loader_path, []))
+
+
+class ExportTest(unittest.TestCase):
+    """function 7, npz and npy have the same columns and values as csv"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='ddrbin_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def export(self, name):
+        output_path = os.path.join(self.temp_dir, name)
+        result = run_tool('export', output_path, os.path.join(bin_dir, 'rk35'))
+        self.assertEqual(result.returncode, 0, result.stdout.decode())
+        return output_path
+
+    def read_csv_columns(self):
+        with open(self.export('fleet.csv'), newline='', encoding='utf-8') as file:
+            row_list = list(csv.reader(file))
+        self.assertGreater(len(row_list), 1)
+        return {name: [row[index] for row in row_list[1:]] for index, name in enumerate(row_list[0])}
+
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, "numpy is not installed")
+    def test_export_numpy(self):
+        import numpy as np
+
+        csv_columns = self.read_csv_columns()
+        with np.load(self.export('fleet.npz')) as npz:
+            npz_columns = {name: npz[name] for name in npz.files}
+        # like the user guide, the header of the structured array is large
+        table = np.load(self.export('fleet.npy'), max_header_size=1 << 20)
+        self.assertEqual(list(table.dtype.names), list(csv_columns))
+        self.assertEqual(sorted(npz_columns), sorted(csv_columns))
+        for name, value_list in csv_columns.items():
+            self.assertEqual([str(value) for value in table[name].tolist()], value_list, name)
+            self.assertEqual([str(value) for value in npz_columns[name].tolist()], value_list, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*-coding=utf-8-*-
+#
+# Copyright (C) 2024, Rockchip Electronics Co., Ltd.
+#
+
+import io
+import os
+import sys
+import mmap
+import time
+import struct
+import getopt
+import hashlib
+import contextlib
+
+import ddrbin_tool as ddrbin_lib
+import loader_builder as loader_lib
+
+# struct TRUST_HEADER: tag, version, flags, size, 4 reserved words, RSA_N, RSA_E, RSA_C
+trust_head_tag = b'BL3X'
+trust_head_format = '<4sIII'
+trust_head_size = 2048
+trust_rsa_size = 256
+trust_component_data_offset = 32 + trust_rsa_size * 3
+# struct COMPONENT_DATA: sha256 of the padded image, load addr, load size in sectors, 2 reserved words
+trust_component_data_format = '<32sII8x'
+# the signature follows the component data, then struct TRUST_COMPONENT: id, storage sector, sectors
+trust_signature_size = 256
+trust_component_format = '<4sII4x'
+trust_align_size = 2048
+trust_sector_size = 512
+# sha mode 3 (sha256 little endian) and rsa mode 2 (2048) of trust_merger, the images are not signed
+trust_flags = 0x23
+# 2048K every image and 2 copies, like trust_merger without --size
+trust_image_size = 2048
+trust_image_copies = 2
+
+trust_bl3x_list = [('BL30_OPTION', b'BL30'), ('BL31_OPTION', b'BL31'), ('BL32_OPTION', b'BL32'),
+    ('BL33_OPTION', b'BL33')]
+
+elf_magic = b'\x7fELF'
+elf_pt_load = 1
+
+# {path: (mmap, [(addr, memoryview, sha256 of the padded segment, padded size), ...])}
+# the files are mapped once, the workers forked after the preload share the mappings
+trust_input_cache = {}
+
+
+def get_bcd(value):
+    """12 -> 0x12, like getBCD of trust_merger"""
+    bcd = 0
+    for i in range(4):
+        bcd |= (value % 10) << (i * 4)
+        value //= 10
+    return bcd
+
+
+def read_trust_recipe(ini_path, ignore_bl32=False):
+    """
+    return the recipe of a RKTRUST ini, like:
+    {'ini': path, 'version': 0x100, 'component': [(b'BL31', path, addr), ...], 'output': 'trust.img'}
+    return None if it is not a trust_merger ini, like the TOS ini of the 32-bit chips.
+    """
+    ini = loader_lib.read_ini_file(ini_path)
+    if ini is None:
+        return None
+    if 'BL31_OPTION' not in ini:
+        print("{}: BL31_OPTION is not found, it is not for trust_merger".format(ini_path))
+        return None
+
+    recipe = {'ini': ini_path, 'component': []}
+    try:
+        version_info = ini.get('VERSION', {})
+        recipe['version'] = ((get_bcd(loader_lib.parse_int(version_info.get('MAJOR', '0'))) << 8)
+            | get_bcd(loader_lib.parse_int(version_info.get('MINOR', '0')))) & 0xffffffff
+        for section, component_id in trust_bl3x_list:
+            option = ini.get(section, {})
+            if loader_lib.parse_int(option.get('SEC', '0')) == 0:
+                continue
+            if component_id == b'BL32' and ignore_bl32:
+                continue
+            recipe['component'].append((component_id, option['PATH'],
+                loader_lib.parse_int(option.get('ADDR', '0'))))
+    except (KeyError, ValueError) as e:
+        print("{}: the option {} error".format(ini_path, e))
+        return None
+
+    recipe['output'] = ini.get('OUTPUT', {}).get('PATH', '')
+    if recipe['output'] == '':
+        print("{}: output is blank".format(ini_path))
+        return None
+
+    return recipe
+
+
+def get_elf_segment_list(content):
+    """return [(paddr, offset, filesz), ...] of the PT_LOAD segments with data, or None if it is not an elf"""
+    if content[:4] != elf_magic:
+        return None
+    endian = '<' if content[5] == 1 else '>'
+    if content[4] == 2:
+        phoff, = struct.unpack_from(endian + 'Q', content, 0x20)
+        phentsize, phnum = struct.unpack_from(endian + 'HH', content, 0x36)
+        # p_type, p_flags, p_offset, p_vaddr, p_paddr, p_filesz
+        phdr_format = endian + 'IIQQQQ'
+        field_list = (0, 2, 4, 5)
+    else:
+        phoff, = struct.unpack_from(endian + 'I', content, 0x1c)
+        phentsize, phnum = struct.unpack_from(endian + 'HH', content, 0x2a)
+        # p_type, p_offset, p_vaddr, p_paddr, p_filesz
+        phdr_format = endian + 'IIIII'
+        field_list = (0, 1, 3, 4)
+
+    segment_list = []
+    for i in range(phnum):
+        phdr = struct.unpack_from(phdr_format, content, phoff + i * phentsize)
+        p_type, p_offset, p_paddr, p_filesz = [phdr[index] for index in field_list]
+        if p_type != elf_pt_load or p_filesz == 0:
+            continue
+        if p_offset + p_filesz > len(content):
+            raise struct.error('segment {} is out of the file'.format(i))
+        segment_list.append((p_paddr, p_offset, p_filesz))
+    return segment_list
+
+
+def get_trust_input(path, addr):
+    """
+    return [(addr, memoryview, sha256, padded size), ...] of a bin or the PT_LOAD segments of an elf,
+    the file is mapped and parsed once, the segments are views of the mapping.
+    """
+    if path not in trust_input_cache:
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                content = b''
+            else:
+                content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(content)
+        segment_list = get_elf_segment_list(content)
+        if segment_list is None:
+            # a bin is one component at ADDR of the ini, the addr is filled by the caller
+            segment_list = [(None, 0, len(content))]
+
+        input_list = []
+        for segment_addr, offset, size in segment_list:
+            data = view[offset : offset + size]
+            padding = bytes(-size % trust_align_size)
+            digest = hashlib.sha256(data)
+            digest.update(padding)
+            input_list.append((segment_addr, data, digest.digest(), size + len(padding)))
+        trust_input_cache[path] = (content, input_list)
+
+    return [(addr if segment_addr is None else segment_addr, data, digest, size)
+        for segment_addr, data, digest, size in trust_input_cache[path][1]]
+
+
+def build_trust(recipe, root_dir, image_size, copies):
+    """return the trust image of the recipe, or None"""
+    component_list = []
+    for component_id, path, addr in recipe['component']:
+        try:
+            input_list = get_trust_input(os.path.join(root_dir, path), addr)
+        except OSError:
+            print("The file {} is not found".format(path))
+            return None
+        except (struct.error, ValueError) as e:
+            print("The file {} is not a valid elf: {}".format(path, e))
+            return None
+        component_list += [(component_id,) + component for component in input_list]
+
+    num = len(component_list)
+    component_offset = trust_component_data_offset + num * struct.calcsize(trust_component_data_format)
+    if component_offset + trust_signature_size + num * struct.calcsize(trust_component_format) > trust_head_size:
+        print("{}: too many components".format(recipe['ini']))
+        return None
+
+    image = bytearray(image_size)
+    struct.pack_into(trust_head_format, image, 0, trust_head_tag, recipe['version'], trust_flags,
+        (num << 16) | (component_offset >> 2))
+    offset = trust_head_size
+    for i, (component_id, addr, data, digest, size) in enumerate(component_list):
+        if offset + size > image_size:
+            print("{}: the trust image is larger than {}K".format(recipe['ini'], image_size >> 10))
+            return None
+        struct.pack_into(trust_component_data_format, image,
+            trust_component_data_offset + i * struct.calcsize(trust_component_data_format),
+            digest, addr, size // trust_sector_size)
+        struct.pack_into(trust_component_format, image,
+            component_offset + trust_signature_size + i * struct.calcsize(trust_component_format),
+            component_id, offset // trust_sector_size, size // trust_sector_size)
+        image[offset : offset + len(data)] = data
+        offset += size
+
+    return bytes(image) * copies
+
+
+def build_trust_job(job_args):
+    """build one recipe in the worker process, return (ret, message, seconds)"""
+    recipe, root_dir, output_dir, image_size, copies = job_args
+    output = io.StringIO()
+    start_time = time.perf_counter()
+    ret = -1
+    with contextlib.redirect_stdout(output):
+        try:
+            data = build_trust(recipe, root_dir, image_size, copies)
+            if data is not None:
+                os.makedirs(output_dir, exist_ok=True)
+                ddrbin_lib.write_file_atomic(os.path.join(output_dir, recipe['output']), data)
+                print(recipe['output'])
+                ret = 0
+        except Exception as e:
+            print("{}: {}".format(type(e).__name__, e))
+            ret = -1
+    elapsed = time.perf_counter() - start_time
+
+    lines = [line for line in output.getvalue().split('\n') if line.strip() != '']
+    return ret, lines[-1] if lines else '', elapsed
+
+
+def preload_trust_input(recipe_list, root_dir):
+    """map every file of the recipes once before the workers are forked"""
+    for recipe in recipe_list:
+        for component_id, path, addr in recipe['component']:
+            try:
+                get_trust_input(os.path.join(root_dir, path), addr)
+            except (OSError, struct.error, ValueError):
+                # it is reported by the job of the recipe
+                pass
+
+
+def print_trust_builder_help():
+    print(
+        "Build the trust images of RKTRUST/*.ini like trust_merger, in parallel.\n"\
+        "usage: ./trust_builder.py [OPTION] INI...\n"\
+        "	INI can be a glob pattern, like 'RKTRUST/*TRUST*.ini'\n"\
+        "	-j JOBS			The number of processes, default: the number of CPUs\n"\
+        "	-o DIR			The directory of the trust images, default: the current directory\n"\
+        "	--root=DIR		The directory of the bin paths in the ini, default: the current directory\n"\
+        "	--subdir		Put the trust image of every ini to DIR/<ini name>/\n"\
+        "	--size=KB		The size of every copy, 64K aligned, default: {}\n"\
+        "	--copies=N		The number of copies, default: {}\n"\
+        "	--ignore_bl32		Do not pack BL32\n"\
+        "Every elf and bin is mapped once and shared by all the ini, the PT_LOAD segments of\n"\
+        "BL31 are packed as the components, a bin is one component at ADDR of the ini.\n"\
+        .format(trust_image_size, trust_image_copies)
+    )
+
+
+def trust_builder(argc, argv):
+    jobs = os.cpu_count() or 1
+    output_dir = '.'
+    root_dir = '.'
+    subdir = False
+    image_size = trust_image_size
+    copies = trust_image_copies
+    ignore_bl32 = False
+
+    try:
+        opts, args = getopt.gnu_getopt(argv[1:], 'j:o:h', ['jobs=', 'root=', 'subdir', 'size=', 'copies=',
+            'ignore_bl32'])
+        for opt, arg in opts:
+            if opt in ('-j', '--jobs'):
+                jobs = max(1, int(arg))
+            elif opt == '-o':
+                output_dir = arg
+            elif opt == '--root':
+                root_dir = arg
+            elif opt == '--subdir':
+                subdir = True
+            elif opt == '--size':
+                image_size = int(arg)
+            elif opt == '--copies':
+                copies = max(1, int(arg))
+            elif opt == '--ignore_bl32':
+                ignore_bl32 = True
+            elif opt == '-h':
+                print_trust_builder_help()
+                return -1
+    except (getopt.GetoptError, ValueError):
+        print_trust_builder_help()
+        return -1
+
+    if len(args) == 0 or image_size <= 0 or image_size % 64 != 0:
+        print("The parameters error")
+        print_trust_builder_help()
+        return -1
+
+    ini_list = loader_lib.gen_ini_list(args)
+    if ini_list is None:
+        return -1
+
+    start_time = time.perf_counter()
+    output_owner = {}
+    # [(ini path, status, message, seconds)]
+    result_list = []
+    job_list = []
+    job_index_list = []
+    for ini_path in ini_list:
+        message = io.StringIO()
+        with contextlib.redirect_stdout(message):
+            recipe = read_trust_recipe(ini_path, ignore_bl32)
+        if recipe is None:
+            result_list.append([ini_path, 'fail', message.getvalue().strip().split('\n')[-1], 0])
+            continue
+
+        recipe_output_dir = loader_lib.get_output_dir(output_dir, recipe, subdir)
+        path = os.path.realpath(os.path.join(recipe_output_dir, recipe['output']))
+        if path in output_owner:
+            result_list.append([ini_path, 'fail', "{} is also built by {}, use --subdir".format(
+                recipe['output'], output_owner[path]), 0])
+            continue
+        output_owner[path] = ini_path
+
+        job_index_list.append(len(result_list))
+        job_list.append((recipe, root_dir, recipe_output_dir, image_size << 10, copies))
+        result_list.append([ini_path, 'fail', '', 0])
+
+    preload_trust_input([job_args[0] for job_args in job_list], root_dir)
+    if jobs == 1 or len(job_list) <= 1:
+        job_result_list = [build_trust_job(job_args) for job_args in job_list]
+    else:
+        import multiprocessing
+        import concurrent.futures
+        # the forked workers share the mapped files of the preload, the others map them again
+        mp_context = None
+        if 'fork' in multiprocessing.get_all_start_methods() and sys.platform.startswith('linux'):
+            mp_context = multiprocessing.get_context('fork')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(job_list)),
+                mp_context=mp_context) as executor:
+            job_result_list = list(executor.map(build_trust_job, job_list, chunksize=1))
+    elapsed = time.perf_counter() - start_time
+
+    for index, (ret, message, job_time) in zip(job_index_list, job_result_list):
+        result_list[index][1:] = ['ok' if ret == 0 else 'fail', message, job_time]
+
+    fail_num = 0
+    print("{:>4}  {:<4}  {:>8}  {:<32}  {}".format('job', 'ret', 'time(ms)', 'ini', 'trust image / message'))
+    for i, (ini_path, status, message, job_time) in enumerate(result_list):
+        if status == 'fail':
+            fail_num += 1
+        print("{:>4}  {:<4}  {:>8.1f}  {:<32}  {}".format(i, status, job_time * 1000,
+            os.path.basename(ini_path), message))
+    print("{} ini, {} built, {} fail, {} files mapped, {} workers, {:.2f}s".format(len(result_list),
+        len(result_list) - fail_num, fail_num, len(trust_input_cache),
+        1 if jobs == 1 else min(jobs, max(1, len(job_list))), elapsed))
+
+    return 0 if fail_num == 0 else -1
+
+
+if __name__ == '__main__':
+    if trust_builder(len(sys.argv), sys.argv) != 0:
+        sys.exit(1)